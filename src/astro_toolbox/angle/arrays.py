@@ -0,0 +1,207 @@
+"""
+This module contains AngleArray class.
+"""
+import numpy as np
+
+from astro_toolbox.angle.degrees import AngleDeg
+from astro_toolbox.angle.radians import AngleRad
+from astro_toolbox.utils.strparser import batch_angle_parser
+
+DMS_DTYPE = np.dtype([('sign', 'i1'), ('d', 'i4'), ('m', 'i4'), ('s', 'f8')])
+HMS_DTYPE = np.dtype([('sign', 'i1'), ('h', 'i4'), ('m', 'i4'), ('s', 'f8')])
+
+class AngleArray():
+    """AngleArray define an array of angles with its vectorized conversions.
+
+    Values are held in one contiguous float64 buffer, in degrees or in radians
+    depending on the unit the array was built from. Conversions follow the
+    same arithmetic as the scalar classes so that results are identical to
+    `AngleDeg`, `AngleRad`, `AngleDMS` and `AngleHMS` ones.
+
+    Attributes
+    ----------
+    anglevalue : numpy.ndarray
+        The angle values as float64 array.
+    unit : str
+        The buffer unit, ``'deg'`` or ``'rad'``.
+    """
+    def __init__(self, anglevalue, unit: str = 'deg'):
+        """Constructor method
+
+        Parameters
+        ----------
+        anglevalue : array_like
+            The angle values. Floats for ``'deg'`` and ``'rad'`` units,
+            structured array (`DMS_DTYPE` or `HMS_DTYPE`), array of
+            ``(dd, mm, ss)`` rows or sequence of str (``dd:dd:dd.dd``, ``dd°dd'dd.dd"``
+            or ``ddhddmdd.dds``) for ``'dms'`` and ``'hms'`` units.
+        unit : str, optional
+            Input unit in ``'deg'``, ``'rad'``, ``'dms'`` or ``'hms'``, by default 'deg'.
+
+        Raises
+        ------
+        ValueError
+            Unknown unit or unparsable str values.
+        """
+        if unit in ('deg', 'rad'):
+            self.anglevalue = np.ascontiguousarray(anglevalue, dtype=np.float64)
+            self.unit = unit
+        elif unit == 'dms':
+            sign, first, minutes, seconds = self._split_sexagesimal(anglevalue, 'd')
+            self.anglevalue = np.ascontiguousarray(sign * (first + minutes/60 + seconds/3600))
+            self.unit = 'deg'
+        elif unit == 'hms':
+            sign, first, minutes, seconds = self._split_sexagesimal(anglevalue, 'h')
+            self.anglevalue = np.ascontiguousarray(sign * ((first + minutes/60 +
+                                                            seconds/3600)*180/12))
+            self.unit = 'deg'
+        else:
+            raise ValueError(f"Unknown unit {unit}")
+
+    def __repr__(self):
+        """Representative method.
+
+        Returns
+        -------
+        str
+            Return a class representative string.
+        """
+        return f'AngleArray({self.anglevalue}, unit={self.unit!r})'
+
+    def __len__(self):
+        """Length method.
+
+        Returns
+        -------
+        int
+            Number of angles.
+        """
+        return len(self.anglevalue)
+
+    def __getitem__(self, index):
+        """Indexing method.
+
+        Parameters
+        ----------
+        index : int | slice | array_like
+            Index, slice or mask.
+
+        Returns
+        -------
+        AngleDeg | AngleRad | AngleArray
+            Scalar angle for an integer index, AngleArray otherwise.
+        """
+        value = self.anglevalue[index]
+        if np.ndim(value) == 0:
+            if self.unit == 'rad':
+                return AngleRad(float(value))
+            return AngleDeg(float(value))
+        return AngleArray(value, unit=self.unit)
+
+    @staticmethod
+    def _split_sexagesimal(anglevalue, first_field: str):
+        """Sexagesimal fields extraction method.
+
+        Parameters
+        ----------
+        anglevalue : array_like
+            Structured array, array of ``(dd, mm, ss)`` rows or sequence of str.
+        first_field : str
+            First field name in the structured array (``'d'`` or ``'h'``).
+
+        Returns
+        -------
+        tuple
+            Tuple of float64 arrays (sign, first field, minutes, seconds).
+
+        Raises
+        ------
+        ValueError
+            Unparsable str values.
+        """
+        if not isinstance(anglevalue, np.ndarray) or anglevalue.dtype.kind in 'USO':
+            anglevalue = np.asarray(anglevalue, dtype=object)
+            if anglevalue.size and isinstance(anglevalue.flat[0], str):
+                anglevalue, errors = batch_angle_parser(anglevalue.ravel())
+                if errors:
+                    raise ValueError("Unparsable angles at rows " +
+                                     ', '.join(f'{row} ({message})'
+                                               for row, message in list(errors.items())[:10]))
+                if anglevalue.shape[1] == 1:
+                    anglevalue = np.pad(anglevalue, ((0, 0), (0, 2)))
+        if isinstance(anglevalue, np.ndarray) and anglevalue.dtype.names is not None:
+            first = np.asarray(anglevalue[first_field], dtype=np.float64)
+            sign = np.asarray(anglevalue['sign'], dtype=np.float64)
+            return (sign, np.abs(first),
+                    np.asarray(anglevalue['m'], dtype=np.float64),
+                    np.asarray(anglevalue['s'], dtype=np.float64))
+        rows = np.asarray(anglevalue, dtype=np.float64).reshape(-1, 3)
+        sign = np.where(np.signbit(rows[:, 0]), -1.0, 1.0)
+        return sign, np.abs(rows[:, 0]), rows[:, 1], rows[:, 2]
+
+    def todeg(self):
+        """Degrees converting method.
+
+        Returns
+        -------
+        numpy.ndarray
+            The angle values in degrees.
+        """
+        if self.unit == 'rad':
+            return self.anglevalue*180/np.pi
+        return self.anglevalue
+
+    def torad(self):
+        """Radians converting method.
+
+        Returns
+        -------
+        numpy.ndarray
+            The angle values in radians.
+        """
+        if self.unit == 'deg':
+            return self.anglevalue*np.pi/180
+        return self.anglevalue
+
+    def todms(self):
+        """DMS converting method.
+        This method returns angles in DMS with the same rounding as `AngleDeg.degtodms`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array of `DMS_DTYPE` (sign, d, m, s).
+        """
+        deg_value = self.todeg()
+        deg_int = np.trunc(deg_value)
+        minutes = np.abs(deg_value - deg_int) * 60
+        minutes_int = np.trunc(minutes)
+        result = np.empty(deg_value.shape, dtype=DMS_DTYPE)
+        result['sign'] = np.where(np.signbit(deg_value), -1, 1)
+        result['d'] = np.abs(deg_int)
+        result['m'] = minutes_int
+        result['s'] = np.abs(minutes - minutes_int) * 60
+        return result
+
+    def tohms(self):
+        """HMS converting method.
+        This method returns angles in HMS with the same rounding as `AngleDeg.degtohms`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array of `HMS_DTYPE` (sign, h, m, s).
+        """
+        if self.unit == 'rad':
+            hms_value = np.mod(self.anglevalue*12/np.pi, 24)
+        else:
+            hms_value = np.mod(self.anglevalue*12/180, 24)
+        hours_int = np.trunc(hms_value)
+        minutes = (hms_value - hours_int) * 60
+        minutes_int = np.trunc(minutes)
+        result = np.empty(hms_value.shape, dtype=HMS_DTYPE)
+        result['sign'] = 1
+        result['h'] = hours_int
+        result['m'] = minutes_int
+        result['s'] = (minutes - minutes_int) * 60
+        return result
@@ -0,0 +1,110 @@
+"""
+This module contains Angle base class.
+"""
+import math
+class Angle():
+    """Angle define the immutable base of scalar angles.
+    The angle is stored in radians next to its original value, sine and
+    cosine are computed on first use then cached.
+
+    The original value is kept because DMS and HMS tuples can't be rebuilt
+    exactly from radians (e.g. 45°59'48.3" gives 45°59'48.299999999995"), so a scalar
+    angle saves little memory over a plain object, bulk angles should use
+    `AngleArray` instead.
+
+    Attributes
+    ----------
+    anglevalue : float | tuple
+        The angle value in its original unit.
+    """
+    __slots__ = ('_anglevalue', '_radians', '_sin', '_cos')
+
+    def __init__(self, anglevalue: float | tuple, radians: float):
+        """Constructor method
+
+        Parameters
+        ----------
+        anglevalue : float | tuple
+            The angle value in its original unit.
+        radians : float
+            The angle value in radians.
+        """
+        object.__setattr__(self, '_anglevalue', anglevalue)
+        object.__setattr__(self, '_radians', radians)
+        object.__setattr__(self, '_sin', None)
+        object.__setattr__(self, '_cos', None)
+
+    def __setattr__(self, name, value):
+        """Attribute setting method.
+
+        Raises
+        ------
+        AttributeError
+            Angles are immutable.
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        """Attribute deleting method.
+
+        Raises
+        ------
+        AttributeError
+            Angles are immutable.
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        """Pickling method.
+
+        Returns
+        -------
+        tuple
+            Class and constructor arguments.
+        """
+        return (type(self), (self._anglevalue,))
+
+    @property
+    def anglevalue(self):
+        """The angle value in its original unit.
+
+        Returns
+        -------
+        float | tuple
+            The angle value.
+        """
+        return self._anglevalue
+
+    def sin(self):
+        """Cached sine method.
+
+        Returns
+        -------
+        float
+            The angle sine.
+        """
+        if self._sin is None:
+            object.__setattr__(self, '_sin', math.sin(self._radians))
+        return self._sin
+
+    def cos(self):
+        """Cached cosine method.
+
+        Returns
+        -------
+        float
+            The angle cosine.
+        """
+        if self._cos is None:
+            object.__setattr__(self, '_cos', math.cos(self._radians))
+        return self._cos
+
+    def tan(self):
+        """Tangent method from cached sine and cosine.
+
+        Returns
+        -------
+        float
+            The angle tangent.
+        """
+        return self.sin()/self.cos()
@@ -2,7 +2,8 @@
 This module contains AngleDeg class.
 """
 import math
-class AngleDeg():
+from astro_toolbox.angle.core import Angle
+class AngleDeg(Angle):
     """AngleDeg define degrees angle with its conversions.
 
     Attributes
@@ -10,6 +11,8 @@ class AngleDeg():
     anglevalue: float
         The angle value in degrees.
     """
+    __slots__ = ()
+
     def __init__(self, anglevalue: float):
         """Constructor method
 
@@ -18,7 +21,7 @@ class AngleDeg():
         anglevalue : float
             The angle value in degrees.
         """
-        self.anglevalue = anglevalue
+        super().__init__(anglevalue, anglevalue*math.pi/180)
 
     def __repr__(self):
         """Representative method.
@@ -39,7 +42,7 @@ class AngleDeg():
         float
             The angle value in radians.
         """
-        return self.anglevalue*math.pi/180
+        return self._radians
 
     def degtodms(self):
         """Degrees to DMS converting method.
@@ -2,8 +2,9 @@
 This module contains AngleDMS class.
 """
 import math
+from astro_toolbox.angle.core import Angle
 from astro_toolbox.utils.strparser import angle_parser
-class AngleDMS():
+class AngleDMS(Angle):
     """AngleDMS define a dms angle with its conversions.
 
     Attributes
@@ -11,6 +12,8 @@ class AngleDMS():
     anglevalue : tuple
         The angle values as floats in tuple.
     """
+    __slots__ = ()
+
     def __init__(self, anglevalue: tuple | str):
         """Constructor method
 
@@ -21,7 +24,10 @@ class AngleDMS():
         """
         if isinstance(anglevalue, str):
             anglevalue = angle_parser(anglevalue)
-        self.anglevalue = anglevalue
+        super().__init__(anglevalue, math.copysign(abs(anglevalue[0]) +
+                                                    anglevalue[1]/60 +
+                                                    anglevalue[2]/3600,
+                                                    anglevalue[0])*math.pi/180)
 
     def __repr__(self):
         """Representative method.
@@ -57,4 +63,4 @@ class AngleDMS():
         float
             The angle value in radians.
         """
-        return self.dmstodeg()*math.pi/180
+        return self._radians
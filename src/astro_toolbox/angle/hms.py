@@ -2,8 +2,9 @@
 This module contains AngleHMS class.
 """
 import math
+from astro_toolbox.angle.core import Angle
 from astro_toolbox.utils.strparser import angle_parser
-class AngleHMS():
+class AngleHMS(Angle):
     """AngleHMS define a HMS angle with its conversions.
 
     Attributes
@@ -11,6 +12,8 @@ class AngleHMS():
     anglevalue : tuple
         The angle value as floats in tuple.
     """
+    __slots__ = ()
+
     def __init__(self, anglevalue: tuple | str):
         """Constructor method
 
@@ -21,7 +24,9 @@ class AngleHMS():
         """
         if isinstance(anglevalue, str):
             anglevalue = angle_parser(anglevalue)
-        self.anglevalue = anglevalue
+        super().__init__(anglevalue, ((anglevalue[0] +
+                                        anglevalue[1]/60 +
+                                        anglevalue[2]/3600)*180/12)*math.pi/180)
 
     def __repr__(self):
         """Representative method.
@@ -55,4 +60,4 @@ class AngleHMS():
         float
             The angle value in radians.
         """
-        return self.hmstodeg() * math.pi/180
+        return self._radians
@@ -2,7 +2,8 @@
 This module contains AngleRad class.
 """
 import math
-class AngleRad():
+from astro_toolbox.angle.core import Angle
+class AngleRad(Angle):
     """AngleRad define radians angle with its conversions.
 
     Attributes
@@ -10,6 +11,8 @@ class AngleRad():
         anglevalue : float
             The angle value in radians.
     """
+    __slots__ = ()
+
     def __init__(self, anglevalue: float):
         """Constructor method.
 
@@ -18,7 +21,7 @@ class AngleRad():
         anglevalue : float
             The angle value in radians.
         """
-        self.anglevalue = anglevalue
+        super().__init__(anglevalue, anglevalue)
 
     def __repr__(self):
         """Representative method.
@@ -1,9 +1,17 @@
+import io
+import math
+import pickle
+import pytest
+import numpy as np
 from pytest import approx
 
 from astro_toolbox.angle.degrees import AngleDeg
 from astro_toolbox.angle.dms import AngleDMS
 from astro_toolbox.angle.hms import AngleHMS
 from astro_toolbox.angle.radians import AngleRad
+from astro_toolbox.angle.arrays import AngleArray
+from astro_toolbox.utils.strformatter import dms_formatter, hms_formatter
+from astro_toolbox.utils.strformatter import write_sexagesimal_table
 
 def test_degtorad():
     angle = AngleDeg(33)
@@ -41,3 +49,84 @@ def test_hmstodeg():
     angle = AngleHMS((2, 12, 0))
     assert approx(angle.hmstodeg(), rel=1e-6) == 33.0
 
+def test_angle_immutable():
+    for angle in (AngleDMS((33, 0, 0)), AngleHMS((2, 12, 0))):
+        with pytest.raises(AttributeError):
+            angle.anglevalue = (0, 0, 0)
+        with pytest.raises(AttributeError):
+            angle._radians = 0.0
+        with pytest.raises(AttributeError):
+            del angle._radians
+
+def test_angle_pickle():
+    for angle in (AngleDMS((-0.0, 30, 15.5)), AngleHMS((5, 16, 43.32)), AngleDeg(33.5),
+                  AngleRad(0.5)):
+        copy = pickle.loads(pickle.dumps(angle))
+        assert type(copy) is type(angle)
+        assert copy.anglevalue == angle.anglevalue
+        assert copy._radians == angle._radians
+
+def test_angle_trigonometry_cache():
+    angle = AngleDMS((45, 59, 48.3))
+    assert angle._sin is None and angle._cos is None
+    assert angle.sin() == math.sin(angle.dmstorad())
+    assert angle.cos() == math.cos(angle.dmstorad())
+    assert angle._sin == math.sin(angle.dmstorad())
+    assert angle._cos == math.cos(angle.dmstorad())
+    assert angle.tan() == approx(math.tan(angle.dmstorad()), rel=1e-12)
+
+def test_anglearray_todms():
+    angles = AngleArray([33, -0.5])
+    dms = angles.todms()
+    assert (dms[0]['sign'], dms[0]['d'], dms[0]['m']) == (1, 33, 0)
+    assert (dms[1]['sign'], dms[1]['d'], dms[1]['m']) == (-1, 0, 30)
+
+def test_anglearray_tohms():
+    angles = AngleArray([0.5759586531581288], unit='rad')
+    hms = angles.tohms()
+    assert (hms[0]['h'], hms[0]['m']) == (2, 12)
+    assert approx(hms[0]['s'], abs=1e-6) == 0
+
+def test_anglearray_scalar_round_trip():
+    angles = AngleArray([(5, 16, 43.32), (-16, 44, 55.8)], unit='dms')
+    assert list(angles.todeg()) == [AngleDMS((5, 16, 43.32)).dmstodeg(),
+                                    AngleDMS((-16, 44, 55.8)).dmstodeg()]
+    dms = angles.todms()[1]
+    assert ((dms['sign'] * dms['d'], dms['m'], dms['s']) ==
+            AngleDeg(angles.todeg()[1]).degtodms())
+
+def test_anglearray_from_strings():
+    angles = AngleArray(["05:16:43.32", "-00°30'00\""], unit='dms')
+    assert list(angles.todeg()) == [AngleDMS((5, 16, 43.32)).dmstodeg(), -0.5]
+
+def test_dms_formatter():
+    angles = AngleArray([(45, 59, 48.3), (-0.0, 29, 59.999)], unit='dms')
+    assert list(dms_formatter(angles)) == [repr(AngleDMS((45, 59, 48.3))), "-00°30'00.00\""]
+
+def test_hms_formatter():
+    angles = AngleArray([(5, 16, 43.32), (23, 59, 59.999)], unit='hms')
+    assert list(hms_formatter(angles, precision=1)) == ['05h16m43.3s', '00h00m00.0s']
+    assert list(hms_formatter([])) == []
+
+def test_formatter_buffer():
+    out = np.full(3, '', dtype='<U12')
+    assert hms_formatter([79.18, 0.0], out=out) is out
+    assert list(out) == ['05h16m43.20s', '00h00m00.00s', '']
+    with pytest.raises(ValueError):
+        hms_formatter([79.18, 0.0], out=np.empty(1, dtype='<U12'))
+    with pytest.raises(ValueError):
+        hms_formatter([79.18, 0.0], out=np.empty(2, dtype='<U8'))
+
+def test_write_sexagesimal_table():
+    output = io.StringIO()
+    write_sexagesimal_table(output, [['Capella', 'Vega', 'Sirius'],
+                                     AngleArray([79.18, 279.23, 101.29]),
+                                     [46.0, 38.78, -16.72]],
+                            ['str', 'hms', 'dms'], precision=1, delimiter=';', chunk_size=2)
+    assert output.getvalue().splitlines() == ["Capella;05h16m43.2s;+46°00'00.0\"",
+                                              "Vega;18h36m55.2s;+38°46'48.0\"",
+                                              "Sirius;06h45m09.6s;-16°43'12.0\""]
+    with pytest.raises(ValueError):
+        write_sexagesimal_table(io.StringIO(), [[10, 20], [1, 2]], ['hms'])
+    with pytest.raises(ValueError):
+        write_sexagesimal_table(io.StringIO(), [], [])
@@ -2,10 +2,10 @@
 """
 import sys
 import pathlib
-import json
 import logging
 import pkg_resources
 import click
+import numpy as np
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib import pyplot as plt
 from rich.progress import track
@@ -18,12 +18,18 @@ from astro_toolbox.angle.degrees import AngleDeg
 from astro_toolbox.angle.hms import AngleHMS
 from astro_toolbox.time.core import AstroDateTime
 from astro_toolbox.coordinates.location import Location
+from astro_toolbox.coordinates.sites import SiteRegistry
 from astro_toolbox.coordinates.equatorial import Equatorial
+from astro_toolbox.coordinates.chebyshev import write_chebyshev_file
 from astro_toolbox.query.ephemeris import Horizons
 from astro_toolbox.query.catalogs import Simbad
 from astro_toolbox.query.weather import OpenMeteo
+from astro_toolbox.query.cache import ResponseCache
+from astro_toolbox.query.transport import HttpTransport
+from astro_toolbox.utils.strformatter import dms_formatter, hms_formatter
 from astro_toolbox.scripts.planning import read_observatory_program
 from astro_toolbox.scripts.planning import get_multiple_informations
+from astro_toolbox.scripts.planning import get_multi_site_airmasses
 from astro_toolbox.scripts.plots import airmas_map
 from astro_toolbox.scripts.plots import polarstar_plt_northern
 from astro_toolbox.scripts.plots import polarstar_plt_southern
@@ -33,7 +39,6 @@ from astro_toolbox.gui.gui import Application
 from astro_toolbox.query.ephemeris import DICT_OBJECTS
 
 PATH_GUI = pkg_resources.resource_filename('astro_toolbox', 'gui/')
-PATH = pkg_resources.resource_filename('astro_toolbox', 'coordinates/data/')
 PATH_2 = pkg_resources.resource_filename('astro_toolbox', 'query/weather_icons/')
 
 def wmototext(code):
@@ -104,6 +109,19 @@ def winddirectiontotext(wind_direction):
         direction = 'NW'
     return direction
 
+def log_queries_statistics():
+    """Log web services cache counters and transport metrics.
+    """
+    cache = ResponseCache.get_cache()
+    for service in sorted(set(cache.hits) | set(cache.misses)):
+        logging.info(f'Cache {service}: {cache.hits[service]} hits '
+                     f'{cache.misses[service]} misses')
+    for host, metrics in HttpTransport.get_transport().get_metrics().items():
+        logging.info(f"{host}: {metrics['requests']} requests "
+                     f"{metrics['connections']} connections {metrics['retries']} retries "
+                     f"{metrics['errors']} errors mean {metrics['mean_time']:.3f} s "
+                     f"max {metrics['max_time']:.3f} s rate limit {metrics['wait']:.1f} s")
+
 @click.group()
 @click.option(
     "-v",
@@ -112,14 +130,30 @@ def winddirectiontotext(wind_direction):
     default=0,
     help="-v for DEBUG",
 )
-def cli(verbose):
+@click.option("--no-cache",
+            is_flag=True,
+            default=False,
+            help='--no-cache to disable web services responses cache')
+@click.option("--refresh",
+            is_flag=True,
+            default=False,
+            help='--refresh to request web services again and update the cache')
+def cli(verbose, no_cache, refresh):
     """Display verbose for command line
 
     Parameters
     ----------
     verbose : int
         Display verbose or not with logging levels
+    no_cache : bool
+        Disable web services responses cache.
+    refresh : bool
+        Request web services again and update the cache.
     """
+    cache = ResponseCache.get_cache()
+    cache.enabled = not no_cache
+    cache.refresh = refresh
+    click.get_current_context().call_on_close(log_queries_statistics)
     logging_levels = {1: logging.CRITICAL,
                           2: logging.ERROR,
                           3: logging.INFO,
@@ -135,8 +169,9 @@ def cli(verbose):
             help='-d, --date the date default is None if None, today date')
 @click.option("-l", "--location",
             type=click.STRING,
-            default=None,
-            help='-l --location the site name default is None if None last site used')
+            multiple=True,
+            help='-l --location the site name default is None if None last site used, '
+                 'repeat it to compare sites')
 @click.option("--bounds",
             nargs=2,
             type=click.INT,
@@ -146,10 +181,14 @@ def cli(verbose):
             type=click.STRING,
             default='',
             help='-o --output to set output path, default=\'\'')
+@click.option("-j", "--jobs",
+            type=click.INT,
+            default=8,
+            help='-j, --jobs the maximum number of concurrent queries default is 8')
 @click.argument('input_file_objects',
             type=click.STRING,
             nargs=-1)
-def airmass_map_command(input_file_objects, output, location, date, bounds):
+def airmass_map_command(input_file_objects, output, location, date, bounds, jobs):
     """Airmass calculations.
 
     Parameters
@@ -158,12 +197,14 @@ def airmass_map_command(input_file_objects, output, location, date, bounds):
         Multiple objects, directory or file (must contain '/' for path).
     output : str
         Outpt path, must contain '/' at the end.
-    location : str
-        Saved site name.
+    location : tuple
+        Saved sites names.
     date : str
         Specified date.
     bounds : tuple
         Tuple which contains night beginning bound and night ending bound.
+    jobs : int
+        Maximum number of concurrent queries.
     """
     inputpath = False
     if len(input_file_objects) == 0:
@@ -179,21 +220,38 @@ def airmass_map_command(input_file_objects, output, location, date, bounds):
     if inputpath is not False:
         object_list = read_observatory_program(inputpath)
     ut_time = AstroDateTime(date)
-    site = Location(location)
-    object_dict = get_multiple_informations(object_list, site, date, bounds)
-    temporary_dict = {}
-    pdf = PdfPages(pathlib.Path(output +
-                    f'Airmass_Map_{ut_time.get_day():02.0f}_{ut_time.get_month():02.0f}'
-                    +f'_{ut_time.get_year():04.0f}_@_{site.name}.pdf'))
-    for count, key in track(enumerate(object_dict), description='Plotting maps...'):
-        temporary_dict.update({key:object_dict[key]})
-        if count == len(object_dict)-1 or ((count+1)%50 == 0):
-            pdf.savefig(airmas_map(temporary_dict, site, date, bounds))
-            temporary_dict = {}
-    del temporary_dict
-    pdf.close()
-    logging.info(f'Airmass: {ut_time.get_day():02.0f}/{ut_time.get_month():02.0f}'
-                +f'/{ut_time.get_year():04.0f} UT @ {site.name}')
+    sites = [Location(name) for name in location] or [Location()]
+    object_dict = get_multiple_informations(object_list, sites[0], date, bounds,
+                                            max_workers=jobs)
+    for site in sites:
+        temporary_dict = {}
+        pdf = PdfPages(pathlib.Path(output +
+                        f'Airmass_Map_{ut_time.get_day():02.0f}_{ut_time.get_month():02.0f}'
+                        +f'_{ut_time.get_year():04.0f}_@_{site.name}.pdf'))
+        for count, key in track(enumerate(object_dict), description='Plotting maps...'):
+            temporary_dict.update({key:object_dict[key]})
+            if count == len(object_dict)-1 or ((count+1)%50 == 0):
+                pdf.savefig(airmas_map(temporary_dict, site, date, bounds))
+                temporary_dict = {}
+        del temporary_dict
+        pdf.close()
+        logging.info(f'Airmass: {ut_time.get_day():02.0f}/{ut_time.get_month():02.0f}'
+                    +f'/{ut_time.get_year():04.0f} UT @ {site.name}')
+    if len(sites) > 1 and object_dict:
+        summary = get_multi_site_airmasses(object_dict, sites, date, bounds)
+        table = Table(title='Sites comparison (airmass < 2)')
+        table.add_column('Site')
+        table.add_column('Observable objects')
+        table.add_column('Total window (h)')
+        table.add_column('Mean best airmass')
+        for i, site_name in enumerate(summary['sites']):
+            observable = summary['window'][i] > 0
+            table.add_row(site_name,
+                          f'{np.count_nonzero(observable)}/{len(observable)}',
+                          f'{summary["window"][i].sum():.1f}',
+                          f'{summary["best_airmass"][i][observable].mean():.2f}'
+                          if observable.any() else '-')
+        Console().print(table)
 
 @cli.command('info')
 @click.argument('objects_list',
@@ -205,8 +263,9 @@ def airmass_map_command(input_file_objects, output, location, date, bounds):
             help='-t, --time the date default is None if None, now')
 @click.option("-l", "--location",
             type=click.STRING,
-            default=None,
-            help='-l --location the site name default is None if None last site used')
+            multiple=True,
+            help='-l --location the site name default is None if None last site used, '
+                 'repeat it to compare sites')
 def info_command(objects_list, datetime, location):
     """Getting celestial objects information.
 
@@ -216,28 +275,38 @@ def info_command(objects_list, datetime, location):
         Multiple objects list.
     time : str
         Date and time
-    location : str
-       Saved site name.
+    location : tuple
+       Saved sites names.
     """
+    sites = [Location(name) for name in location] or [Location()]
+    site = sites[0]
+    ut_time = AstroDateTime(datetime)
+    coords = []
     for object_name in objects_list:
-        site = Location(name=location)
         if object_name.lower() in [key.lower() for key in DICT_OBJECTS]:
-            obj = Horizons(object_name, datetime, site)
+            obj = Horizons(object_name, datetime, site).fetch()
             alpha, delta = obj.get_equatorial_coord()
             obj_name = obj.get_name()
             obj_magnitude = obj.get_magnitude()
         else:
-            obj = Simbad(object_name)
+            obj = Simbad(object_name).fetch()
             alpha, delta = obj.get_equatorial_coord()
             obj_name = obj.get_name()
             obj_magnitude = obj.get_magnitude()
         coord = Equatorial(alpha=alpha, delta=delta, name=obj_name, magnitude=obj_magnitude)
-        coord.compute_on_date_coord(AstroDateTime(datetime).get_year())
-        gamma = AstroDateTime(datetime).get_lst(site)
-        click.echo(f'{coord}' +
-                f' HA = {AngleHMS(coord.get_hourangle(gamma=gamma))}'
-                f' X = {coord.calculate_airmass(gamma=gamma, location=site):.2f}' +
-                f' @ {site.name} {AstroDateTime(datetime)}')
+        coords.append(coord.precess(ut_time.get_epoch()))
+    gammas = [ut_time.get_lst(site) for site in sites]
+    rows = [(coord, site, gamma) for coord in coords for site, gamma in zip(sites, gammas)]
+    alphas = hms_formatter([coord.alpha.hmstodeg() for coord, _, _ in rows])
+    deltas = dms_formatter([coord.delta.dmstodeg() for coord, _, _ in rows])
+    hour_angles = hms_formatter([AngleHMS(coord.get_hourangle(gamma=gamma)).hmstodeg()
+                                 for coord, _, gamma in rows])
+    for (coord, site, gamma), alpha, delta, hour_angle in zip(rows, alphas, deltas, hour_angles):
+        click.echo(f'{coord.name}: \N{GREEK SMALL LETTER ALPHA} = {alpha} ' +
+                   f'\N{GREEK SMALL LETTER DELTA} = {delta} v = {coord.magnitude}' +
+                   f' HA = {hour_angle}'
+                   f' X = {coord.calculate_airmass(gamma=gamma, location=site):.2f}' +
+                   f' @ {site.name} {ut_time}')
 
 @cli.command('location')
 @click.argument('location_name')
@@ -300,14 +369,11 @@ def location_command(location_name, add, delete, update):
         Location(location_name, latitude, longitude, elevation).update_site()
 
     if location_name == 'list':
-        with open(PATH  + 'sites.json', encoding="utf-8") as json_file:
-            dict_sites = json.load(json_file)
-        name_list = list(dict_sites.keys())
         count = 1
-        for name in name_list:
-            click.echo(f"{count}: " + f"{name}: latitude: {dict_sites[name]['latitude']} "+
-                f"longitude: {dict_sites[name]['longitude']} "+
-                f"elevation = {dict_sites[name]['elevation']} m")
+        for name, site in SiteRegistry.get_registry().items():
+            click.echo(f"{count}: " + f"{name}: latitude: {site['latitude']} "+
+                f"longitude: {site['longitude']} "+
+                f"elevation = {site['elevation']} m")
             count = count + 1
 
     if location_name != 'list':
@@ -369,7 +435,7 @@ def weather_command(location, days, past):
     """
     last_time = '0000-00-00T00:00:00'
     print(f'weather_forecasts @ {Location(location)}')
-    weather_forecasts = OpenMeteo(Location(location))
+    weather_forecasts = OpenMeteo(Location(location)).fetch()
     console = Console()
     table = Table()
     for time in weather_forecasts.data['hourly']['time'][72 - 24 * past :72 + 24*days]:
@@ -397,6 +463,77 @@ def weather_command(location, days, past):
                     wmototext(weather_forecasts.get_wmo(time)))
         last_time = time
     console.print(table)
+
+@cli.command('ephemeris')
+@click.argument('output_file',
+                type=click.Path(dir_okay=False, writable=True))
+@click.option("-s", "--start",
+            type=click.STRING,
+            default=None,
+            help='-s, --start the first date default is None if None, today')
+@click.option("-y", "--years",
+            type=click.FLOAT,
+            default=1.0,
+            help='-y, --years the file span in years default is 1.0')
+@click.option("--segment",
+            type=click.FLOAT,
+            default=8.0,
+            help='--segment the segments duration in days default is 8.0')
+@click.option("--degree",
+            type=click.INT,
+            default=13,
+            help='--degree the Chebyshev polynomials degree default is 13')
+def ephemeris_command(output_file, start, years, segment, degree):
+    """Chebyshev ephemeris file writing for solar system objects.
+
+    Parameters
+    ----------
+    output_file : str
+        Output file path.
+    start : str
+        First date.
+    years : float
+        File span in years.
+    segment : float
+        Segments duration in days.
+    degree : int
+        Chebyshev polynomials degree.
+    """
+    start_jd = np.floor(AstroDateTime(start).get_jd() - 0.5) + 0.5
+    ephemeris = write_chebyshev_file(output_file, start_jd, start_jd + 365.25 * years,
+                                     segment_days=segment, degree=degree)
+    click.echo(f"{output_file}: {', '.join(ephemeris.names)} "+
+            f"from JD {ephemeris.start} to JD {ephemeris.stop}")
+
+@cli.command('cache')
+@click.option("-c", "--clear",
+            type=click.STRING,
+            default=None,
+            help='-c, --clear the service name to clear or \'all\' default is None')
+def cache_command(clear):
+    """Web services responses cache statistics.
+
+    Parameters
+    ----------
+    clear : str
+        Service name to clear or 'all'.
+    """
+    cache = ResponseCache.get_cache()
+    if clear is not None:
+        cache.clear(None if clear == 'all' else clear)
+    table = Table(title=f'Responses cache @ {cache.path}')
+    table.add_column('Service')
+    table.add_column('Entries', justify="right")
+    table.add_column('Size (kB)', justify="right")
+    table.add_column('TTL (h)', justify="right")
+    for service, statistics in sorted(cache.get_statistics().items()):
+        ttl = cache.ttls.get(service)
+        table.add_row(service,
+                      f"{statistics['entries']}",
+                      f"{statistics['size']/1024:.1f}",
+                      '-' if ttl is None else f'{ttl/3600:g}')
+    Console().print(table)
+
 @cli.command('gui')
 def gui():
     """GUI function to launch GUI from cli.
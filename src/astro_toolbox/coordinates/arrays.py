@@ -0,0 +1,537 @@
+"""This module contains EquatorialArray and HorizontalArray classes.
+"""
+import numpy as np
+
+from astro_toolbox.angle.arrays import AngleArray
+from astro_toolbox.angle.degrees import AngleDeg
+from astro_toolbox.coordinates.equatorial import Equatorial
+from astro_toolbox.coordinates.horizontal import Horizontal
+from astro_toolbox.coordinates.location import Location
+from astro_toolbox.coordinates.precession import precess
+from astro_toolbox.time.arrays import AstroTimeArray
+
+HORIZONTAL_QUANTITIES = ('hour_angle', 'altitude', 'azimuth', 'airmass')
+SIDEREAL_RATE = 1.002737909
+
+def pickering_airmass(altitude):
+    """Airmass calculation from altitudes with the Pickering (2002) formula
+    (c.f. `Equatorial.calculate_airmass`), objects below horizon have an airmass of 40.
+
+    .. math:: X = \\frac{1}{sin(h+\\frac{244}{165+47h^{1.1}})}
+
+    Parameters
+    ----------
+    altitude : numpy.ndarray
+        Altitudes in radians.
+
+    Returns
+    -------
+    numpy.ndarray
+        Airmasses.
+    """
+    altitude = np.degrees(altitude)
+    above = np.maximum(altitude, 0)
+    airmass = 1/np.sin(np.radians(above + 244/(165 + 47 * above ** 1.1)))
+    return np.where(altitude < 0, 40, airmass)
+
+def horizontal_matrix(location: Location):
+    """Local equatorial to horizontal rotation matrix calculation function.
+
+    The matrix transforms unit vectors :math:`(cos\\delta cos(-H), cos\\delta sin(-H), sin\\delta)`
+    into :math:`(cos h cos A, cos h sin A, sin h)` with azimuths from North through East.
+    It is its own inverse.
+
+    .. math:: M = \\begin{pmatrix} -sin\\Phi & 0 & cos\\Phi \\\\ 0 & 1 & 0 \\\\
+              cos\\Phi & 0 & sin\\Phi \\end{pmatrix}
+
+    Parameters
+    ----------
+    location : Location
+        Observer location.
+
+    Returns
+    -------
+    numpy.ndarray
+        Rotation matrix (3, 3).
+    """
+    sin_lat, cos_lat = location.latitude.sin(), location.latitude.cos()
+    return np.array([[-sin_lat, 0.0, cos_lat],
+                     [0.0, 1.0, 0.0],
+                     [cos_lat, 0.0, sin_lat]])
+
+def _rotate(longitude, latitude, matrix):
+    """Spherical coordinates rotation function.
+
+    Parameters
+    ----------
+    longitude : numpy.ndarray
+        Longitudes in radians.
+    latitude : numpy.ndarray
+        Latitudes in radians.
+    matrix : numpy.ndarray
+        Rotation matrix (3, 3).
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing rotated longitudes within [0, 2pi[ (from atan2)
+        and latitudes in radians.
+    """
+    cos_latitude = np.cos(latitude)
+    vectors = np.stack((cos_latitude * np.cos(longitude), cos_latitude * np.sin(longitude),
+                        np.sin(latitude)), axis=-1) @ matrix.T
+    return (np.mod(np.arctan2(vectors[..., 1], vectors[..., 0]), 2*np.pi),
+            np.arcsin(np.clip(vectors[..., 2], -1, 1)))
+
+def _magnitudes(magnitude, length: int):
+    """Magnitudes array building function.
+
+    Parameters
+    ----------
+    magnitude : array_like | None
+        Magnitudes, None values are unknown magnitudes.
+    length : int
+        Number of objects.
+
+    Returns
+    -------
+    numpy.ndarray
+        Magnitudes (NaN when unknown).
+    """
+    if magnitude is None:
+        return np.full(length, np.nan)
+    return np.array([np.nan if value is None else value for value in magnitude],
+                    dtype=np.float64)
+
+class EquatorialArray():
+    """This class represents an array of objects in the equatorial coordinate system.
+
+    Attributes
+    ----------
+    alpha : AngleArray
+        Objects right-ascensions.
+    delta : AngleArray
+        Objects declinations.
+    name : list
+        Objects names.
+    magnitude : numpy.ndarray
+        Objects magnitudes (NaN when unknown).
+    """
+    def __init__(self, alpha, delta, name: list = None, magnitude=None):
+        """Constructor method
+
+        Parameters
+        ----------
+        alpha : AngleArray | array_like
+            Objects right-ascensions as AngleArray or values in degrees.
+        delta : AngleArray | array_like
+            Objects declinations as AngleArray or values in degrees.
+        name : list, optional
+            Objects names, by default None.
+        magnitude : array_like, optional
+            Objects magnitudes, by default None.
+
+        Raises
+        ------
+        ValueError
+            Right-ascensions and declinations of different lengths.
+        """
+        self.alpha = alpha if isinstance(alpha, AngleArray) else AngleArray(np.atleast_1d(alpha))
+        self.delta = delta if isinstance(delta, AngleArray) else AngleArray(np.atleast_1d(delta))
+        if len(self.alpha) != len(self.delta):
+            raise ValueError("alpha and delta must have the same length")
+        self.name = list(name) if name is not None else [None] * len(self.alpha)
+        self.magnitude = _magnitudes(magnitude, len(self.alpha))
+
+    @classmethod
+    def from_equatorial(cls, objects):
+        """Build an EquatorialArray from Equatorial objects.
+
+        Parameters
+        ----------
+        objects : iterable
+            Equatorial objects.
+
+        Returns
+        -------
+        EquatorialArray
+            Objects coordinates as arrays.
+        """
+        objects = list(objects)
+        return cls(np.array([item.alpha.hmstodeg() for item in objects], dtype=np.float64),
+                   np.array([item.delta.dmstodeg() for item in objects], dtype=np.float64),
+                   name=[item.name for item in objects],
+                   magnitude=[item.magnitude for item in objects])
+
+    def __repr__(self):
+        """Representative method.
+
+        Returns
+        -------
+        str
+            Return a class representative string.
+        """
+        return f'EquatorialArray({len(self)} objects)'
+
+    def __len__(self):
+        """Length method.
+
+        Returns
+        -------
+        int
+            Number of objects.
+        """
+        return len(self.alpha)
+
+    def __getitem__(self, index):
+        """Indexing method.
+
+        Parameters
+        ----------
+        index : int | slice | array_like
+            Index, slice or mask.
+
+        Returns
+        -------
+        Equatorial | EquatorialArray
+            Equatorial for an integer index, EquatorialArray otherwise.
+        """
+        if isinstance(index, (int, np.integer)):
+            magnitude = self.magnitude[index]
+            return Equatorial(name=self.name[index],
+                              alpha=AngleDeg(self.alpha.todeg()[index]).degtohms(),
+                              delta=AngleDeg(self.delta.todeg()[index]).degtodms(),
+                              magnitude=None if np.isnan(magnitude) else float(magnitude))
+        return EquatorialArray(self.alpha[index], self.delta[index],
+                               name=np.array(self.name, dtype=object)[index].tolist(),
+                               magnitude=self.magnitude[index])
+
+    def precess(self, epoch: float):
+        """J2000 to epoch precession method, all objects are rotated with the
+        cached epoch matrix in one matrix product (c.f. `Equatorial.precess`).
+
+        Parameters
+        ----------
+        epoch : float
+            Julian epoch in years (c.f. `AstroDateTime.get_epoch`).
+
+        Returns
+        -------
+        EquatorialArray
+            New EquatorialArray with on date coordinates.
+        """
+        alpha, delta = precess(self.alpha.torad(), self.delta.torad(), epoch)
+        return EquatorialArray(AngleArray(alpha, unit='rad'), AngleArray(delta, unit='rad'),
+                               name=self.name, magnitude=self.magnitude)
+
+    def get_hourangle(self, lst):
+        """Hour-Angles computation method.
+
+        .. math:: HA = \\gamma - RA
+
+        Parameters
+        ----------
+        lst : array_like
+            Local sidereal times in radians (c.f. `AstroDateTime.get_lst_grid`).
+
+        Returns
+        -------
+        numpy.ndarray
+            Hour-Angles in radians within [-pi, pi[ of shape (objects, times).
+        """
+        hour_angle = np.asarray(lst, dtype=np.float64) - self.alpha.torad()[:, None]
+        return np.mod(hour_angle + np.pi, 2*np.pi) - np.pi
+
+    def to_horizontal(self, lst, location: Location):
+        """Equatorial to Horizontal converting method, one sidereal time per object
+        (c.f. `to_horizontal_grid` for objects × times grids).
+
+        Parameters
+        ----------
+        lst : float | array_like
+            Local sidereal times in radians, scalar or one per object
+            (c.f. `AstroTimeArray.get_lst`).
+        location : Location
+            Observer location.
+
+        Returns
+        -------
+        HorizontalArray
+            Objects horizontal coordinates.
+        """
+        hour_angle = np.asarray(lst, dtype=np.float64) - self.alpha.torad()
+        azimuth, altitude = _rotate(-hour_angle, self.delta.torad(), horizontal_matrix(location))
+        return HorizontalArray(AngleArray(azimuth, unit='rad'), AngleArray(altitude, unit='rad'),
+                               name=self.name, magnitude=self.magnitude)
+
+    def to_horizontal_grid(self, lst, location: Location, dtype=np.float64,
+                           chunk_size: int = 256, quantities: tuple = HORIZONTAL_QUANTITIES):
+        """Objects × times horizontal coordinates and airmasses computation method.
+
+        Hour-angles trigonometric functions are obtained from the angle addition
+        formulas so that only per object and per time trigonometric functions
+        are computed, the grid is then filled by broadcast products.
+
+        .. math:: h=sin^{-1}(cos\\Phi cos H cos\\delta+sin\\Phi sin\\delta)
+
+        .. math:: A=atan2(-sin H cos\\delta, cos\\Phi sin\\delta-sin\\Phi cos H cos\\delta)
+
+        Parameters
+        ----------
+        lst : array_like
+            Local sidereal times in radians (c.f. `AstroDateTime.get_lst_grid`).
+        location : Location
+            Observer location.
+        dtype : numpy.dtype, optional
+            Computation and output arrays dtype (numpy.float32 halves memory and
+            computation time), by default numpy.float64.
+        chunk_size : int, optional
+            Number of objects computed at once to bound temporary arrays, by default 256.
+        quantities : tuple, optional
+            Computed quantities in ``'hour_angle'``, ``'altitude'``, ``'azimuth'``
+            and ``'airmass'``, by default all.
+
+        Returns
+        -------
+        dict
+            Dictionary of arrays of shape (objects, times): hour-angles (within [-pi, pi[),
+            altitudes and azimuths in radians and Pickering airmasses (40 below horizon).
+
+        Raises
+        ------
+        ValueError
+            Unknown quantity.
+        """
+        for quantity in quantities:
+            if quantity not in HORIZONTAL_QUANTITIES:
+                raise ValueError(f"Unknown quantity {quantity}")
+        lst = np.asarray(lst, dtype=np.float64)
+        sin_lst, cos_lst = np.sin(lst).astype(dtype), np.cos(lst).astype(dtype)
+        sin_lat, cos_lat = location.latitude.sin(), location.latitude.cos()
+        alpha, delta = self.alpha.torad(), self.delta.torad()
+        result = {quantity: np.empty((len(self), len(lst)), dtype=dtype)
+                  for quantity in quantities}
+        for start in range(0, len(self), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            sin_alpha = np.sin(alpha[chunk]).astype(dtype)[:, None]
+            cos_alpha = np.cos(alpha[chunk]).astype(dtype)[:, None]
+            sin_delta = np.sin(delta[chunk]).astype(dtype)[:, None]
+            cos_delta = np.cos(delta[chunk]).astype(dtype)[:, None]
+            cos_hour_angle = cos_lst * cos_alpha
+            cos_hour_angle += sin_lst * sin_alpha
+            if 'hour_angle' in result:
+                result['hour_angle'][chunk] = np.mod(lst - alpha[chunk, None] + np.pi,
+                                                     2*np.pi) - np.pi
+            if 'altitude' in result or 'airmass' in result:
+                altitude = cos_hour_angle * (cos_lat * cos_delta)
+                altitude += sin_lat * sin_delta
+                altitude = np.arcsin(np.clip(altitude, -1, 1, out=altitude), out=altitude)
+                if 'altitude' in result:
+                    result['altitude'][chunk] = altitude
+                if 'airmass' in result:
+                    result['airmass'][chunk] = pickering_airmass(altitude)
+            if 'azimuth' in result:
+                sin_hour_angle = sin_lst * cos_alpha
+                sin_hour_angle -= cos_lst * sin_alpha
+                result['azimuth'][chunk] = np.mod(np.arctan2(-sin_hour_angle * cos_delta,
+                                                             cos_lat * sin_delta -
+                                                             sin_lat * cos_hour_angle *
+                                                             cos_delta), 2*np.pi)
+        return result
+
+    def rise_set_transit(self, location: Location, dates, altitude_0: float = 0.0):
+        """Objects × dates rise, set and transit times calculation method.
+
+        Sidereal times at 0h UT are computed once per date and the rising
+        hour-angle once per object, times are then broadcast to all pairs.
+
+        .. math:: cos H_0 = \\frac{sin h_0 - sin\\Phi sin\\delta}{cos\\Phi cos\\delta}
+
+        .. math:: UT_{transit} = \\frac{mod(\\alpha - \\lambda - \\gamma_0, 360)}{1.002737909}
+
+        .. math:: UT_{rise, set} = \\frac{mod(\\alpha \\mp H_0 - \\lambda - \\gamma_0, 360)}{1.002737909}
+
+        Parameters
+        ----------
+        location : Location
+            Observer location.
+        dates : AstroTimeArray | array_like
+            Dates (times of day are ignored), c.f. `AstroTimeArray`.
+        altitude_0 : float, optional
+            Altitude threshold in degrees, by default 0.0.
+
+        Returns
+        -------
+        dict
+            Dictionary of arrays of shape (objects, dates): ``'rise'``, ``'set'`` and
+            ``'transit'`` UT hours after 0h of each date (NaN for rise and set of
+            circumpolar or never rising objects), ``'circumpolar'`` and ``'never_up'``
+            boolean flags.
+        """
+        dates = AstroTimeArray(dates)
+        midnight = AstroTimeArray(np.floor(dates.get_jd() - 0.5) + 0.5)
+        origin = np.degrees(midnight.get_gmst()) + location.longitude.dmstodeg()
+        delta = self.delta.torad()
+        cos_hour_angle = ((np.sin(np.radians(altitude_0)) -
+                           location.latitude.sin() * np.sin(delta)) /
+                          (location.latitude.cos() * np.cos(delta)))
+        circumpolar = cos_hour_angle < -1
+        never_up = cos_hour_angle > 1
+        hour_angle = np.degrees(np.arccos(np.clip(cos_hour_angle, -1, 1)))
+        hour_angle[circumpolar | never_up] = np.nan
+        transit = np.mod(np.subtract.outer(self.alpha.todeg(), origin), 360)
+        rise = transit - hour_angle[:, None]
+        rise[rise < 0] += 360
+        setting = transit + hour_angle[:, None]
+        setting[setting >= 360] -= 360
+        for times in (rise, setting, transit):
+            times *= 1/(SIDEREAL_RATE * 15)
+        return {'rise': rise,
+                'set': setting,
+                'transit': transit,
+                'circumpolar': np.broadcast_to(circumpolar[:, None], transit.shape),
+                'never_up': np.broadcast_to(never_up[:, None], transit.shape)}
+
+class HorizontalArray():
+    """This class represents an array of objects or samples in the horizontal coordinate system.
+
+    Attributes
+    ----------
+    azimuth : AngleArray
+        Azimuths (from North through East).
+    altitude : AngleArray
+        Altitudes.
+    name : list
+        Objects names.
+    magnitude : numpy.ndarray
+        Objects magnitudes (NaN when unknown).
+    """
+    def __init__(self, azimuth, altitude, name: list = None, magnitude=None):
+        """Constructor method
+
+        Parameters
+        ----------
+        azimuth : AngleArray | array_like
+            Azimuths as AngleArray or values in degrees.
+        altitude : AngleArray | array_like
+            Altitudes as AngleArray or values in degrees.
+        name : list, optional
+            Objects names, by default None.
+        magnitude : array_like, optional
+            Objects magnitudes, by default None.
+
+        Raises
+        ------
+        ValueError
+            Azimuths and altitudes of different lengths.
+        """
+        self.azimuth = (azimuth if isinstance(azimuth, AngleArray)
+                        else AngleArray(np.atleast_1d(azimuth)))
+        self.altitude = (altitude if isinstance(altitude, AngleArray)
+                         else AngleArray(np.atleast_1d(altitude)))
+        if len(self.azimuth) != len(self.altitude):
+            raise ValueError("azimuth and altitude must have the same length")
+        self.name = list(name) if name is not None else [None] * len(self.azimuth)
+        self.magnitude = _magnitudes(magnitude, len(self.azimuth))
+
+    @classmethod
+    def from_horizontal(cls, objects):
+        """Build a HorizontalArray from Horizontal objects.
+
+        Parameters
+        ----------
+        objects : iterable
+            Horizontal objects.
+
+        Returns
+        -------
+        HorizontalArray
+            Objects coordinates as arrays.
+        """
+        objects = list(objects)
+        return cls(np.array([item.azimuth.dmstodeg() for item in objects], dtype=np.float64),
+                   np.array([item.altitude.dmstodeg() for item in objects], dtype=np.float64),
+                   name=[item.name for item in objects],
+                   magnitude=[item.magnitude for item in objects])
+
+    def __repr__(self):
+        """Representative method.
+
+        Returns
+        -------
+        str
+            Return a class representative string.
+        """
+        return f'HorizontalArray({len(self)} objects)'
+
+    def __len__(self):
+        """Length method.
+
+        Returns
+        -------
+        int
+            Number of objects.
+        """
+        return len(self.azimuth)
+
+    def __getitem__(self, index):
+        """Indexing method.
+
+        Parameters
+        ----------
+        index : int | slice | array_like
+            Index, slice or mask.
+
+        Returns
+        -------
+        Horizontal | HorizontalArray
+            Horizontal for an integer index, HorizontalArray otherwise.
+        """
+        if isinstance(index, (int, np.integer)):
+            magnitude = self.magnitude[index]
+            return Horizontal(name=self.name[index],
+                              azimuth=AngleDeg(self.azimuth.todeg()[index]).degtodms(),
+                              altitude=AngleDeg(self.altitude.todeg()[index]).degtodms(),
+                              magnitude=None if np.isnan(magnitude) else float(magnitude))
+        return HorizontalArray(self.azimuth[index], self.altitude[index],
+                               name=np.array(self.name, dtype=object)[index].tolist(),
+                               magnitude=self.magnitude[index])
+
+    def calculate_airmass(self):
+        """Airmasses calculation method (c.f. `pickering_airmass`).
+
+        Returns
+        -------
+        numpy.ndarray
+            Airmasses (40 below horizon).
+        """
+        return pickering_airmass(self.altitude.torad())
+
+    def to_equatorial(self, lst, location: Location):
+        """Horizontal to equatorial converting method, one sidereal time per sample
+        so that timestamped streams (e.g. mount encoders logs) are converted at once.
+
+        .. math:: \\delta=sin^{-1}(sin \\Phi sin h+cos \\Phi cos h cos A)
+
+        .. math:: H=atan2(-sin A cos h, cos\\Phi sin h-sin\\Phi cos h cos A)
+
+        .. math:: \\alpha=\\gamma-H
+
+        Parameters
+        ----------
+        lst : float | array_like
+            Local sidereal times in radians, scalar or one per sample
+            (c.f. `AstroTimeArray.get_lst`).
+        location : Location
+            Observer location.
+
+        Returns
+        -------
+        EquatorialArray
+            Objects equatorial coordinates.
+        """
+        hour_angle, delta = _rotate(self.azimuth.torad(), self.altitude.torad(),
+                                    horizontal_matrix(location))
+        alpha = np.mod(np.asarray(lst, dtype=np.float64) + hour_angle, 2*np.pi)
+        return EquatorialArray(AngleArray(alpha, unit='rad'), AngleArray(delta, unit='rad'),
+                               name=self.name, magnitude=self.magnitude)
@@ -0,0 +1,269 @@
+"""This module contains Chebyshev ephemeris files writer and ChebyshevEphemeris reader.
+
+File layout (little-endian): a `CHEBYSHEV_HEADER` record, objects names as 16 bytes
+str and float64 coefficients of shape (objects, segments, 3, degree + 1) for the
+geocentric equatorial positions in km. Segments are of equal durations so that
+an epoch segment is found by an integer division.
+"""
+import os
+import tempfile
+import contextlib
+import numpy as np
+
+from astro_toolbox.coordinates.solar_system import SolarSystemSnapshot
+from astro_toolbox.time.arrays import AstroTimeArray
+
+CHEBYSHEV_MAGIC = b'ATCHEB01'
+CHEBYSHEV_HEADER = np.dtype([('magic', 'S8'),
+                             ('objects', '<u4'),
+                             ('degree', '<u4'),
+                             ('segments', '<u4'),
+                             ('padding', '<u4'),
+                             ('start', '<f8'),
+                             ('segment_days', '<f8')])
+NAME_DTYPE = np.dtype('S16')
+
+def snapshot_source(julian_days):
+    """Default positions source from the built-in model (c.f. `SolarSystemSnapshot`).
+
+    Parameters
+    ----------
+    julian_days : numpy.ndarray
+        Julian days.
+
+    Returns
+    -------
+    tuple
+        Tuple containing objects names and geocentric equatorial positions in km
+        of shape (objects, 3, epochs).
+    """
+    snapshot = SolarSystemSnapshot(AstroTimeArray(julian_days))
+    return snapshot.names, snapshot.equatorial_position
+
+def _as_julian_days(times):
+    """Epochs to Julian days converting function.
+
+    Parameters
+    ----------
+    times : float | array_like | AstroTimeArray
+        Julian days or AstroTimeArray.
+
+    Returns
+    -------
+    numpy.ndarray
+        Julian days.
+    """
+    if isinstance(times, AstroTimeArray):
+        return times.get_jd()
+    return np.asarray(times, dtype=np.float64)
+
+def write_chebyshev_file(path: str, start, stop, segment_days: float = 8.0,
+                         degree: int = 13, source=snapshot_source):
+    """Chebyshev ephemeris file writing function.
+
+    Positions are sampled on the Chebyshev nodes of each segment, all segments at
+    once, and coefficients are obtained by a discrete cosine transform.
+
+    .. math:: x_k = cos(\\frac{\\pi(k + 1/2)}{n}), k = 0..n-1
+
+    .. math:: c_j = \\frac{2}{n}\\sum_k f(x_k)T_j(x_k)
+
+    The file is written in a temporary file renamed over path.
+
+    Parameters
+    ----------
+    path : str
+        Output file path.
+    start : float | AstroTimeArray
+        First Julian day.
+    stop : float | AstroTimeArray
+        Last Julian day, rounded up to a whole segment.
+    segment_days : float, optional
+        Segments duration in days, by default 8.0.
+    degree : int, optional
+        Chebyshev polynomials degree, by default 13.
+    source : callable, optional
+        Function returning objects names and positions of shape (objects, 3, epochs)
+        from Julian days (e.g. built from imported tables), by default `snapshot_source`.
+
+    Returns
+    -------
+    ChebyshevEphemeris
+        Reader of the written file.
+
+    Raises
+    ------
+    ValueError
+        Object name not ASCII or longer than 16 characters.
+    """
+    start = float(_as_julian_days(start).ravel()[0])
+    stop = float(_as_julian_days(stop).ravel()[-1])
+    segments = max(int(np.ceil((stop - start)/segment_days)), 1)
+    nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5)/(degree + 1))
+    julian_days = start + (np.arange(segments)[:, np.newaxis] + (nodes + 1)/2) * segment_days
+    names, positions = source(julian_days.ravel())
+    for item in names:
+        if not item.isascii() or len(item) > NAME_DTYPE.itemsize:
+            raise ValueError(f"Object name {item!r} must be ASCII of at most "
+                             f"{NAME_DTYPE.itemsize} characters")
+    positions = np.asarray(positions, dtype=np.float64).reshape(len(names), 3, segments,
+                                                                degree + 1)
+    polynomials = np.cos(np.outer(np.arange(degree + 1),
+                                  np.pi * (np.arange(degree + 1) + 0.5)/(degree + 1)))
+    coefficients = 2/(degree + 1) * np.einsum('bcsk,jk->bscj', positions, polynomials)
+    coefficients[..., 0] /= 2
+    header = np.array([(CHEBYSHEV_MAGIC, len(names), degree, segments, 0, start,
+                        segment_days)], dtype=CHEBYSHEV_HEADER)
+    directory, name = os.path.split(os.path.abspath(path))
+    file_descriptor, temp_path = tempfile.mkstemp(prefix=name, suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(file_descriptor, 'wb') as binary_file:
+            binary_file.write(header.tobytes())
+            binary_file.write(np.array([item.encode('ascii') for item in names],
+                                       dtype=NAME_DTYPE).tobytes())
+            binary_file.write(coefficients.astype('<f8').tobytes())
+            binary_file.flush()
+            os.fsync(binary_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+    return ChebyshevEphemeris(path)
+
+class ChebyshevEphemeris():
+    """ChebyshevEphemeris class evaluating positions from a memory-mapped Chebyshev
+    ephemeris file (c.f. `write_chebyshev_file`).
+
+    Coefficients are memory-mapped read-only, so that opening a file costs nothing
+    and pages are shared between processes.
+
+    Attributes
+    ----------
+    path : str
+        File path.
+    names : list
+        Objects names.
+    degree : int
+        Chebyshev polynomials degree.
+    start : float
+        First Julian day.
+    stop : float
+        Last Julian day.
+    segment_days : float
+        Segments duration in days.
+    coefficients : numpy.memmap
+        Coefficients of shape (objects, segments, 3, degree + 1).
+    """
+    def __init__(self, path: str):
+        """Constructor method
+
+        Parameters
+        ----------
+        path : str
+            Chebyshev ephemeris file path.
+
+        Raises
+        ------
+        ValueError
+            Not a Chebyshev ephemeris file.
+        """
+        self.path = path
+        header = np.fromfile(path, dtype=CHEBYSHEV_HEADER, count=1)
+        if len(header) == 0 or header['magic'][0] != CHEBYSHEV_MAGIC:
+            raise ValueError(f"{path} is not a Chebyshev ephemeris file")
+        header = header[0]
+        self.degree = int(header['degree'])
+        self.start = float(header['start'])
+        self.segment_days = float(header['segment_days'])
+        segments = int(header['segments'])
+        self.stop = self.start + segments * self.segment_days
+        names = np.fromfile(path, dtype=NAME_DTYPE, count=int(header['objects']),
+                            offset=CHEBYSHEV_HEADER.itemsize)
+        self.names = [item.decode('ascii') for item in names]
+        self.coefficients = np.memmap(path, dtype='<f8', mode='r',
+                                      offset=CHEBYSHEV_HEADER.itemsize + names.nbytes,
+                                      shape=(len(self.names), segments, 3, self.degree + 1))
+
+    def __repr__(self):
+        """Representative method.
+
+        Returns
+        -------
+        str
+            Return a class representative string.
+        """
+        return (f'ChebyshevEphemeris({len(self.names)} objects, '
+                f'JD {self.start} to {self.stop})')
+
+    def get_position(self, times, name: str = None):
+        """Evaluate geocentric equatorial positions.
+
+        Epochs segments are found by integer division and Chebyshev polynomials
+        are evaluated once for all objects.
+
+        .. math:: T_0 = 1, T_1 = x, T_{j+1} = 2xT_j - T_{j-1}
+
+        Parameters
+        ----------
+        times : float | array_like | AstroTimeArray
+            Julian days or AstroTimeArray.
+        name : str, optional
+            Object name, by default None for all objects.
+
+        Returns
+        -------
+        numpy.ndarray
+            Positions in km of shape (3, epochs) for an object or (objects, 3, epochs).
+
+        Raises
+        ------
+        ValueError
+            Unknown object or epochs out of the file span.
+        """
+        julian_days = np.atleast_1d(_as_julian_days(times)).ravel()
+        if np.any(julian_days < self.start) or np.any(julian_days > self.stop):
+            raise ValueError(f"Epochs out of the file span JD {self.start} to {self.stop}")
+        indexes = range(len(self.names))
+        if name is not None:
+            lower_names = [item.lower() for item in self.names]
+            if name.lower() not in lower_names:
+                raise ValueError ("Unknown object")
+            indexes = [lower_names.index(name.lower())]
+        position = (julian_days - self.start)/self.segment_days
+        segment = np.minimum(position.astype(np.int64), self.coefficients.shape[1] - 1)
+        abscissa = 2 * (position - segment) - 1
+        polynomials = np.empty((len(abscissa), self.degree + 1))
+        polynomials[:, 0] = 1
+        if self.degree > 0:
+            polynomials[:, 1] = abscissa
+        for order in range(2, self.degree + 1):
+            polynomials[:, order] = (2 * abscissa * polynomials[:, order - 1] -
+                                     polynomials[:, order - 2])
+        position = np.stack([np.einsum('tcj,tj->ct', self.coefficients[index][segment],
+                                       polynomials) for index in indexes])
+        return position[0] if name is not None else position
+
+    def get_equatorial_array(self, times, name: str = None):
+        """Calculate equatorial coordinates and distances
+        (c.f. `SolarSystemSnapshot.get_equatorial_array`).
+
+        Parameters
+        ----------
+        times : float | array_like | AstroTimeArray
+            Julian days or AstroTimeArray.
+        name : str, optional
+            Object name, by default None for all objects.
+
+        Returns
+        -------
+        tuple
+            Tuple of arrays containing right-ascensions within [0, 2pi[ and declinations
+            in radians and geocentric distances in km, of shape (epochs) for an object
+            or (objects, epochs).
+        """
+        x_equatorial, y_equatorial, z_equatorial = np.moveaxis(self.get_position(times, name),
+                                                               -2, 0)
+        return (np.mod(np.arctan2(y_equatorial, x_equatorial), 2*np.pi),
+                np.arctan2(z_equatorial, np.sqrt(x_equatorial**2 + y_equatorial**2)),
+                np.sqrt(x_equatorial**2 + y_equatorial**2 + z_equatorial**2))
@@ -7,6 +7,7 @@ from astro_toolbox.angle.dms import AngleDMS
 from astro_toolbox.angle.degrees import AngleDeg
 from astro_toolbox.angle.radians import AngleRad
 from astro_toolbox.coordinates.location import Location
+from astro_toolbox.coordinates.precession import precess
 from astro_toolbox.time.core import AstroDateTime
 
 class Equatorial():
@@ -23,6 +24,8 @@ class Equatorial():
     magnitude : float
         Object magnitude.
     """
+    __slots__ = ('name', 'alpha', 'delta', 'magnitude')
+
     def __init__(self, alpha: tuple | str,
                 delta: tuple | str,
                 name: str = None,
@@ -97,21 +100,21 @@ class Equatorial():
         float
             Airmass value of the object.
         """
-        lat = location.latitude.dmstorad()
-        hour_angle = AngleHMS(self.get_hourangle(gamma=gamma)).hmstorad()
-        altitude = AngleRad(math.asin(math.cos(lat) * math.cos(hour_angle) *
-                    math.cos(self.delta.dmstorad()) + math.sin(lat) *
-                    math.sin(self.delta.dmstorad()))).radtodeg()
+        lat = location.latitude
+        hour_angle = AngleHMS(gamma).hmstorad() - self.alpha.hmstorad()
+        altitude = math.asin(lat.cos() * math.cos(hour_angle) *
+                    self.delta.cos() + lat.sin() *
+                    self.delta.sin())*180/math.pi
         if altitude < 0:
             return 40
-        return 1/(math.sin(AngleDeg(altitude + 244/(165 + 47 * altitude ** 1.1)).degtorad()))
+        return 1/(math.sin((altitude + 244/(165 + 47 * altitude ** 1.1))*math.pi/180))
 
     def to_horizontal(self, gamma: tuple | str, location: Location):
         """Equatorial to Horizontal converting method.
 
         .. math:: h=sin^{-1}(cos\\Phi cos H cos\\delta+sin\\Phi sin\\delta)
 
-        .. math:: A=sin^{-1}(\\frac{-sin H cos \\delta}{cosh})
+        .. math:: A=atan2(-sin H cos\\delta, cos\\Phi sin\\delta-sin\\Phi cos H cos\\delta)
 
         Parameters
         ----------
@@ -125,13 +128,14 @@ class Equatorial():
         tuple
             Tuple containing two tuple in DMS with (azimuth, altitude).
         """
-        lat = location.latitude.dmstorad()
-        hour_angle = AngleHMS(self.get_hourangle(gamma=gamma)).hmstorad()
-        altitude = AngleRad((math.asin(math.cos(lat) * math.cos(hour_angle) *
-                            math.cos(self.delta.dmstorad())
-            + math.sin(lat) * math.sin(self.delta.dmstorad()))))
-        azimuth = AngleRad((math.asin(-math.sin(hour_angle) *
-            math.cos(self.delta.dmstorad()) / math.cos(altitude.anglevalue)))%(2*math.pi))
+        lat = location.latitude
+        hour_angle = AngleHMS(gamma).hmstorad() - self.alpha.hmstorad()
+        altitude = AngleRad((math.asin(lat.cos() * math.cos(hour_angle) *
+                            self.delta.cos()
+            + lat.sin() * self.delta.sin())))
+        azimuth = AngleRad((math.atan2(-math.sin(hour_angle) * self.delta.cos(),
+            lat.cos() * self.delta.sin() -
+            lat.sin() * math.cos(hour_angle) * self.delta.cos()))%(2*math.pi))
         return (azimuth.radtodms(), altitude.radtodms())
 
     def compute_on_date_coord(self, year: float):
@@ -151,6 +155,9 @@ class Equatorial():
 
         .. math:: \\delta=\\delta_{J2000}+\\Delta \\delta
 
+        This linear approximation mutates the object, c.f. `precess` for the
+        rigorous and non-mutating method.
+
         Parameters
         ----------
         year : float
@@ -161,14 +168,34 @@ class Equatorial():
                 var_year**2 + 0.0000101 * var_year**3) * math.pi/180
         n_coeff = (0.5567530 * var_year - 0.0001185 *
                 var_year**2 + 0.0000116 * var_year**3) * math.pi/180
-        var_alpha = (m_coeff + n_coeff * math.sin(self.alpha.hmstorad()) *
-                    math.tan(self.delta.dmstorad()))
-        var_delta = n_coeff * math.cos(self.alpha.hmstorad())
+        var_alpha = (m_coeff + n_coeff * self.alpha.sin() *
+                    self.delta.tan())
+        var_delta = n_coeff * self.alpha.cos()
         alpha = AngleHMS(AngleRad(self.alpha.hmstorad() + var_alpha).radtohms())
         delta = AngleDMS(AngleRad(self.delta.dmstorad() + var_delta).radtodms())
         self.alpha = alpha
         self.delta = delta
 
+    def precess(self, epoch: float):
+        """J2000 to epoch precession method with the IAU 1976 rotation matrix
+        (c.f. `astro_toolbox.coordinates.precession`).
+
+        Parameters
+        ----------
+        epoch : float
+            Julian epoch in years (c.f. `AstroDateTime.get_epoch`).
+
+        Returns
+        -------
+        Equatorial
+            New Equatorial object with on date coordinates.
+        """
+        alpha, delta = precess(self.alpha.hmstorad(), self.delta.dmstorad(), epoch)
+        return Equatorial(alpha=AngleRad(float(alpha)).radtohms(),
+                          delta=AngleRad(float(delta)).radtodms(),
+                          name=self.name,
+                          magnitude=self.magnitude)
+
     def calculate_rise_time(self, location:Location, date: tuple | str, altitude_0: float=0.0):
         """Rise time calculation method.
 
@@ -186,10 +213,10 @@ class Equatorial():
         """
         time = AstroDateTime(date)
         hour_angle = math.acos((math.sin(altitude_0*math.pi/180) -
-                    math.sin(location.latitude.dmstorad()) *
-                    math.sin(self.delta.dmstorad())) /
-                    (math.cos(location.latitude.dmstorad()) *
-                    math.cos(self.delta.dmstorad())))*180/math.pi
+                    location.latitude.sin() *
+                    self.delta.sin()) /
+                    (location.latitude.cos() *
+                    self.delta.cos()))*180/math.pi
         tsg0 = AngleHMS(AstroDateTime(time.date+(0 , 0, 0)).get_gmst()).hmstodeg()
         return AngleDeg((self.alpha.hmstodeg() -
                                 hour_angle +
@@ -214,10 +241,10 @@ class Equatorial():
         """
         time = AstroDateTime(date)
         hour_angle = math.acos((math.sin(altitude_0*math.pi/180) -
-                    math.sin(location.latitude.dmstorad()) *
-                    math.sin(self.delta.dmstorad())) /
-                    (math.cos(location.latitude.dmstorad()) *
-                    math.cos(self.delta.dmstorad())))*180/math.pi
+                    location.latitude.sin() *
+                    self.delta.sin()) /
+                    (location.latitude.cos() *
+                    self.delta.cos()))*180/math.pi
         tsg0 = AngleHMS(AstroDateTime(time.date+(0, 0, 0)).get_gmst()).hmstodeg()
         return AngleDeg((self.alpha.hmstodeg() +
                                 hour_angle +
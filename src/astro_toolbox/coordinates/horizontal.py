@@ -21,6 +21,8 @@ class Horizontal():
     magnitude : float
         Object magnitude.
     """
+    __slots__ = ('name', 'azimuth', 'altitude', 'magnitude')
+
     def __init__(self, azimuth:
                 tuple | str,
                 altitude: tuple | str,
@@ -66,7 +68,7 @@ class Horizontal():
         float
             Object airmass.
         """
-        altitude = self.altitude
+        altitude = self.altitude.dmstodeg()
         if altitude < 0:
             return 40
         return abs(1/(math.sin(AngleDeg(altitude + 244/(165 + 47 * (altitude) ** 1.1)).degtorad())))
@@ -76,7 +78,9 @@ class Horizontal():
 
         .. math:: \\delta=sin^{-1}(sin \\Phi sin h-cos \\Phi cos h cos A)
 
-        .. math:: \\alpha=sin^{-1}(\\frac{-cosh cosA}{cos\\delta})-\\gamma
+        .. math:: H=atan2(-sin A cos h, cos\\Phi sin h-sin\\Phi cos h cos A)
+
+        .. math:: \\alpha=\\gamma-H
 
         Parameters
         ----------
@@ -91,12 +95,13 @@ class Horizontal():
             Object equatorial coordinates.
         """
         gamma_angle =  AngleHMS(gamma)
-        lat = location.latitude.dmstorad()
-        delta = AngleRad(math.asin(math.sin(lat) *
-                math.sin(self.altitude.dmstorad()) +
-                math.cos(lat) *
-                math.cos(self.altitude.dmstorad()) *
-                math.cos(self.azimuth.dmstorad())))
-        alpha = AngleRad(gamma_angle.hmstorad() - math.asin(-math.cos(self.altitude.dmstorad()) *
-                math.sin(self.azimuth.dmstorad()) / math.cos(delta.anglevalue)))
+        lat = location.latitude
+        delta = AngleRad(math.asin(lat.sin() *
+                self.altitude.sin() +
+                lat.cos() *
+                self.altitude.cos() *
+                self.azimuth.cos()))
+        alpha = AngleRad(gamma_angle.hmstorad() - math.atan2(-self.altitude.cos() *
+                self.azimuth.sin(), lat.cos() * self.altitude.sin() -
+                lat.sin() * self.altitude.cos() * self.azimuth.cos()))
         return alpha.radtohms(), delta.radtodms()
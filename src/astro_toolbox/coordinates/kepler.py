@@ -0,0 +1,121 @@
+"""This module contains the Kepler equation solver.
+"""
+import numpy as np
+
+def solve_kepler(mean_anomaly, eccentricity, tolerance: float = 1e-12,
+                 max_iterations: int = 50):
+    """Vectorized elliptic Kepler equation solver with Halley iterations.
+
+    .. math:: M = E - e sin E
+
+    The starter is :math:`E_0 = M + 0.85e` sign(sin M) (Danby, 1987), which
+    converges for all eccentricities below 1. Only elements that did not
+    converge yet are iterated.
+
+    .. math:: E_{i+1} = E_i - \\frac{f}{f' - \\frac{f f''}{2f'}}
+
+    Parameters
+    ----------
+    mean_anomaly : float | array_like
+        Mean anomalies in radians.
+    eccentricity : float | array_like
+        Eccentricities in [0, 1[, broadcast with mean anomalies.
+    tolerance : float, optional
+        Absolute convergence tolerance on E in radians, by default 1e-12.
+    max_iterations : int, optional
+        Maximum number of iterations, by default 50.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing eccentric anomalies in radians (within
+        [M - pi, M + pi]) and convergence flags.
+    """
+    mean_anomaly, eccentricity = np.broadcast_arrays(np.asarray(mean_anomaly, dtype=np.float64),
+                                                     np.asarray(eccentricity, dtype=np.float64))
+    turns = np.round(mean_anomaly/(2*np.pi)) * 2*np.pi
+    reduced_anomaly = (mean_anomaly - turns).ravel()
+    eccentricity = eccentricity.ravel()
+    eccentric_anomaly = reduced_anomaly + 0.85 * eccentricity * np.sign(np.sin(reduced_anomaly))
+    converged = np.zeros(eccentric_anomaly.shape, dtype=bool)
+    active = np.arange(eccentric_anomaly.size)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        anomaly, active_eccentricity = eccentric_anomaly[active], eccentricity[active]
+        e_sin = active_eccentricity * np.sin(anomaly)
+        e_cos = active_eccentricity * np.cos(anomaly)
+        function = anomaly - e_sin - reduced_anomaly[active]
+        derivative = 1 - e_cos
+        step = function / (derivative - function * e_sin / (2 * derivative))
+        eccentric_anomaly[active] = anomaly - step
+        done = np.abs(step) <= tolerance
+        converged[active[done]] = True
+        active = active[~done]
+    return ((eccentric_anomaly + turns.ravel()).reshape(mean_anomaly.shape),
+            converged.reshape(mean_anomaly.shape))
+
+def solve_hyperbolic_kepler(mean_anomaly, eccentricity, tolerance: float = 1e-12,
+                            max_iterations: int = 50):
+    """Vectorized hyperbolic Kepler equation solver with Newton iterations.
+
+    .. math:: M = e sinh H - H
+
+    The starter is :math:`H_0 = asinh(M/e)`. Only elements that did not
+    converge yet are iterated.
+
+    Parameters
+    ----------
+    mean_anomaly : float | array_like
+        Hyperbolic mean anomalies in radians.
+    eccentricity : float | array_like
+        Eccentricities above 1, broadcast with mean anomalies.
+    tolerance : float, optional
+        Relative convergence tolerance on H, by default 1e-12.
+    max_iterations : int, optional
+        Maximum number of iterations, by default 50.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing hyperbolic anomalies and convergence flags.
+    """
+    mean_anomaly, eccentricity = np.broadcast_arrays(np.asarray(mean_anomaly, dtype=np.float64),
+                                                     np.asarray(eccentricity, dtype=np.float64))
+    shape = mean_anomaly.shape
+    mean_anomaly, eccentricity = mean_anomaly.ravel(), eccentricity.ravel()
+    hyperbolic_anomaly = np.arcsinh(mean_anomaly / eccentricity)
+    converged = np.zeros(hyperbolic_anomaly.shape, dtype=bool)
+    active = np.arange(hyperbolic_anomaly.size)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        anomaly, active_eccentricity = hyperbolic_anomaly[active], eccentricity[active]
+        step = ((active_eccentricity * np.sinh(anomaly) - anomaly - mean_anomaly[active]) /
+                (active_eccentricity * np.cosh(anomaly) - 1))
+        hyperbolic_anomaly[active] = anomaly - step
+        done = np.abs(step) <= tolerance * np.maximum(1, np.abs(anomaly))
+        converged[active[done]] = True
+        active = active[~done]
+    return hyperbolic_anomaly.reshape(shape), converged.reshape(shape)
+
+def solve_barker(mean_anomaly):
+    """Barker equation solver for parabolic orbits.
+
+    .. math:: W = 3s + s^3, s = tan(\\frac{v}{2})
+
+    .. math:: s = Y - \\frac{1}{Y}, Y = \\sqrt[3]{\\frac{W}{2} + \\sqrt{\\frac{W^2}{4} + 1}}
+
+    Parameters
+    ----------
+    mean_anomaly : float | array_like
+        Parabolic mean anomalies :math:`W = 3\\sqrt{\\frac{GM}{2q^3}}(t - T)`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Tangents of half true anomalies.
+    """
+    mean_anomaly = np.asarray(mean_anomaly, dtype=np.float64)
+    root = np.cbrt(np.abs(mean_anomaly)/2 + np.sqrt(mean_anomaly**2/4 + 1))
+    return np.copysign(root - 1/root, mean_anomaly)
@@ -1,12 +1,10 @@
 """This module contains Location class.
 """
 import re
-import json
-import pkg_resources
 from astro_toolbox.angle.dms import AngleDMS
+from astro_toolbox.coordinates.sites import SiteRegistry
 from astro_toolbox.utils.strparser import angle_parser
 
-PATH = pkg_resources.resource_filename('astro_toolbox', 'coordinates/data/')
 class Location():
     """This class represents the observer location.
 
@@ -36,13 +34,15 @@ class Location():
         elevation : float, optional
             Location elevation (m), by default 0.0.
         """
+        registry = SiteRegistry.get_registry()
         if name is None:
-            dict_site = self._get_site()
+            dict_site = registry.get()
             name = list(dict_site.keys())[0]
         else:
             try:
-                dict_site = self._get_site(name=name)
+                dict_site = registry.get(name)
                 name = list(dict_site.keys())[0]
+                registry.set_last_site(name)
             except ValueError:
                 pass
         if latitude is None:
@@ -100,87 +100,33 @@ class Location():
 
         Raises
         ------
-        KeyError
-            The first level key already exist.
+        ValueError
+            The site already exist.
         """
-        with open(PATH  + 'sites.json', encoding="utf-8") as json_file:
-            dict_sites = json.load(json_file)
-        if self.name.lower() not in [key.lower() for key in dict_sites]:
-            new_dict_sites = self.current_site
-            new_dict_sites.update(dict_sites)
-            with open(PATH  + 'sites.json', 'w', encoding="utf-8") as json_file:
-                json.dump(new_dict_sites, json_file, indent=4)
-            return None
-        raise ValueError("Site already exist, use `update_site` instead")
+        registry = SiteRegistry.get_registry()
+        registry.add(self.name, self.current_site[self.name])
+        registry.flush()
 
     def delete_site(self):
         """Method to delete current site from saved sites file.
 
         Raises
         ------
-        KeyError
-            The first level key doesn't exist.
+        ValueError
+            The site doesn't exist.
         """
-        with open(PATH  + 'sites.json', encoding="utf-8") as json_file:
-            dict_sites = json.load(json_file)
-        if self.name.lower() in list(key.lower() for key in dict_sites):
-            keys = list(key for key in dict_sites)
-            idx = list(key.lower() for key in dict_sites).index(self.name.lower())
-            del dict_sites[keys[idx]]
-            with open(PATH  + 'sites.json', 'w', encoding="utf-8") as json_file:
-                json.dump(dict_sites, json_file, indent=4)
-            return None
-        raise ValueError("Site already exist, use `update_site` instead")
+        registry = SiteRegistry.get_registry()
+        registry.delete(self.name)
+        registry.flush()
+
     def update_site(self):
         """Method to update current site in saved sites file.
 
         Raises
         ------
-        KeyError
-            The first level key doesn't exist.
-        """
-        with open(PATH  + 'sites.json', encoding="utf-8") as json_file:
-            dict_sites = json.load(json_file)
-        if self.name.lower() in list(key.lower() for key in dict_sites):
-            keys = list(key for key in dict_sites)
-            idx = [key.lower() for key in dict_sites].index(self.name.lower())
-            for key in dict_sites[keys[idx]]:
-                dict_sites[keys[idx]][key] = self.current_site[self.name][key]
-            with open(PATH  + 'sites.json', 'w', encoding="utf-8") as json_file:
-                json.dump(dict_sites, json_file, indent=4)
-            return None
-        raise ValueError("Site doesn't exist")
-
-    def _get_site(self, name: str = None):
-        """Method to get a site with it data.
-
-        Parameters
-        ----------
-        name : str, optional
-            The site name, by default None.
-
-        Returns
-        -------
-        dict
-            The location dictionary from its saved data in saved sites file.
-
-        Raises
-        ------
-        KeyError
-            The first level key doesn't exist.
         ValueError
-            The site name is not given.
+            The site doesn't exist.
         """
-        with open(PATH  + 'sites.json', encoding="utf-8") as json_file:
-            dict_sites = json.load(json_file)
-        if name is None:
-            name = list(dict_sites.keys())[0]
-        if name.lower() in [key.lower() for key in dict_sites.keys()]:
-            keys = list(key for key in dict_sites)
-            idx = list(key.lower() for key in dict_sites).index(name.lower())
-            dict_site = dict_sites[keys[idx]]
-            new_dict_sites = {keys[idx]: dict_sites.pop(keys[idx]), **dict_sites}
-            with open(PATH  + 'sites.json', 'w', encoding="utf-8") as json_file:
-                json.dump(new_dict_sites, json_file, indent=4)
-            return {keys[idx]: dict_site}
-        raise ValueError(f"{name} site doesn't exist")
+        registry = SiteRegistry.get_registry()
+        registry.update(self.name, self.current_site[self.name])
+        registry.flush()
@@ -0,0 +1,311 @@
+"""This module contains low-precision Sun and Moon theories (Meeus, Astronomical
+Algorithms, chapters 25 and 47) vectorized over epochs.
+
+The Sun is accurate to about 0.01° and the Moon, truncated to its main periodic
+terms, to about 0.01° in longitude and latitude. Coordinates are referred to the
+mean equator and equinox of date, so that they do not need to be precessed.
+"""
+import numpy as np
+
+from astro_toolbox.coordinates.arrays import EquatorialArray
+from astro_toolbox.coordinates.location import Location
+from astro_toolbox.time.arrays import AstroTimeArray
+
+ASTRONOMICAL_UNIT = 149597870.700
+EARTH_EQUATORIAL_RADIUS = 6378.14
+EARTH_FLATTENING_RATIO = 0.99664719
+RISE_SET_ALTITUDE = -0.833
+
+# Moon periodic terms (D, M, M', F, longitude 1e-6 deg, distance 1e-3 km)
+MOON_LONGITUDE_DISTANCE_TERMS = np.array([
+    (0, 0, 1, 0, 6288774, -20905355),
+    (2, 0, -1, 0, 1274027, -3699111),
+    (2, 0, 0, 0, 658314, -2955968),
+    (0, 0, 2, 0, 213618, -569925),
+    (0, 1, 0, 0, -185116, 48888),
+    (0, 0, 0, 2, -114332, -3149),
+    (2, 0, -2, 0, 58793, 246158),
+    (2, -1, -1, 0, 57066, -152138),
+    (2, 0, 1, 0, 53322, -170733),
+    (2, -1, 0, 0, 45758, -204586),
+    (0, 1, -1, 0, -40923, -129620),
+    (1, 0, 0, 0, -34720, 108743),
+    (0, 1, 1, 0, -30383, 104755),
+    (2, 0, 0, -2, 15327, 10321),
+    (0, 0, 1, 2, -12528, 0),
+    (0, 0, 1, -2, 10980, 79661),
+    (4, 0, -1, 0, 10675, -34782),
+    (0, 0, 3, 0, 10034, -23210),
+    (4, 0, -2, 0, 8548, -21636),
+    (2, 1, -1, 0, -7888, 24208),
+    (2, 1, 0, 0, -6766, 30824),
+    (1, 0, -1, 0, -5163, -8379),
+    (1, 1, 0, 0, 4987, -16675),
+    (2, -1, 1, 0, 4036, -12831),
+    (2, 0, 2, 0, 3994, -10445)], dtype=np.float64)
+
+# Moon periodic terms (D, M, M', F, latitude 1e-6 deg)
+MOON_LATITUDE_TERMS = np.array([
+    (0, 0, 0, 1, 5128122),
+    (0, 0, 1, 1, 280602),
+    (0, 0, 1, -1, 277693),
+    (2, 0, 0, -1, 173237),
+    (2, 0, -1, 1, 55413),
+    (2, 0, -1, -1, 46271),
+    (2, 0, 0, 1, 32573),
+    (0, 0, 2, 1, 17198),
+    (2, 0, 1, -1, 9266),
+    (0, 0, 2, -1, 8822),
+    (2, -1, 0, -1, 8216),
+    (2, 0, -2, -1, 4324),
+    (2, 0, 1, 1, 4200),
+    (2, 1, 0, -1, -3359),
+    (2, -1, -1, 1, 2463)], dtype=np.float64)
+
+def _centuries(times):
+    """Epochs to Julian centuries from J2000 converting function.
+
+    Parameters
+    ----------
+    times : float | array_like | AstroTimeArray
+        Julian days or AstroTimeArray.
+
+    Returns
+    -------
+    numpy.ndarray
+        Julian centuries from J2000.
+    """
+    if isinstance(times, AstroTimeArray):
+        times = times.get_jd()
+    return (np.asarray(times, dtype=np.float64) - 2451545.0)/36525
+
+def mean_obliquity(centuries):
+    """Mean obliquity of the ecliptic calculation function (Laskar, 1986).
+
+    Parameters
+    ----------
+    centuries : float | numpy.ndarray
+        Julian centuries from J2000.
+
+    Returns
+    -------
+    float | numpy.ndarray
+        Mean obliquity in degrees.
+    """
+    return (23.439291111111111 - 0.013004166666666667 * centuries -
+            1.6388888888888888e-07 * centuries**2 + 5.036111111111111e-07 * centuries**3)
+
+def _ecliptic_to_equatorial(longitude, latitude, obliquity):
+    """Ecliptic to equatorial coordinates converting function.
+
+    .. math:: \\alpha = atan2(sin\\lambda cos\\epsilon - tan\\beta sin\\epsilon, cos\\lambda)
+
+    .. math:: \\delta = asin(sin\\beta cos\\epsilon + cos\\beta sin\\epsilon sin\\lambda)
+
+    Parameters
+    ----------
+    longitude : numpy.ndarray
+        Ecliptic longitudes in radians.
+    latitude : numpy.ndarray
+        Ecliptic latitudes in radians.
+    obliquity : numpy.ndarray
+        Obliquities in radians.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing right-ascensions within [0, 2pi[ and
+        declinations in radians.
+    """
+    return (np.mod(np.arctan2(np.sin(longitude) * np.cos(obliquity) -
+                              np.tan(latitude) * np.sin(obliquity),
+                              np.cos(longitude)), 2*np.pi),
+            np.arcsin(np.sin(latitude) * np.cos(obliquity) +
+                      np.cos(latitude) * np.sin(obliquity) * np.sin(longitude)))
+
+def sun_position(times):
+    """Geocentric apparent Sun position calculation function (Meeus, chapter 25).
+
+    .. math:: \\odot = L_0 + C, \\lambda = \\odot - 0.00569° - 0.00478° sin\\Omega
+
+    .. math:: R = \\frac{1.000001018(1 - e^2)}{1 + e cos(M + C)}
+
+    Parameters
+    ----------
+    times : float | array_like | AstroTimeArray
+        Julian days or AstroTimeArray.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing right-ascensions within [0, 2pi[ and declinations
+        in radians and geocentric distances in km.
+    """
+    centuries = _centuries(times)
+    mean_longitude = 280.46646 + 36000.76983 * centuries + 0.0003032 * centuries**2
+    mean_anomaly = np.radians(357.52911 + 35999.05029 * centuries -
+                              0.0001537 * centuries**2)
+    eccentricity = 0.016708634 - 0.000042037 * centuries - 0.0000001267 * centuries**2
+    center = ((1.914602 - 0.004817 * centuries - 0.000014 * centuries**2) *
+              np.sin(mean_anomaly) +
+              (0.019993 - 0.000101 * centuries) * np.sin(2 * mean_anomaly) +
+              0.000289 * np.sin(3 * mean_anomaly))
+    radius = (1.000001018 * (1 - eccentricity**2) /
+              (1 + eccentricity * np.cos(mean_anomaly + np.radians(center))))
+    node = np.radians(125.04 - 1934.136 * centuries)
+    longitude = np.radians(mean_longitude + center - 0.00569 - 0.00478 * np.sin(node))
+    obliquity = np.radians(mean_obliquity(centuries) + 0.00256 * np.cos(node))
+    right_ascension, declination = _ecliptic_to_equatorial(longitude, np.zeros_like(longitude),
+                                                           obliquity)
+    return right_ascension, declination, radius * ASTRONOMICAL_UNIT
+
+def moon_position(times):
+    """Geocentric Moon position calculation function with the main periodic terms
+    of the ELP-2000/82 truncated theory (Meeus, chapter 47).
+
+    .. math:: \\lambda = L' + \\sum l, \\beta = \\sum b, \\Delta = 385000.56 + \\sum r
+
+    Terms depending on the Sun mean anomaly M are multiplied by
+    :math:`E^{|M|}` with :math:`E = 1 - 0.002516T - 0.0000074T^2`.
+
+    Parameters
+    ----------
+    times : float | array_like | AstroTimeArray
+        Julian days or AstroTimeArray.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing right-ascensions within [0, 2pi[ and declinations
+        in radians and geocentric distances in km.
+    """
+    centuries = _centuries(times)
+    mean_longitude = (218.3164477 + 481267.88123421 * centuries -
+                      0.0015786 * centuries**2 + centuries**3/538841 -
+                      centuries**4/65194000)
+    arguments = np.radians(np.stack((
+        297.8501921 + 445267.1114034 * centuries - 0.0018819 * centuries**2 +
+        centuries**3/545868 - centuries**4/113065000,
+        357.5291092 + 35999.0502909 * centuries - 0.0001536 * centuries**2 +
+        centuries**3/24490000,
+        134.9633964 + 477198.8675055 * centuries + 0.0087414 * centuries**2 +
+        centuries**3/69699 - centuries**4/14712000,
+        93.2720950 + 483202.0175233 * centuries - 0.0036539 * centuries**2 -
+        centuries**3/3526000 + centuries**4/863310000), axis=-1))
+    eccentricity = 1 - 0.002516 * centuries - 0.0000074 * centuries**2
+    phases = arguments @ MOON_LONGITUDE_DISTANCE_TERMS[:, :4].T
+    factors = eccentricity[..., np.newaxis]**np.abs(MOON_LONGITUDE_DISTANCE_TERMS[:, 1])
+    longitude_sum = np.sum(factors * MOON_LONGITUDE_DISTANCE_TERMS[:, 4] * np.sin(phases),
+                           axis=-1)
+    distance_sum = np.sum(factors * MOON_LONGITUDE_DISTANCE_TERMS[:, 5] * np.cos(phases),
+                          axis=-1)
+    phases = arguments @ MOON_LATITUDE_TERMS[:, :4].T
+    factors = eccentricity[..., np.newaxis]**np.abs(MOON_LATITUDE_TERMS[:, 1])
+    latitude_sum = np.sum(factors * MOON_LATITUDE_TERMS[:, 4] * np.sin(phases), axis=-1)
+    a_1 = np.radians(119.75 + 131.849 * centuries)
+    a_2 = np.radians(53.09 + 479264.290 * centuries)
+    a_3 = np.radians(313.45 + 481266.484 * centuries)
+    mean_longitude_rad = np.radians(mean_longitude)
+    longitude_sum += (3958 * np.sin(a_1) + 1962 * np.sin(mean_longitude_rad - arguments[..., 3]) +
+                      318 * np.sin(a_2))
+    latitude_sum += (-2235 * np.sin(mean_longitude_rad) + 382 * np.sin(a_3) +
+                     175 * np.sin(a_1 - arguments[..., 3]) +
+                     175 * np.sin(a_1 + arguments[..., 3]) +
+                     127 * np.sin(mean_longitude_rad - arguments[..., 2]) -
+                     115 * np.sin(mean_longitude_rad + arguments[..., 2]))
+    right_ascension, declination = _ecliptic_to_equatorial(
+                                        np.radians(mean_longitude + longitude_sum/1e6),
+                                        np.radians(latitude_sum/1e6),
+                                        np.radians(mean_obliquity(centuries)))
+    return right_ascension, declination, 385000.56 + distance_sum/1000
+
+def topocentric_position(alpha, delta, distance, lst, location: Location):
+    """Geocentric to topocentric equatorial coordinates converting function
+    (Meeus, chapter 40).
+
+    .. math:: \\Delta\\alpha = atan2(-\\rho cos\\phi' sin\\pi sinH, cos\\delta - \\rho cos\\phi' sin\\pi cosH)
+
+    .. math:: \\delta' = atan2((sin\\delta - \\rho sin\\phi' sin\\pi)cos\\Delta\\alpha, cos\\delta - \\rho cos\\phi' sin\\pi cosH)
+
+    Parameters
+    ----------
+    alpha : float | array_like
+        Geocentric right-ascensions in radians.
+    delta : float | array_like
+        Geocentric declinations in radians.
+    distance : float | array_like
+        Geocentric distances in km.
+    lst : float | array_like
+        Local sidereal times in radians (c.f. `AstroTimeArray.get_lst`).
+    location : Location
+        Observer location.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing topocentric right-ascensions within [0, 2pi[ and
+        declinations in radians.
+    """
+    latitude = location.latitude.dmstorad()
+    reduced_latitude = np.arctan(EARTH_FLATTENING_RATIO * np.tan(latitude))
+    height = location.elevation / 1000 / EARTH_EQUATORIAL_RADIUS
+    rho_sin = (EARTH_FLATTENING_RATIO * np.sin(reduced_latitude) +
+               height * np.sin(latitude))
+    rho_cos = np.cos(reduced_latitude) + height * np.cos(latitude)
+    sin_parallax = EARTH_EQUATORIAL_RADIUS / np.asarray(distance, dtype=np.float64)
+    hour_angle = np.asarray(lst, dtype=np.float64) - alpha
+    denominator = np.cos(delta) - rho_cos * sin_parallax * np.cos(hour_angle)
+    delta_alpha = np.arctan2(-rho_cos * sin_parallax * np.sin(hour_angle), denominator)
+    return (np.mod(alpha + delta_alpha, 2*np.pi),
+            np.arctan2((np.sin(delta) - rho_sin * sin_parallax) * np.cos(delta_alpha),
+                       denominator))
+
+def get_altitudes(times, location: Location):
+    """Sun and topocentric Moon altitudes calculation function.
+
+    Parameters
+    ----------
+    times : array_like | AstroTimeArray
+        Julian days or AstroTimeArray.
+    location : Location
+        Observer location.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing Sun and Moon altitudes in radians.
+    """
+    times = AstroTimeArray(times)
+    lst = times.get_lst(location)
+    sun_alpha, sun_delta = sun_position(times)[:2]
+    moon_alpha, moon_delta = topocentric_position(*moon_position(times), lst, location)
+    bodies = EquatorialArray(np.degrees(np.concatenate((sun_alpha, moon_alpha))),
+                             np.degrees(np.concatenate((sun_delta, moon_delta))))
+    altitudes = bodies.to_horizontal(np.concatenate((lst, lst)), location).altitude.torad()
+    return altitudes[:len(times)], altitudes[len(times):]
+
+def get_crossings(hours, altitudes, altitude_0: float = 0.0):
+    """Rising and setting times calculation by linear interpolation of altitudes
+    sign changes.
+
+    Parameters
+    ----------
+    hours : array_like
+        Sampling hours.
+    altitudes : array_like
+        Altitudes in radians.
+    altitude_0 : float, optional
+        Horizon altitude in degrees, by default 0.0.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing rising and setting hours.
+    """
+    hours = np.asarray(hours, dtype=np.float64)
+    heights = np.asarray(altitudes, dtype=np.float64) - np.radians(altitude_0)
+    crossing = np.flatnonzero(np.signbit(heights[:-1]) != np.signbit(heights[1:]))
+    times = (hours[crossing] - heights[crossing] * (hours[crossing + 1] - hours[crossing]) /
+             (heights[crossing + 1] - heights[crossing]))
+    rising = heights[crossing] < 0
+    return times[rising], times[~rising]
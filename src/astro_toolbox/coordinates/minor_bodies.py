@@ -0,0 +1,425 @@
+"""This module contains MinorBodies class propagating asteroids and comets from
+MPC orbital elements files.
+"""
+import numpy as np
+
+from astro_toolbox.coordinates.arrays import EquatorialArray
+from astro_toolbox.coordinates.kepler import solve_barker
+from astro_toolbox.coordinates.kepler import solve_hyperbolic_kepler
+from astro_toolbox.coordinates.kepler import solve_kepler
+from astro_toolbox.coordinates.solar_system import ASTRONOMICAL_UNIT
+from astro_toolbox.coordinates.solar_system import compute_ecliptic_positions
+from astro_toolbox.coordinates.solar_system import load_orbital_elements
+from astro_toolbox.time.arrays import AstroTimeArray
+
+GAUSSIAN_GRAVITATIONAL_CONSTANT = 0.01720209895
+LIGHT_TIME_PER_AU = 0.0057755183
+J2000_OBLIQUITY = np.radians(23.4392911)
+
+def unpack_epoch(packed: str):
+    """MPC packed date to calendar date converting function (e.g. ``K24AH`` is 2024-10-17).
+
+    Parameters
+    ----------
+    packed : str
+        MPC packed date.
+
+    Returns
+    -------
+    tuple
+        Tuple containing year, month and day.
+    """
+    return (int(packed[0], 36) * 100 + int(packed[1:3]),
+            int(packed[3], 32), int(packed[4], 32))
+
+def _field(line: str, start: int, stop: int):
+    """Fixed-width float field parsing with 1-based inclusive columns,
+    blank fields are NaN.
+
+    Parameters
+    ----------
+    line : str
+        File line.
+    start : int
+        First column.
+    stop : int
+        Last column.
+
+    Returns
+    -------
+    float
+        Field value.
+    """
+    value = line[start - 1:stop].strip()
+    return float(value) if value else np.nan
+
+def _ecliptic_to_equatorial(x_ecliptic, y_ecliptic, z_ecliptic):
+    """J2000 ecliptic to equatorial rectangular coordinates rotation.
+
+    Parameters
+    ----------
+    x_ecliptic : numpy.ndarray
+        Ecliptic x coordinates.
+    y_ecliptic : numpy.ndarray
+        Ecliptic y coordinates.
+    z_ecliptic : numpy.ndarray
+        Ecliptic z coordinates.
+
+    Returns
+    -------
+    tuple
+        Tuple containing equatorial x, y and z coordinates.
+    """
+    return (x_ecliptic,
+            y_ecliptic * np.cos(J2000_OBLIQUITY) - z_ecliptic * np.sin(J2000_OBLIQUITY),
+            y_ecliptic * np.sin(J2000_OBLIQUITY) + z_ecliptic * np.cos(J2000_OBLIQUITY))
+
+class MinorBodies():
+    """MinorBodies class propagating asteroids and comets orbits in one vectorized pass.
+
+    Orbits are stored as columnar perihelion elements referred to the J2000 ecliptic,
+    elliptic, parabolic and hyperbolic orbits are propagated with the two-body problem.
+
+    Attributes
+    ----------
+    name : list
+        Objects names.
+    perihelion_distance : numpy.ndarray
+        Perihelion distances in AU.
+    eccentricity : numpy.ndarray
+        Eccentricities.
+    inclination : numpy.ndarray
+        Inclinations in radians.
+    node : numpy.ndarray
+        Longitudes of ascending nodes in radians.
+    perihelion : numpy.ndarray
+        Arguments of perihelion in radians.
+    perihelion_time : numpy.ndarray
+        Perihelion passages as Julian days.
+    absolute_magnitude : numpy.ndarray
+        Absolute magnitudes H.
+    slope : numpy.ndarray
+        Slope parameters, G for asteroids and K for comets.
+    comet : numpy.ndarray
+        Comets flags, comets magnitudes follow :math:`m = H + 5log\\Delta + 2.5Klog r`.
+    """
+    def __init__(self, name: list, perihelion_distance, eccentricity, inclination, node,
+                 perihelion, perihelion_time, absolute_magnitude=None, slope=None,
+                 comet=None):
+        """Constructor method
+
+        Parameters
+        ----------
+        name : list
+            Objects names.
+        perihelion_distance : array_like
+            Perihelion distances in AU.
+        eccentricity : array_like
+            Eccentricities.
+        inclination : array_like
+            Inclinations in degrees.
+        node : array_like
+            Longitudes of ascending nodes in degrees.
+        perihelion : array_like
+            Arguments of perihelion in degrees.
+        perihelion_time : array_like
+            Perihelion passages as Julian days.
+        absolute_magnitude : array_like, optional
+            Absolute magnitudes, by default None (NaN).
+        slope : array_like, optional
+            Slope parameters, by default None (0.15 for asteroids and 4.0 for comets).
+        comet : array_like, optional
+            Comets flags, by default None (all asteroids).
+        """
+        self.name = list(name)
+        length = len(self.name)
+        self.perihelion_distance = np.asarray(perihelion_distance, dtype=np.float64)
+        self.eccentricity = np.asarray(eccentricity, dtype=np.float64)
+        self.inclination = np.radians(np.asarray(inclination, dtype=np.float64))
+        self.node = np.radians(np.asarray(node, dtype=np.float64))
+        self.perihelion = np.radians(np.asarray(perihelion, dtype=np.float64))
+        self.perihelion_time = np.asarray(perihelion_time, dtype=np.float64)
+        self.comet = (np.zeros(length, dtype=bool) if comet is None
+                      else np.asarray(comet, dtype=bool))
+        self.absolute_magnitude = (np.full(length, np.nan) if absolute_magnitude is None
+                                   else np.asarray(absolute_magnitude, dtype=np.float64))
+        self.slope = (np.where(self.comet, 4.0, 0.15) if slope is None
+                      else np.asarray(slope, dtype=np.float64))
+
+    @classmethod
+    def from_mpcorb(cls, lines):
+        """Build MinorBodies from MPCORB.DAT format asteroids elements (header lines
+        and lines without elements are skipped).
+
+        Parameters
+        ----------
+        lines : str | iterable
+            File path or lines.
+
+        Returns
+        -------
+        MinorBodies
+            Asteroids orbits.
+        """
+        if isinstance(lines, str):
+            with open(lines, encoding="utf-8") as mpc_file:
+                return cls.from_mpcorb(mpc_file.readlines())
+        rows, names, epochs = [], [], []
+        for line in lines:
+            if len(line) < 103 or not line[20:25].strip().isalnum():
+                continue
+            try:
+                row = [_field(line, *columns) for columns in
+                       ((9, 13), (15, 19), (27, 35), (38, 46), (49, 57), (60, 68),
+                        (71, 79), (81, 91), (93, 103))]
+                epoch = unpack_epoch(line[20:25]) + (0, 0, 0)
+            except ValueError:
+                continue
+            rows.append(row)
+            epochs.append(epoch)
+            names.append(line[166:194].strip() or line[0:7].strip())
+        (absolute_magnitude, slope, mean_anomaly, perihelion, node, inclination,
+         eccentricity, mean_motion,
+         semi_major_axis) = np.array(rows, dtype=np.float64).reshape(-1, 9).T
+        epochs = AstroTimeArray.calendar_to_jd(np.array(epochs, dtype=np.float64).reshape(-1, 6))
+        return cls(names, semi_major_axis * (1 - eccentricity), eccentricity, inclination,
+                   node, perihelion, epochs - mean_anomaly / mean_motion,
+                   absolute_magnitude=absolute_magnitude,
+                   slope=np.where(np.isnan(slope), 0.15, slope))
+
+    @classmethod
+    def from_comet_elements(cls, lines):
+        """Build MinorBodies from MPC CometEls.txt format comets elements.
+
+        Parameters
+        ----------
+        lines : str | iterable
+            File path or lines.
+
+        Returns
+        -------
+        MinorBodies
+            Comets orbits.
+        """
+        if isinstance(lines, str):
+            with open(lines, encoding="utf-8") as mpc_file:
+                return cls.from_comet_elements(mpc_file.readlines())
+        rows, names, passages = [], [], []
+        for line in lines:
+            if len(line) < 100:
+                continue
+            try:
+                row = [_field(line, *columns) for columns in
+                       ((31, 39), (42, 49), (52, 59), (62, 69), (72, 79), (92, 95), (97, 100))]
+                day = float(line[22:29])
+                passage = (int(line[14:18]), int(line[19:21]), int(day), (day % 1) * 24, 0, 0)
+            except ValueError:
+                continue
+            rows.append(row)
+            passages.append(passage)
+            names.append(line[102:158].strip())
+        (perihelion_distance, eccentricity, perihelion, node, inclination,
+         absolute_magnitude, slope) = np.array(rows, dtype=np.float64).reshape(-1, 7).T
+        return cls(names, perihelion_distance, eccentricity, inclination, node, perihelion,
+                   AstroTimeArray.calendar_to_jd(np.array(passages,
+                                                          dtype=np.float64).reshape(-1, 6)),
+                   absolute_magnitude=absolute_magnitude,
+                   slope=np.where(np.isnan(slope), 4.0, slope),
+                   comet=np.ones(len(names), dtype=bool))
+
+    def __repr__(self):
+        """Representative method.
+
+        Returns
+        -------
+        str
+            Return a class representative string.
+        """
+        return f'MinorBodies({len(self)} objects, {int(np.sum(self.comet))} comets)'
+
+    def __len__(self):
+        """Length method.
+
+        Returns
+        -------
+        int
+            Number of objects.
+        """
+        return len(self.name)
+
+    def __getitem__(self, index):
+        """Indexing method.
+
+        Parameters
+        ----------
+        index : int | slice | array_like
+            Index, slice or mask.
+
+        Returns
+        -------
+        MinorBodies
+            Selected objects.
+        """
+        index = np.atleast_1d(np.arange(len(self))[index])
+        return MinorBodies([self.name[item] for item in index],
+                           self.perihelion_distance[index], self.eccentricity[index],
+                           np.degrees(self.inclination[index]), np.degrees(self.node[index]),
+                           np.degrees(self.perihelion[index]), self.perihelion_time[index],
+                           self.absolute_magnitude[index], self.slope[index],
+                           self.comet[index])
+
+    def get_heliocentric_position(self, julian_days):
+        """Compute J2000 heliocentric equatorial positions.
+
+        Elliptic orbits are solved with `solve_kepler`, hyperbolic orbits with
+        `solve_hyperbolic_kepler` and parabolic orbits with `solve_barker`.
+
+        .. math:: r = \\frac{q(1 + e)}{1 + e cos v}
+
+        Parameters
+        ----------
+        julian_days : numpy.ndarray
+            Julian days of shape (epochs) or (objects, epochs).
+
+        Returns
+        -------
+        numpy.ndarray
+            Positions in AU of shape (objects, 3, epochs).
+        """
+        delta_time = np.asarray(julian_days, dtype=np.float64) - self.perihelion_time[:, np.newaxis]
+        distance = self.perihelion_distance[:, np.newaxis]
+        eccentricity = np.broadcast_to(self.eccentricity[:, np.newaxis], delta_time.shape)
+        true_anomaly = np.empty(delta_time.shape)
+        elliptic = eccentricity < 1 - 1e-10
+        hyperbolic = eccentricity > 1 + 1e-10
+        parabolic = ~elliptic & ~hyperbolic
+        semi_major_axis = distance / np.where(parabolic, 1, np.abs(1 - eccentricity))
+        mean_anomaly = GAUSSIAN_GRAVITATIONAL_CONSTANT * delta_time / np.sqrt(semi_major_axis**3)
+        if elliptic.any():
+            eccentric_anomaly = solve_kepler(mean_anomaly[elliptic], eccentricity[elliptic])[0]
+            true_anomaly[elliptic] = 2 * np.arctan2(
+                np.sqrt(1 + eccentricity[elliptic]) * np.sin(eccentric_anomaly/2),
+                np.sqrt(1 - eccentricity[elliptic]) * np.cos(eccentric_anomaly/2))
+        if hyperbolic.any():
+            hyperbolic_anomaly = solve_hyperbolic_kepler(mean_anomaly[hyperbolic],
+                                                         eccentricity[hyperbolic])[0]
+            true_anomaly[hyperbolic] = 2 * np.arctan(
+                np.sqrt((eccentricity[hyperbolic] + 1)/(eccentricity[hyperbolic] - 1)) *
+                np.tanh(hyperbolic_anomaly/2))
+        if parabolic.any():
+            true_anomaly[parabolic] = 2 * np.arctan(solve_barker(
+                3 * GAUSSIAN_GRAVITATIONAL_CONSTANT * delta_time[parabolic] /
+                np.sqrt(2 * np.broadcast_to(distance, delta_time.shape)[parabolic]**3)))
+        radius = distance * (1 + eccentricity) / (1 + eccentricity * np.cos(true_anomaly))
+        argument = true_anomaly + self.perihelion[:, np.newaxis]
+        node = self.node[:, np.newaxis]
+        inclination = self.inclination[:, np.newaxis]
+        x_ecliptic = radius * (np.cos(node) * np.cos(argument) -
+                               np.sin(node) * np.sin(argument) * np.cos(inclination))
+        y_ecliptic = radius * (np.sin(node) * np.cos(argument) +
+                               np.cos(node) * np.sin(argument) * np.cos(inclination))
+        z_ecliptic = radius * np.sin(argument) * np.sin(inclination)
+        return np.stack(_ecliptic_to_equatorial(x_ecliptic, y_ecliptic, z_ecliptic), axis=1)
+
+    @staticmethod
+    def get_earth_position(julian_days):
+        """Compute J2000 heliocentric equatorial Earth positions from the Earth-Moon
+        barycenter orbital elements (c.f. `compute_ecliptic_positions`).
+
+        Parameters
+        ----------
+        julian_days : numpy.ndarray
+            Julian days.
+
+        Returns
+        -------
+        numpy.ndarray
+            Positions in AU of shape (3, epochs).
+        """
+        names, table = load_orbital_elements()
+        earth = table[[list(names).index('em bary')]]
+        position = compute_ecliptic_positions(earth, (np.asarray(julian_days) - 2451545)/36525)[2]
+        return np.stack(_ecliptic_to_equatorial(*position[0] / ASTRONOMICAL_UNIT))
+
+    def get_equatorial_array(self, times):
+        """Calculate J2000 astrometric equatorial coordinates, corrected for light time.
+
+        Parameters
+        ----------
+        times : float | array_like | AstroTimeArray
+            Julian days or AstroTimeArray.
+
+        Returns
+        -------
+        tuple
+            Tuple of arrays of shape (objects, epochs) containing right-ascensions within
+            [0, 2pi[ and declinations in radians, geocentric and heliocentric distances
+            in AU.
+        """
+        julian_days = np.atleast_1d(times.get_jd() if isinstance(times, AstroTimeArray)
+                                    else np.asarray(times, dtype=np.float64))
+        earth = self.get_earth_position(julian_days)
+        position = self.get_heliocentric_position(julian_days) - earth
+        distance = np.linalg.norm(position, axis=1)
+        heliocentric = self.get_heliocentric_position(julian_days - LIGHT_TIME_PER_AU * distance)
+        position = heliocentric - earth
+        distance = np.linalg.norm(position, axis=1)
+        return (np.mod(np.arctan2(position[:, 1], position[:, 0]), 2*np.pi),
+                np.arcsin(position[:, 2] / distance),
+                distance,
+                np.linalg.norm(heliocentric, axis=1))
+
+    def get_magnitude(self, times):
+        """Calculate apparent magnitudes.
+
+        Asteroids follow the H, G system (Bowell et al., 1989) and comets the total
+        magnitude law:
+
+        .. math:: m = H + 5log(r\\Delta) - 2.5log((1 - G)\\Phi_1 + G\\Phi_2)
+
+        .. math:: m = H + 5log\\Delta + 2.5Klog r
+
+        Parameters
+        ----------
+        times : float | array_like | AstroTimeArray
+            Julian days or AstroTimeArray.
+
+        Returns
+        -------
+        numpy.ndarray
+            Magnitudes of shape (objects, epochs).
+        """
+        julian_days = np.atleast_1d(times.get_jd() if isinstance(times, AstroTimeArray)
+                                    else np.asarray(times, dtype=np.float64))
+        distance, radius = self.get_equatorial_array(julian_days)[2:]
+        sun_distance = np.linalg.norm(self.get_earth_position(julian_days), axis=0)
+        phase = np.arccos(np.clip((radius**2 + distance**2 - sun_distance**2) /
+                                  (2 * radius * distance), -1, 1))
+        half_phase = np.tan(phase/2)
+        slope = self.slope[:, np.newaxis]
+        asteroid = (self.absolute_magnitude[:, np.newaxis] + 5 * np.log10(radius * distance) -
+                    2.5 * np.log10((1 - slope) * np.exp(-3.33 * half_phase**0.63) +
+                                   slope * np.exp(-1.87 * half_phase**1.22)))
+        comet = (self.absolute_magnitude[:, np.newaxis] + 5 * np.log10(distance) +
+                 2.5 * slope * np.log10(radius))
+        return np.where(self.comet[:, np.newaxis], comet, asteroid)
+
+    def to_equatorial_array(self, time):
+        """Get all objects coordinates at one epoch, to be used by airmass calculations
+        (c.f. `get_multi_site_airmasses`).
+
+        Parameters
+        ----------
+        time : float | AstroTimeArray
+            Julian day or AstroTimeArray of one instant.
+
+        Returns
+        -------
+        EquatorialArray
+            Objects J2000 coordinates with names and magnitudes.
+        """
+        right_ascension, declination = self.get_equatorial_array(time)[:2]
+        return EquatorialArray(np.degrees(right_ascension[:, 0]),
+                               np.degrees(declination[:, 0]),
+                               name=self.name,
+                               magnitude=np.round(self.get_magnitude(time)[:, 0], 2))
@@ -0,0 +1,280 @@
+"""This module contains solar system phenomena search functions (conjunctions,
+oppositions, greatest elongations and stations).
+
+Tracked quantities are sampled for all objects on a daily epoch grid, sign
+changes are bracketed and all brackets are refined at once with the Illinois
+(modified regula falsi) method. Phenomena are cached per year.
+"""
+import functools
+import itertools
+import numpy as np
+
+from astro_toolbox.coordinates.solar_system import SolarSystemSnapshot
+from astro_toolbox.time.arrays import AstroTimeArray
+
+PHENOMENA_DTYPE = np.dtype([('jd', 'f8'), ('event', 'U24'), ('name', 'U8'),
+                            ('other', 'U8'), ('value', 'f8')])
+PLANETS = ('Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune')
+INFERIOR_PLANETS = ('Mercury', 'Venus')
+DERIVATIVE_STEP = 0.01
+
+def _wrap(angle):
+    """Angles wrapping within [-pi, pi[.
+
+    Parameters
+    ----------
+    angle : numpy.ndarray
+        Angles in radians.
+
+    Returns
+    -------
+    numpy.ndarray
+        Wrapped angles in radians.
+    """
+    return np.mod(angle + np.pi, 2*np.pi) - np.pi
+
+@functools.lru_cache(maxsize=None)
+def _tracks():
+    """Tracked quantities descriptors, one row per object or pair of objects.
+
+    Returns
+    -------
+    tuple
+        Tuple of (quantity, name, other) tuples, quantities are ``'conjunction'``
+        and ``'opposition'`` (longitude from the Sun), ``'elongation'``, ``'station'``
+        (right-ascension) and ``'pair'`` (right-ascensions difference).
+    """
+    tracks = [('conjunction', name, 'Sun') for name in PLANETS]
+    tracks += [('opposition', name, 'Sun') for name in PLANETS
+               if name not in INFERIOR_PLANETS]
+    tracks += [('elongation', name, 'Sun') for name in INFERIOR_PLANETS]
+    tracks += [('station', name, '') for name in PLANETS]
+    tracks += [('pair', name, other)
+               for name, other in itertools.combinations(('Moon',) + PLANETS, 2)]
+    return tuple(tracks)
+
+def _geometry(julian_days):
+    """Geocentric geometry of the tracked objects.
+
+    Parameters
+    ----------
+    julian_days : numpy.ndarray
+        Julian days.
+
+    Returns
+    -------
+    tuple
+        Tuple containing tracked quantities of shape (tracks, epochs) in radians,
+        elongations from the Sun, separations of pairs and distances ratios to the
+        Sun distance of shape (tracks, epochs).
+    """
+    snapshot = SolarSystemSnapshot(AstroTimeArray(julian_days))
+    names = snapshot.names
+    ecliptic = np.einsum('tji,bjt->bit', snapshot.rotation_matrix, snapshot.equatorial_position)
+    longitude = np.arctan2(ecliptic[:, 1], ecliptic[:, 0])
+    right_ascension, _, distance = snapshot.get_equatorial_array()
+    unit = snapshot.equatorial_position / distance[:, np.newaxis]
+    index = {name: names.index(name) for name in names}
+    sun = index['Sun']
+    quantities, elongations, ratios = [], [], []
+    for quantity, name, other in _tracks():
+        body = index[name]
+        partner = sun if other in ('Sun', '') else index[other]
+        if quantity == 'conjunction':
+            quantities.append(_wrap(longitude[body] - longitude[sun]))
+        elif quantity == 'opposition':
+            quantities.append(_wrap(longitude[body] - longitude[sun] - np.pi))
+        elif quantity == 'elongation':
+            quantities.append(np.arccos(np.clip(np.sum(unit[body] * unit[sun], axis=0), -1, 1)))
+        elif quantity == 'station':
+            quantities.append(right_ascension[body])
+        else:
+            quantities.append(_wrap(right_ascension[body] - right_ascension[partner]))
+        elongations.append(np.arccos(np.clip(np.sum(unit[body] * unit[partner], axis=0),
+                                             -1, 1)))
+        ratios.append(distance[body] / distance[sun])
+    return np.array(quantities), np.array(elongations), np.array(ratios)
+
+def _functions(julian_days, tracks):
+    """Root functions of tracks at epochs, quantities for sign changes and
+    central differences derivatives for extrema (elongations and stations).
+
+    Parameters
+    ----------
+    julian_days : numpy.ndarray
+        Julian days, one per track.
+    tracks : numpy.ndarray
+        Tracks indexes.
+
+    Returns
+    -------
+    numpy.ndarray
+        Functions values.
+    """
+    extremum = np.isin(np.array([track[0] for track in _tracks()])[tracks],
+                       ('elongation', 'station'))
+    epochs = np.concatenate((julian_days[~extremum], julian_days[extremum] + DERIVATIVE_STEP,
+                             julian_days[extremum] - DERIVATIVE_STEP))
+    quantities = _geometry(epochs)[0]
+    values = np.empty(len(julian_days))
+    length, derivatives = np.sum(~extremum), np.sum(extremum)
+    values[~extremum] = quantities[tracks[~extremum], np.arange(length)]
+    values[extremum] = _wrap(quantities[tracks[extremum], length + np.arange(derivatives)] -
+                             quantities[tracks[extremum],
+                                        length + derivatives + np.arange(derivatives)]
+                             ) / (2 * DERIVATIVE_STEP)
+    return values
+
+def refine_roots(function, lower, upper, lower_value, upper_value,
+                 tolerance: float = 1e-5, max_iterations: int = 60):
+    """Vectorized Illinois (modified regula falsi) roots refinement of brackets.
+
+    Parameters
+    ----------
+    function : callable
+        Function of epochs and brackets indexes returning one value per bracket.
+    lower : numpy.ndarray
+        Brackets lower bounds.
+    upper : numpy.ndarray
+        Brackets upper bounds.
+    lower_value : numpy.ndarray
+        Function values at lower bounds.
+    upper_value : numpy.ndarray
+        Function values at upper bounds, of opposite signs.
+    tolerance : float, optional
+        Brackets width tolerance, by default 1e-5.
+    max_iterations : int, optional
+        Maximum number of iterations, by default 60.
+
+    Returns
+    -------
+    numpy.ndarray
+        Roots.
+    """
+    lower, upper = np.array(lower, dtype=np.float64), np.array(upper, dtype=np.float64)
+    lower_value = np.array(lower_value, dtype=np.float64)
+    upper_value = np.array(upper_value, dtype=np.float64)
+    side = np.zeros(len(lower), dtype=np.int8)
+    active = np.arange(len(lower))
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        root = ((lower[active] * upper_value[active] - upper[active] * lower_value[active]) /
+                (upper_value[active] - lower_value[active]))
+        value = function(root, active)
+        upper_side = np.signbit(value) == np.signbit(upper_value[active])
+        lower_index, upper_index = active[~upper_side], active[upper_side]
+        lower[lower_index], lower_value[lower_index] = root[~upper_side], value[~upper_side]
+        upper[upper_index], upper_value[upper_index] = root[upper_side], value[upper_side]
+        upper_value[lower_index[side[lower_index] == -1]] /= 2
+        lower_value[upper_index[side[upper_index] == 1]] /= 2
+        side[lower_index], side[upper_index] = -1, 1
+        done = (upper[active] - lower[active] <= tolerance) | (value == 0)
+        active = active[~done]
+    return np.where(lower_value == 0, lower, np.where(upper_value == 0, upper,
+                    (lower * upper_value - upper * lower_value) / (upper_value - lower_value)))
+
+def search_phenomena(start: float, stop: float, step: float = 1.0):
+    """Search phenomena between two epochs.
+
+    Parameters
+    ----------
+    start : float
+        First Julian day.
+    stop : float
+        Last Julian day (excluded).
+    step : float, optional
+        Coarse grid step in days, by default 1.0.
+
+    Returns
+    -------
+    numpy.ndarray
+        `PHENOMENA_DTYPE` phenomena sorted by epochs, values are elongations from
+        the Sun in degrees or separations for conjunctions between objects.
+    """
+    julian_days = np.arange(start - step, stop + 2 * step, step)
+    quantities = _geometry(julian_days)[0]
+    kinds = np.array([track[0] for track in _tracks()])
+    extremum = np.isin(kinds, ('elongation', 'station'))
+    differences = _wrap(np.diff(quantities, axis=1)) / step
+    values = np.where(extremum[:, np.newaxis], differences, quantities[:, :-1])
+    grid = np.where(extremum[:, np.newaxis], julian_days[:-1] + step/2, julian_days[:-1])
+    change = np.signbit(values[:, :-1]) != np.signbit(values[:, 1:])
+    change &= extremum[:, np.newaxis] | ((np.abs(values[:, :-1]) < np.pi/2) &
+                                         (np.abs(values[:, 1:]) < np.pi/2))
+    tracks, columns = np.nonzero(change)
+    lower, upper = grid[tracks, columns], grid[tracks, columns + 1]
+    lower_value = _functions(lower, tracks)
+    upper_value = _functions(upper, tracks)
+    valid = np.signbit(lower_value) != np.signbit(upper_value)
+    tracks, lower, upper = tracks[valid], lower[valid], upper[valid]
+    rising = ~np.signbit(upper_value[valid])
+    roots = refine_roots(lambda epochs, active: _functions(epochs, tracks[active]),
+                         lower, upper, lower_value[valid], upper_value[valid])
+    keep = (roots >= start) & (roots < stop)
+    tracks, roots, rising = tracks[keep], roots[keep], rising[keep]
+    quantities, elongations, ratios = _geometry(roots)
+    columns = np.arange(len(roots))
+    elongations, ratios = elongations[tracks, columns], ratios[tracks, columns]
+    phenomena = []
+    for index, track in enumerate(tracks):
+        kind, name, other = _tracks()[track]
+        if kind == 'conjunction':
+            event = 'conjunction'
+            if name in INFERIOR_PLANETS:
+                event = ('inferior conjunction' if ratios[index] < 1
+                         else 'superior conjunction')
+        elif kind == 'opposition':
+            event = 'opposition'
+        elif kind == 'elongation':
+            if rising[index]:
+                continue
+            event = ('greatest elongation east'
+                     if quantities[_tracks().index(('conjunction', name, 'Sun')), index] > 0
+                     else 'greatest elongation west')
+        elif kind == 'station':
+            event = 'station direct' if rising[index] else 'station retrograde'
+        else:
+            event = 'conjunction'
+        phenomena.append((roots[index], event, name, other,
+                          np.degrees(elongations[index])))
+    phenomena = np.array(phenomena, dtype=PHENOMENA_DTYPE)
+    return np.sort(phenomena, order='jd')
+
+@functools.lru_cache(maxsize=64)
+def phenomena_year(year: int):
+    """Search phenomena of a civil year, results are cached per year.
+
+    Parameters
+    ----------
+    year : int
+        Year.
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only `PHENOMENA_DTYPE` phenomena (c.f. `search_phenomena`).
+    """
+    start, stop = AstroTimeArray.calendar_to_jd([[year, 1, 1, 0, 0, 0],
+                                                 [year + 1, 1, 1, 0, 0, 0]])
+    phenomena = search_phenomena(start, stop)
+    phenomena.flags.writeable = False
+    return phenomena
+
+def find_phenomena(start_year: int, stop_year: int = None):
+    """Search phenomena of consecutive years (c.f. `phenomena_year`).
+
+    Parameters
+    ----------
+    start_year : int
+        First year.
+    stop_year : int, optional
+        Last year (included), by default None for start year only.
+
+    Returns
+    -------
+    numpy.ndarray
+        `PHENOMENA_DTYPE` phenomena sorted by epochs.
+    """
+    stop_year = start_year if stop_year is None else stop_year
+    return np.concatenate([phenomena_year(year) for year in range(start_year, stop_year + 1)])
@@ -0,0 +1,81 @@
+"""This module contains precession functions from the IAU 1976 (Lieske 1979) model.
+"""
+import functools
+import numpy as np
+
+@functools.lru_cache(maxsize=256)
+def precession_matrix(epoch: float):
+    """J2000 to epoch precession rotation matrix calculation function.
+
+    .. math:: T = \\frac{epoch - 2000}{100}
+
+    .. math:: \\zeta = 2306.2181''T + 0.30188''T^2 + 0.017998''T^3
+
+    .. math:: z = 2306.2181''T + 1.09468''T^2 + 0.018203''T^3
+
+    .. math:: \\theta = 2004.3109''T - 0.42665''T^2 - 0.041833''T^3
+
+    .. math:: P = R_z(-z)R_y(\\theta)R_z(-\\zeta)
+
+    Matrices are cached by epoch and returned read-only.
+
+    Parameters
+    ----------
+    epoch : float
+        Julian epoch in years (c.f. `AstroDateTime.get_epoch`).
+
+    Returns
+    -------
+    numpy.ndarray
+        Rotation matrix (3, 3) applied to J2000 unit vectors.
+    """
+    centuries = (epoch - 2000.0)/100
+    zeta = np.radians((2306.2181 * centuries + 0.30188 * centuries**2 +
+                       0.017998 * centuries**3)/3600)
+    z_angle = np.radians((2306.2181 * centuries + 1.09468 * centuries**2 +
+                          0.018203 * centuries**3)/3600)
+    theta = np.radians((2004.3109 * centuries - 0.42665 * centuries**2 -
+                        0.041833 * centuries**3)/3600)
+    cos_zeta, sin_zeta = np.cos(zeta), np.sin(zeta)
+    cos_z, sin_z = np.cos(z_angle), np.sin(z_angle)
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+    matrix = np.array([[cos_zeta * cos_theta * cos_z - sin_zeta * sin_z,
+                        -sin_zeta * cos_theta * cos_z - cos_zeta * sin_z,
+                        -sin_theta * cos_z],
+                       [cos_zeta * cos_theta * sin_z + sin_zeta * cos_z,
+                        -sin_zeta * cos_theta * sin_z + cos_zeta * cos_z,
+                        -sin_theta * sin_z],
+                       [cos_zeta * sin_theta,
+                        -sin_zeta * sin_theta,
+                        cos_theta]])
+    matrix.flags.writeable = False
+    return matrix
+
+def precess(alpha, delta, epoch: float):
+    """J2000 equatorial coordinates to epoch precessing function.
+
+    Coordinates are converted to unit vectors and rotated with one matrix product.
+
+    Parameters
+    ----------
+    alpha : float | array_like
+        J2000 right-ascensions in radians.
+    delta : float | array_like
+        J2000 declinations in radians.
+    epoch : float
+        Julian epoch in years.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays containing precessed right-ascensions within [0, 2pi[
+        and declinations in radians.
+    """
+    alpha = np.asarray(alpha, dtype=np.float64)
+    delta = np.asarray(delta, dtype=np.float64)
+    cos_delta = np.cos(delta)
+    vectors = np.stack((cos_delta * np.cos(alpha), cos_delta * np.sin(alpha),
+                        np.sin(delta)), axis=-1)
+    vectors = vectors @ precession_matrix(float(epoch)).T
+    return (np.mod(np.arctan2(vectors[..., 1], vectors[..., 0]), 2*np.pi),
+            np.arcsin(np.clip(vectors[..., 2], -1, 1)))
@@ -0,0 +1,792 @@
+"""This module contains SiteRegistry class.
+"""
+import os
+import re
+import json
+import math
+import atexit
+import sqlite3
+import tempfile
+import threading
+import contextlib
+import pkg_resources
+
+from astro_toolbox.angle.dms import AngleDMS
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+PATH = pkg_resources.resource_filename('astro_toolbox', 'coordinates/data/')
+EARTH_RADIUS = 6371.0088
+ITEMS_BATCH_SIZE = 512
+_INSTANCE_LOCK = threading.Lock()
+
+def site_coordinates(site: dict):
+    """Site latitude and longitude in degrees from saved DMS str.
+
+    Parameters
+    ----------
+    site : dict
+        Site data (``latitude`` and ``longitude`` as ``dd°dd'dd.dd"``).
+
+    Returns
+    -------
+    tuple
+        Tuple containing latitude and longitude in degrees.
+    """
+    return tuple(AngleDMS(tuple(float(value) for value in re.split(r"[°'\"]", site[key])[:3]))
+                 .dmstodeg() for key in ('latitude', 'longitude'))
+
+def great_circle_distance(latitude_1: float, longitude_1: float,
+                          latitude_2: float, longitude_2: float):
+    """Great circle distance with the haversine formula.
+
+    .. math:: d = 2Rsin^{-1}\\sqrt{sin^2\\frac{\\Delta\\Phi}{2}+
+              cos\\Phi_1cos\\Phi_2sin^2\\frac{\\Delta\\lambda}{2}}
+
+    Parameters
+    ----------
+    latitude_1, longitude_1 : float
+        First point coordinates in degrees.
+    latitude_2, longitude_2 : float
+        Second point coordinates in degrees.
+
+    Returns
+    -------
+    float
+        Distance in km.
+    """
+    phi_1, phi_2 = math.radians(latitude_1), math.radians(latitude_2)
+    haversine = (math.sin((phi_2 - phi_1)/2)**2 + math.cos(phi_1) * math.cos(phi_2) *
+                 math.sin(math.radians(longitude_2 - longitude_1)/2)**2)
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(haversine)))
+
+@contextlib.contextmanager
+def file_lock(path: str):
+    """Exclusive inter-process lock on a lock file.
+
+    Parameters
+    ----------
+    path : str
+        Lock file path.
+
+    Yields
+    ------
+    None
+        The lock is held within the context.
+    """
+    with open(path, 'a+', encoding="utf-8") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+def atomic_json_dump(data, path: str):
+    """Atomic json writing, data are written in a temporary file renamed over path.
+
+    Parameters
+    ----------
+    data : dict
+        Json serializable data.
+    path : str
+        Output file path.
+    """
+    directory, name = os.path.split(path)
+    file_descriptor, temp_path = tempfile.mkstemp(prefix=name, suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(file_descriptor, 'w', encoding="utf-8") as json_file:
+            json.dump(data, json_file, indent=4)
+            json_file.flush()
+            os.fsync(json_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+class SiteRegistry():
+    """Process-wide registry of saved observer sites.
+
+    Sites are loaded once from ``sites.json`` and looked up by lowercased name.
+    The last used site is kept apart in ``last_site.json`` and written at exit
+    only when it changed. Sites changes are flushed under a file lock by
+    re-reading the file and applying pending changes, then writing a temporary
+    file renamed over ``sites.json``, so that concurrent processes never read a
+    partial file nor lose each other changes.
+
+    Attributes
+    ----------
+    path : str
+        Sites file path.
+    last_site_path : str
+        Last used site file path.
+    """
+    _instance = None
+
+    def __init__(self, path: str = PATH + 'sites.json',
+                 last_site_path: str = PATH + 'last_site.json'):
+        """Constructor method
+
+        Parameters
+        ----------
+        path : str, optional
+            Sites file path, by default ``coordinates/data/sites.json``.
+        last_site_path : str, optional
+            Last used site file path, by default ``coordinates/data/last_site.json``.
+        """
+        self.path = path
+        self.last_site_path = last_site_path
+        self._sites = None
+        self._keys = None
+        self._last_site = None
+        self._last_site_changed = False
+        self._pending = {}
+
+    @staticmethod
+    def get_registry():
+        """Get the process-wide registry, pending changes are flushed and the
+        registry closed at exit.
+
+        The SQLite backend (`SqliteSiteRegistry`) is used when the
+        ``ASTRO_TOOLBOX_SITES_DB`` environment variable gives a database path.
+
+        Returns
+        -------
+        SiteRegistry
+            Shared registry.
+        """
+        with _INSTANCE_LOCK:
+            if SiteRegistry._instance is None:
+                database = os.environ.get('ASTRO_TOOLBOX_SITES_DB')
+                SiteRegistry._instance = (SqliteSiteRegistry(database) if database
+                                          else SiteRegistry())
+                atexit.register(SiteRegistry._instance.close)
+            return SiteRegistry._instance
+
+    def _read_sites(self):
+        """Read sites file.
+
+        Returns
+        -------
+        dict
+            Sites dictionary.
+        """
+        with open(self.path, encoding="utf-8") as json_file:
+            return json.load(json_file)
+
+    def _set_sites(self, dict_sites: dict):
+        """Set sites and rebuild the lowercased names index.
+
+        Parameters
+        ----------
+        dict_sites : dict
+            Sites dictionary.
+        """
+        self._sites = dict_sites
+        self._keys = {name.lower(): name for name in dict_sites}
+
+    def _load(self):
+        """Load sites and last used site on first access.
+        """
+        if self._sites is not None:
+            return
+        self._set_sites(self._read_sites())
+        try:
+            with open(self.last_site_path, encoding="utf-8") as json_file:
+                self._last_site = json.load(json_file).get('name')
+        except (OSError, ValueError):
+            self._last_site = None
+
+    def _resolve(self, name: str):
+        """Get the stored site name from a case insensitive name.
+
+        Parameters
+        ----------
+        name : str
+            Site name.
+
+        Returns
+        -------
+        str | None
+            Stored site name, None if the site doesn't exist.
+        """
+        self._load()
+        return self._keys.get(name.lower())
+
+    def __contains__(self, name: str):
+        """Membership method (case insensitive).
+
+        Parameters
+        ----------
+        name : str
+            Site name.
+
+        Returns
+        -------
+        bool
+            True if the site exists.
+        """
+        return self._resolve(name) is not None
+
+    def get_last_site(self):
+        """Get last used site name (first saved site if none was used).
+
+        Returns
+        -------
+        str
+            Site name.
+        """
+        self._load()
+        if self._last_site is not None and self._last_site.lower() in self._keys:
+            return self._keys[self._last_site.lower()]
+        return next(iter(self._sites))
+
+    def set_last_site(self, name: str):
+        """Set last used site, written at flush.
+
+        Parameters
+        ----------
+        name : str
+            Site name.
+        """
+        if name != self.get_last_site():
+            self._last_site = name
+            self._last_site_changed = True
+
+    def get(self, name: str = None):
+        """Get a site with its data.
+
+        Parameters
+        ----------
+        name : str, optional
+            Site name (case insensitive), by default None for the last used site.
+
+        Returns
+        -------
+        dict
+            Dictionary ``{name: {'latitude', 'longitude', 'elevation'}}``.
+
+        Raises
+        ------
+        ValueError
+            The site doesn't exist.
+        """
+        stored_name = self.get_last_site() if name is None else self._resolve(name)
+        if stored_name is None:
+            raise ValueError(f"{name} site doesn't exist")
+        return {stored_name: dict(self._sites[stored_name])}
+
+    def items(self):
+        """Sites iterator, the last used site comes first.
+
+        Yields
+        ------
+        tuple
+            Tuple containing site name and site data.
+        """
+        last_site = self.get_last_site()
+        yield last_site, dict(self._sites[last_site])
+        for name, site in list(self._sites.items()):
+            if name != last_site:
+                yield name, dict(site)
+
+    def to_dict(self):
+        """Sites dictionary, the last used site comes first.
+
+        Returns
+        -------
+        dict
+            Sites dictionary.
+        """
+        return dict(self.items())
+
+    def within(self, latitude: float, longitude: float, radius: float):
+        """Sites within a distance.
+
+        Parameters
+        ----------
+        latitude : float
+            Center latitude in degrees.
+        longitude : float
+            Center longitude in degrees.
+        radius : float
+            Distance in km.
+
+        Returns
+        -------
+        list
+            List of tuples (site name, distance in km) sorted by distance.
+        """
+        distances = []
+        for name, site in self.items():
+            distance = great_circle_distance(latitude, longitude, *site_coordinates(site))
+            if distance <= radius:
+                distances.append((name, distance))
+        return sorted(distances, key=lambda item: item[1])
+
+    def in_latitude_band(self, minimum: float, maximum: float):
+        """Sites within a latitude band.
+
+        Parameters
+        ----------
+        minimum : float
+            Minimum latitude in degrees.
+        maximum : float
+            Maximum latitude in degrees.
+
+        Returns
+        -------
+        list
+            Sites names sorted by latitude.
+        """
+        latitudes = [(name, site_coordinates(site)[0]) for name, site in self.items()]
+        return [name for name, latitude in sorted(latitudes, key=lambda item: item[1])
+                if minimum <= latitude <= maximum]
+
+    def export_json(self, path: str):
+        """Export sites to a json file in the ``sites.json`` format.
+
+        Parameters
+        ----------
+        path : str
+            Output file path.
+        """
+        atomic_json_dump(self.to_dict(), path)
+
+    def add(self, name: str, site: dict):
+        """Add a site, it becomes the last used site.
+
+        Parameters
+        ----------
+        name : str
+            Site name.
+        site : dict
+            Site data (``latitude``, ``longitude``, ``elevation``).
+
+        Raises
+        ------
+        ValueError
+            The site already exists.
+        """
+        if name in self:
+            raise ValueError("Site already exist, use `update_site` instead")
+        self._sites[name] = dict(site)
+        self._keys[name.lower()] = name
+        self._pending[name.lower()] = (name, dict(site))
+        self.set_last_site(name)
+
+    def update(self, name: str, site: dict):
+        """Update a site.
+
+        Parameters
+        ----------
+        name : str
+            Site name (case insensitive).
+        site : dict
+            Site data to update.
+
+        Raises
+        ------
+        ValueError
+            The site doesn't exist.
+        """
+        stored_name = self._resolve(name)
+        if stored_name is None:
+            raise ValueError("Site doesn't exist")
+        self._sites[stored_name].update(site)
+        self._pending[stored_name.lower()] = (stored_name, dict(self._sites[stored_name]))
+
+    def delete(self, name: str):
+        """Delete a site.
+
+        Parameters
+        ----------
+        name : str
+            Site name (case insensitive).
+
+        Raises
+        ------
+        ValueError
+            The site doesn't exist.
+        """
+        stored_name = self._resolve(name)
+        if stored_name is None:
+            raise ValueError("Site doesn't exist")
+        del self._sites[stored_name]
+        del self._keys[stored_name.lower()]
+        self._pending[stored_name.lower()] = (stored_name, None)
+
+    def flush(self):
+        """Write pending changes.
+
+        Sites changes are merged into the current file content under the file lock.
+        """
+        if self._pending:
+            with file_lock(self.path + '.lock'):
+                dict_sites = self._read_sites()
+                keys = {name.lower(): name for name in dict_sites}
+                for key, (name, site) in self._pending.items():
+                    if site is None:
+                        dict_sites.pop(keys.get(key), None)
+                    else:
+                        dict_sites[keys.get(key, name)] = site
+                atomic_json_dump(dict_sites, self.path)
+            self._pending = {}
+            self._set_sites(dict_sites)
+        if self._last_site_changed:
+            atomic_json_dump({'name': self._last_site}, self.last_site_path)
+            self._last_site_changed = False
+
+    def close(self):
+        """Write pending changes before the registry is released.
+        """
+        self.flush()
+
+class SqliteSiteRegistry(SiteRegistry):
+    """SQLite backed registry of saved observer sites.
+
+    Sites are stored with a case insensitive unique index on names and
+    indexed latitudes and longitudes in degrees for spatial queries. Changes
+    are committed at once, SQLite handling concurrent processes. An empty
+    database is filled from ``sites.json``. The connection is shared by threads
+    behind a lock and closed by `close` (at exit for the process-wide registry).
+    """
+    def __init__(self, database: str, path: str = PATH + 'sites.json'):
+        """Constructor method
+
+        Parameters
+        ----------
+        database : str
+            SQLite database path.
+        path : str, optional
+            Json file imported in an empty database, by default ``coordinates/data/sites.json``.
+        """
+        super().__init__(path=path)
+        self.database = database
+        self._connection = None
+        self._lock = threading.RLock()
+
+    def _load(self):
+        """Open the database on first access.
+        """
+        with self._lock:
+            if self._connection is not None:
+                return
+            self._connection = sqlite3.connect(self.database, check_same_thread=False)
+            with self._connection:
+                self._connection.executescript("""
+                    CREATE TABLE IF NOT EXISTS sites (
+                        name TEXT NOT NULL,
+                        latitude TEXT NOT NULL,
+                        longitude TEXT NOT NULL,
+                        elevation REAL NOT NULL,
+                        latitude_deg REAL NOT NULL,
+                        longitude_deg REAL NOT NULL);
+                    CREATE UNIQUE INDEX IF NOT EXISTS sites_name ON sites (name COLLATE NOCASE);
+                    CREATE INDEX IF NOT EXISTS sites_latitude ON sites (latitude_deg);
+                    CREATE INDEX IF NOT EXISTS sites_longitude ON sites (longitude_deg);
+                    CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT);""")
+            if self._connection.execute("SELECT COUNT(*) FROM sites").fetchone()[0] == 0:
+                self.import_json(self.path)
+            row = self._connection.execute(
+                    "SELECT value FROM settings WHERE key = 'last_site'").fetchone()
+            self._last_site = row[0] if row else None
+
+    @staticmethod
+    def _row(name: str, site: dict):
+        """Database row from site data.
+
+        Parameters
+        ----------
+        name : str
+            Site name.
+        site : dict
+            Site data.
+
+        Returns
+        -------
+        tuple
+            Database row.
+        """
+        return ((name, site['latitude'], site['longitude'], float(site['elevation'])) +
+                site_coordinates(site))
+
+    @staticmethod
+    def _site(row: tuple):
+        """Site data from database row.
+
+        Parameters
+        ----------
+        row : tuple
+            Row (latitude, longitude, elevation).
+
+        Returns
+        -------
+        dict
+            Site data.
+        """
+        return {'latitude': row[0], 'longitude': row[1], 'elevation': row[2]}
+
+    def import_json(self, path: str):
+        """Bulk import sites from a json file in the ``sites.json`` format,
+        existing sites are replaced.
+
+        Parameters
+        ----------
+        path : str
+            Json file path.
+        """
+        with self._lock:
+            self._load()
+            with open(path, encoding="utf-8") as json_file:
+                dict_sites = json.load(json_file)
+            with self._connection:
+                self._connection.executemany(
+                    "DELETE FROM sites WHERE name = ? COLLATE NOCASE",
+                    [(name,) for name in dict_sites])
+                self._connection.executemany(
+                    "INSERT INTO sites VALUES (?, ?, ?, ?, ?, ?)",
+                    (self._row(name, site) for name, site in dict_sites.items()))
+
+    def _resolve(self, name: str):
+        """Get the stored site name from a case insensitive name.
+
+        Parameters
+        ----------
+        name : str
+            Site name.
+
+        Returns
+        -------
+        str | None
+            Stored site name, None if the site doesn't exist.
+        """
+        with self._lock:
+            self._load()
+            row = self._connection.execute(
+                    "SELECT name FROM sites WHERE name = ? COLLATE NOCASE", (name,)).fetchone()
+            return row[0] if row else None
+
+    def get_last_site(self):
+        """Get last used site name (first saved site if none was used).
+
+        Returns
+        -------
+        str
+            Site name.
+        """
+        with self._lock:
+            self._load()
+            if self._last_site is not None:
+                name = self._resolve(self._last_site)
+                if name is not None:
+                    return name
+            return self._connection.execute(
+                    "SELECT name FROM sites ORDER BY rowid LIMIT 1").fetchone()[0]
+
+    def get(self, name: str = None):
+        """Get a site with its data.
+
+        Parameters
+        ----------
+        name : str, optional
+            Site name (case insensitive), by default None for the last used site.
+
+        Returns
+        -------
+        dict
+            Dictionary ``{name: {'latitude', 'longitude', 'elevation'}}``.
+
+        Raises
+        ------
+        ValueError
+            The site doesn't exist.
+        """
+        with self._lock:
+            stored_name = self.get_last_site() if name is None else self._resolve(name)
+            if stored_name is None:
+                raise ValueError(f"{name} site doesn't exist")
+            row = self._connection.execute(
+                    "SELECT latitude, longitude, elevation FROM sites WHERE name = ?",
+                    (stored_name,)).fetchone()
+            return {stored_name: self._site(row)}
+
+    def items(self):
+        """Sites iterator, the last used site comes first then sites in insertion order.
+        Sites are read by batches of `ITEMS_BATCH_SIZE` rows so that large
+        databases are streamed.
+
+        Yields
+        ------
+        tuple
+            Tuple containing site name and site data.
+        """
+        with self._lock:
+            last_site = self.get_last_site()
+            first = self.get(last_site)
+        yield from first.items()
+        rowid = 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                        "SELECT rowid, name, latitude, longitude, elevation FROM sites "
+                        "WHERE name != ? AND rowid > ? ORDER BY rowid LIMIT ?",
+                        (last_site, rowid, ITEMS_BATCH_SIZE)).fetchall()
+            for row in rows:
+                yield row[1], self._site(row[2:])
+            if len(rows) < ITEMS_BATCH_SIZE:
+                return
+            rowid = rows[-1][0]
+
+    def within(self, latitude: float, longitude: float, radius: float):
+        """Sites within a distance, candidates are selected on the indexed latitudes
+        band of half-width radius then filtered by great circle distance.
+
+        Parameters
+        ----------
+        latitude : float
+            Center latitude in degrees.
+        longitude : float
+            Center longitude in degrees.
+        radius : float
+            Distance in km.
+
+        Returns
+        -------
+        list
+            List of tuples (site name, distance in km) sorted by distance.
+        """
+        with self._lock:
+            self._load()
+            band = math.degrees(radius / EARTH_RADIUS)
+            distances = []
+            for name, latitude_deg, longitude_deg in self._connection.execute(
+                    "SELECT name, latitude_deg, longitude_deg FROM sites "
+                    "WHERE latitude_deg BETWEEN ? AND ?", (latitude - band, latitude + band)):
+                distance = great_circle_distance(latitude, longitude, latitude_deg, longitude_deg)
+                if distance <= radius:
+                    distances.append((name, distance))
+            return sorted(distances, key=lambda item: item[1])
+
+    def in_latitude_band(self, minimum: float, maximum: float):
+        """Sites within a latitude band from the indexed latitudes.
+
+        Parameters
+        ----------
+        minimum : float
+            Minimum latitude in degrees.
+        maximum : float
+            Maximum latitude in degrees.
+
+        Returns
+        -------
+        list
+            Sites names sorted by latitude.
+        """
+        with self._lock:
+            self._load()
+            return [row[0] for row in self._connection.execute(
+                    "SELECT name FROM sites WHERE latitude_deg BETWEEN ? AND ? "
+                    "ORDER BY latitude_deg",
+                    (minimum, maximum))]
+
+    def add(self, name: str, site: dict):
+        """Add a site, committed at once, it becomes the last used site.
+
+        Parameters
+        ----------
+        name : str
+            Site name.
+        site : dict
+            Site data (``latitude``, ``longitude``, ``elevation``).
+
+        Raises
+        ------
+        ValueError
+            The site already exists.
+        """
+        with self._lock:
+            if name in self:
+                raise ValueError("Site already exist, use `update_site` instead")
+            with self._connection:
+                self._connection.execute("INSERT INTO sites VALUES (?, ?, ?, ?, ?, ?)",
+                                         self._row(name, site))
+            self.set_last_site(name)
+
+    def update(self, name: str, site: dict):
+        """Update a site, committed at once.
+
+        Parameters
+        ----------
+        name : str
+            Site name (case insensitive).
+        site : dict
+            Site data to update.
+
+        Raises
+        ------
+        ValueError
+            The site doesn't exist.
+        """
+        with self._lock:
+            stored_name = self._resolve(name)
+            if stored_name is None:
+                raise ValueError("Site doesn't exist")
+            site = {**self.get(stored_name)[stored_name], **site}
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE sites SET latitude = ?, longitude = ?, elevation = ?, "
+                    "latitude_deg = ?, longitude_deg = ? WHERE name = ?",
+                    self._row(stored_name, site)[1:] + (stored_name,))
+
+    def delete(self, name: str):
+        """Delete a site, committed at once.
+
+        Parameters
+        ----------
+        name : str
+            Site name (case insensitive).
+
+        Raises
+        ------
+        ValueError
+            The site doesn't exist.
+        """
+        with self._lock:
+            stored_name = self._resolve(name)
+            if stored_name is None:
+                raise ValueError("Site doesn't exist")
+            with self._connection:
+                self._connection.execute("DELETE FROM sites WHERE name = ?", (stored_name,))
+
+    def flush(self):
+        """Write last used site.
+        """
+        with self._lock:
+            if self._last_site_changed:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO settings VALUES ('last_site', ?)",
+                        (self._last_site,))
+                self._last_site_changed = False
+
+    def close(self):
+        """Write last used site and close the database.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self.flush()
+                self._connection.close()
+                self._connection = None
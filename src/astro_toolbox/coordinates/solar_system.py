@@ -1,13 +1,126 @@
-"""This module contains Ephemeris class.
+"""This module contains Ephemeris and SolarSystemSnapshot classes.
 """
-import math
 import json
+import functools
+import numpy as np
 import pkg_resources
 
 from astro_toolbox.angle.radians import AngleRad
+from astro_toolbox.coordinates.arrays import EquatorialArray
+from astro_toolbox.coordinates.kepler import solve_kepler
+from astro_toolbox.coordinates.lunisolar import moon_position
 from astro_toolbox.time.core import AstroDateTime
+from astro_toolbox.time.arrays import AstroTimeArray
 
 PATH = pkg_resources.resource_filename('astro_toolbox', 'coordinates/data/')
+ORBITAL_ELEMENTS_KEYS = ('a', 'e', 'I', 'L', 'longperi', 'longnode')
+ASTRONOMICAL_UNIT = 149597870.700
+SOLAR_SYSTEM_MAGNITUDES = {'sun': -26.83,
+                           'mercury': 0.23,
+                           'venus': -4.14,
+                           'moon': -12.90,
+                           'mars': 0.71,
+                           'jupiter': -2.20,
+                           'saturn': 0.46,
+                           'uranus': 6.03,
+                           'neptune': 7.78}
+
+@functools.lru_cache(maxsize=None)
+def load_orbital_elements():
+    """Orbital elements file parsing, the file is read once per process.
+
+    Returns
+    -------
+    tuple
+        Tuple containing a dictionary of lowercased names to objects names and a
+        read-only array of shape (objects, 6, 2) with J2000 values and rates per
+        century of `ORBITAL_ELEMENTS_KEYS` elements.
+    """
+    with open(PATH  + 'orbital_elements.json', encoding="utf-8") as json_file:
+        dict_orbital_elements = json.load(json_file)
+    names = {name.lower(): name for name in dict_orbital_elements}
+    table = np.array([[[float(value) for value in (elements[key].split(',') + ['0.0'])[:2]]
+                       for key in ORBITAL_ELEMENTS_KEYS]
+                      for elements in dict_orbital_elements.values()])
+    table.flags.writeable = False
+    return names, table
+
+def ecliptic_obliquity(n_centuries):
+    """On date ecliptic obliquity calculation function.
+
+    Parameters
+    ----------
+    n_centuries : float | numpy.ndarray
+        Number of centuries from J2000.
+
+    Returns
+    -------
+    float | numpy.ndarray
+        Ecliptic obliquity in degrees.
+    """
+    return (23.439279444444445 -
+            0.013010213611111111 * n_centuries**1 -
+            5.0861111111111115e-08 * n_centuries**2 +
+            5.565e-07 * n_centuries**3 -
+            1.6e-10 * n_centuries**4 -
+            1.2055555555555555e-11 * n_centuries**5)
+
+def _moon_equatorial_position(n_centuries):
+    """Moon geocentric equatorial position from the truncated lunar theory
+    (c.f. `lunisolar.moon_position`).
+
+    Parameters
+    ----------
+    n_centuries : float | numpy.ndarray
+        Number of centuries from J2000.
+
+    Returns
+    -------
+    tuple
+        Tuple which contains the geocentric position in km.
+    """
+    right_ascension, declination, distance = moon_position(n_centuries * 36525 + 2451545)
+    return (distance * np.cos(declination) * np.cos(right_ascension),
+            distance * np.cos(declination) * np.sin(right_ascension),
+            distance * np.sin(declination))
+
+def compute_ecliptic_positions(table, n_centuries):
+    """Compute J2000 heliocentric ecliptic positions of all objects of an orbital
+    elements table (c.f. `Ephemeris.compute_ecliptic_position`).
+
+    Parameters
+    ----------
+    table : numpy.ndarray
+        Orbital elements table (c.f. `load_orbital_elements`).
+    n_centuries : numpy.ndarray
+        Numbers of centuries from J2000.
+
+    Returns
+    -------
+    tuple
+        Tuple containing true longitudes from ascending nodes in radians and
+        distances of shape (objects, epochs), and ecliptic positions in km of
+        shape (objects, 3, epochs).
+    """
+    elements = table[:, :, :1] + table[:, :, 1:] * n_centuries
+    (semi_major_axis, eccentricity, inclination,
+     mean_longitude, longperi, longnode) = np.moveaxis(elements, 1, 0)
+    semi_major_axis = semi_major_axis * ASTRONOMICAL_UNIT
+    eccentric_anomaly = solve_kepler(np.radians(mean_longitude - longperi), eccentricity)[0]
+    x_true_anomaly = semi_major_axis * (np.cos(eccentric_anomaly) - eccentricity)
+    y_true_anomaly = semi_major_axis * (np.sqrt(1 - eccentricity**2) *
+                                        np.sin(eccentric_anomaly))
+    radius = np.sqrt(x_true_anomaly**2 + y_true_anomaly**2)
+    true_longitude = (np.arctan2(y_true_anomaly, x_true_anomaly) +
+                      np.radians(longperi - longnode))
+    longnode, inclination = np.radians(longnode), np.radians(inclination)
+    ecliptic_position = radius[:, np.newaxis] * np.stack((
+        np.cos(longnode) * np.cos(true_longitude) -
+        np.sin(longnode) * np.sin(true_longitude) * np.cos(inclination),
+        np.sin(longnode) * np.cos(true_longitude) +
+        np.cos(longnode) * np.sin(true_longitude) * np.cos(inclination),
+        np.sin(true_longitude) * np.sin(inclination)), axis=1)
+    return true_longitude, radius, ecliptic_position
 
 class Ephemeris():
     """Ephemeris class computing solar system objects positions in different referential.
@@ -17,10 +130,12 @@ class Ephemeris():
     ----------
     name : str
         Planet name.
-    n_centuries : float
+    n_centuries : float | numpy.ndarray
         Number of centuries from J2000.
     orbital_elements : dict
         Dictionary which contains object orbital elements for current date.
+    earth_orbital_elements : dict
+        Dictionary which contains Earth-Moon barycenter orbital elements for current date.
     """
     def __init__(self, name: str, datetime: tuple | str):
         """Constructor method
@@ -29,13 +144,18 @@ class Ephemeris():
         ----------
         name : str
             Planet name.
-        datetime : tuple | str
-            Date and time as tuple or str (``dd:dd:dd.dd`` or ``ddhddmdd.dds``).
+        datetime : tuple | str | AstroTimeArray
+            Date and time as tuple or str (``yyyy-mm-ddThh:mm:ss``), or epochs as
+            AstroTimeArray (c.f. `get_equatorial_array`).
         """
         self.name = name
-        self.n_centuries = (AstroDateTime(datetime).get_jd() - 2451545)/36525
+        if isinstance(datetime, AstroTimeArray):
+            self.n_centuries = (datetime.get_jd() - 2451545)/36525
+        else:
+            self.n_centuries = (AstroDateTime(datetime).get_jd() - 2451545)/36525
+        self.earth_orbital_elements = self._get_orbital_elements('EM Bary')
         if self.name.lower() == 'sun':
-            self.orbital_elements = self._get_orbital_elements('EM Bary')
+            self.orbital_elements = self.earth_orbital_elements
         else:
             self.orbital_elements = self._get_orbital_elements(self.name)
 
@@ -57,43 +177,25 @@ class Ephemeris():
         ValueError
             Unknown Object.
         """
-        with open(PATH  + 'orbital_elements.json', encoding="utf-8") as json_file:
-            dict_orbital_elements = json.load(json_file)
-        if name.lower() in [key.lower() for key in dict_orbital_elements.keys()]:
-            keys = list(key for key in dict_orbital_elements)
-            idx = list(key.lower() for key in dict_orbital_elements).index(name.lower())
-            name = keys[idx]
-            orbital_elements = dict_orbital_elements[name]
-        else:
+        names, table = load_orbital_elements()
+        if name.lower() not in names:
             raise ValueError ("Unknown object")
-        for key, value in orbital_elements.items():
-            if ',' in value:
-                parsed_value = value.split(',')
-                value = (float(parsed_value[0]) +
-                        float(parsed_value[1]) * self.n_centuries)
-                if key in ('L', 'I', 'longperi', 'longnode'):
-                    value = value%360
+        elements = table[list(names).index(name.lower())]
+        orbital_elements = {}
+        for key, (value, rate) in zip(ORBITAL_ELEMENTS_KEYS, elements):
+            value = value + rate * self.n_centuries
+            if key in ('L', 'I', 'longperi', 'longnode'):
+                value = value%360
             if key == 'a':
-                value = value * 149597870.700
-            orbital_elements[key] = float(value)
+                value = value * ASTRONOMICAL_UNIT
+            orbital_elements[key] = value
         orbital_elements.update({"perihelion": (orbital_elements['longperi'] -
                                     orbital_elements['longnode'])%360})
         orbital_elements.update({"M": (orbital_elements['L'] -
                                     orbital_elements['longperi'])%360})
-        eccentric_anomaly = (orbital_elements['M'] -
-                            (orbital_elements['e']*180/math.pi) *
-                            math.sin(orbital_elements['M']*math.pi/180))
-        delta_eccentric_anomaly = 1
-        while abs(delta_eccentric_anomaly) > 1e-6:
-            delta_mean_anomaly = (orbital_elements['M'] - (
-                                eccentric_anomaly -
-                                (orbital_elements['e']*180/math.pi) *
-                                math.sin(eccentric_anomaly*math.pi/180)))
-            delta_eccentric_anomaly = (delta_mean_anomaly / (
-                                    1 - orbital_elements['e'] *
-                                    math.cos(eccentric_anomaly*math.pi/180)))
-            eccentric_anomaly = (eccentric_anomaly +
-                                delta_eccentric_anomaly)
+        eccentric_anomaly = solve_kepler(np.radians(orbital_elements['M']),
+                                         orbital_elements['e'])[0]
+        eccentric_anomaly = np.degrees(eccentric_anomaly)
         orbital_elements.update({"E": eccentric_anomaly%360})
         return orbital_elements
 
@@ -111,11 +213,10 @@ class Ephemeris():
         tuple
             Tuple containing sun position from earth
         """
-        earth_orbital_elements = self._get_orbital_elements('EM Bary')
-        true_anomaly, radius = self.compute_true_anomaly_distance(**earth_orbital_elements)
-        lonearth = true_anomaly*180/math.pi + earth_orbital_elements['perihelion']
-        x_sun = -radius * math.cos(lonearth*math.pi/180)
-        y_sun = -radius * math.sin(lonearth*math.pi/180)
+        true_anomaly, radius = self.compute_true_anomaly_distance(**self.earth_orbital_elements)
+        lonearth = true_anomaly*180/np.pi + self.earth_orbital_elements['perihelion']
+        x_sun = -radius * np.cos(lonearth*np.pi/180)
+        y_sun = -radius * np.sin(lonearth*np.pi/180)
         return x_sun, y_sun
 
     def compute_true_anomaly_distance(self, **orbital_elements):
@@ -131,12 +232,12 @@ class Ephemeris():
         tuple
             Tuple which contains true anomaly and distance.
         """
-        x_true_anomaly = orbital_elements['a'] * (math.cos(orbital_elements['E']*math.pi/180) -
+        x_true_anomaly = orbital_elements['a'] * (np.cos(orbital_elements['E']*np.pi/180) -
                                                         orbital_elements['e'])
-        y_true_anomaly = orbital_elements['a'] * (math.sqrt(1 - orbital_elements['e']**2) *
-                                                        math.sin(orbital_elements['E']*math.pi/180))
-        return (math.atan2(y_true_anomaly, x_true_anomaly),
-                math.sqrt(x_true_anomaly**2 + y_true_anomaly**2))
+        y_true_anomaly = orbital_elements['a'] * (np.sqrt(1 - orbital_elements['e']**2) *
+                                                        np.sin(orbital_elements['E']*np.pi/180))
+        return (np.arctan2(y_true_anomaly, x_true_anomaly),
+                np.sqrt(x_true_anomaly**2 + y_true_anomaly**2))
 
     def compute_ecliptic_position(self, **orbital_elements):
         """Compute the heliocentric ecliptic object position.
@@ -151,19 +252,19 @@ class Ephemeris():
             Tuple which contains object position around the sun.
         """
         true_anomaly, radius = self.compute_true_anomaly_distance(**orbital_elements)
-        true_longitude = true_anomaly*180/math.pi + orbital_elements['perihelion']
-        x_ecliptic = radius * (math.cos(orbital_elements['longnode']*math.pi/180) *
-                                    math.cos(true_longitude*math.pi/180) -
-                                    math.sin(orbital_elements['longnode']*math.pi/180) *
-                                    math.sin(true_longitude*math.pi/180) *
-                                    math.cos(orbital_elements['I']*math.pi/180))
-        y_ecliptic = radius * (math.sin(orbital_elements['longnode']*math.pi/180) *
-                                    math.cos(true_longitude*math.pi/180) +
-                                    math.cos(orbital_elements['longnode']*math.pi/180) *
-                                    math.sin(true_longitude*math.pi/180) *
-                                    math.cos(orbital_elements['I']*math.pi/180))
-        z_ecliptic = radius * (math.sin(true_longitude*math.pi/180) *
-                                    math.sin(orbital_elements['I']*math.pi/180))
+        true_longitude = true_anomaly*180/np.pi + orbital_elements['perihelion']
+        x_ecliptic = radius * (np.cos(orbital_elements['longnode']*np.pi/180) *
+                                    np.cos(true_longitude*np.pi/180) -
+                                    np.sin(orbital_elements['longnode']*np.pi/180) *
+                                    np.sin(true_longitude*np.pi/180) *
+                                    np.cos(orbital_elements['I']*np.pi/180))
+        y_ecliptic = radius * (np.sin(orbital_elements['longnode']*np.pi/180) *
+                                    np.cos(true_longitude*np.pi/180) +
+                                    np.cos(orbital_elements['longnode']*np.pi/180) *
+                                    np.sin(true_longitude*np.pi/180) *
+                                    np.cos(orbital_elements['I']*np.pi/180))
+        z_ecliptic = radius * (np.sin(true_longitude*np.pi/180) *
+                                    np.sin(orbital_elements['I']*np.pi/180))
         return x_ecliptic, y_ecliptic, z_ecliptic
 
     def compute_geocentric_position(self, **orbital_elements):
@@ -198,11 +299,8 @@ class Ephemeris():
         .. math:: ye = ys * cos(ecl)
         .. math:: ze = ys * sin(ecl)
 
-        For the moon:
-
-        .. math:: xe = r*(cos(\\Omega)*cos(v+\\omega)-sin(\\Omega)*sin(v+\\omega)*cos(I))
-        .. math:: ye = r*(sin(\\Omega)*cos(v+\\omega)+cos(\\Omega)*sin(v+\\omega)*cos(I))
-        .. math:: ze = r*(sin(v+\\omega)*sin(I))
+        For the moon, the position is computed by the truncated lunar theory
+        (c.f. `lunisolar.moon_position`).
 
         For the planets:
 
@@ -215,26 +313,21 @@ class Ephemeris():
         tuple
             Tuple which contains the geocentric position.
         """
-        ecliptic_obliquity = self.calculate_ecliptic_obliquity()*math.pi/180
+        if self.name.lower() == 'moon':
+            return _moon_equatorial_position(self.n_centuries)
+        ecliptic_obliquity = self.calculate_ecliptic_obliquity()*np.pi/180
         if self.name.lower() == 'sun':
-            x_sun, y_sun = self.compute_earth_position()
-            x_equatorial = x_sun
-            y_equatorial = y_sun * math.cos(ecliptic_obliquity)
-            z_equatorial = y_sun * math.sin(ecliptic_obliquity)
+            x_geocentric, y_geocentric = self.compute_earth_position()
+            z_geocentric = 0.0
         else:
-            if self.name.lower() == 'moon':
-                (x_geocentric,
-                y_geocentric,
-                z_geocentric) = self.compute_ecliptic_position(**orbital_elements)
-            else:
-                (x_geocentric,
-                y_geocentric,
-                z_geocentric) = self.compute_geocentric_position(**orbital_elements)
+            (x_geocentric,
+            y_geocentric,
+            z_geocentric) = self.compute_geocentric_position(**orbital_elements)
         x_equatorial = x_geocentric
-        y_equatorial = (math.cos(ecliptic_obliquity) * y_geocentric -
-                        math.sin(ecliptic_obliquity) * z_geocentric)
-        z_equatorial = (math.sin(ecliptic_obliquity) * y_geocentric +
-                        math.cos(ecliptic_obliquity) * z_geocentric)
+        y_equatorial = (np.cos(ecliptic_obliquity) * y_geocentric -
+                        np.sin(ecliptic_obliquity) * z_geocentric)
+        z_equatorial = (np.sin(ecliptic_obliquity) * y_geocentric +
+                        np.cos(ecliptic_obliquity) * z_geocentric)
         return(x_equatorial, y_equatorial, z_equatorial)
 
     def calculate_ecliptic_obliquity(self):
@@ -245,12 +338,7 @@ class Ephemeris():
         float
             Ecliptic obliquity in degrees.
         """
-        return (23.439279444444445 -
-                0.013010213611111111 * self.n_centuries**1 -
-                5.0861111111111115e-08 * self.n_centuries**2 +
-                5.565e-07 * self.n_centuries**3 -
-                1.6e-10 * self.n_centuries**4 -
-                1.2055555555555555e-11 * self.n_centuries**5)
+        return ecliptic_obliquity(self.n_centuries)
 
     def get_equatorial_coord(self):
         """Calculate equatorial coordinates.
@@ -266,11 +354,29 @@ class Ephemeris():
         (x_equatorial,
         y_equatorial,
         z_equatorial) = self.compute_equatorial_position(**self.orbital_elements)
-        right_ascencion = math.atan2(y_equatorial, x_equatorial)
-        declination = math.atan2(z_equatorial, math.sqrt(x_equatorial**2 +
-                                                         y_equatorial**2))
-        return (AngleRad(right_ascencion).radtohms(),
-                AngleRad(declination).radtodms())
+        right_ascencion = np.arctan2(y_equatorial, x_equatorial)
+        declination = np.arctan2(z_equatorial, np.sqrt(x_equatorial**2 +
+                                                       y_equatorial**2))
+        return (AngleRad(float(right_ascencion)).radtohms(),
+                AngleRad(float(declination)).radtodms())
+
+    def get_equatorial_array(self):
+        """Calculate equatorial coordinates and distances for all epochs at once
+        (c.f. `get_equatorial_coord`).
+
+        Returns
+        -------
+        tuple
+            Tuple of arrays containing right-ascensions within [0, 2pi[ and declinations
+            in radians and geocentric distances in km.
+        """
+        (x_equatorial,
+        y_equatorial,
+        z_equatorial) = self.compute_equatorial_position(**self.orbital_elements)
+        return (np.atleast_1d(np.mod(np.arctan2(y_equatorial, x_equatorial), 2*np.pi)),
+                np.atleast_1d(np.arctan2(z_equatorial, np.sqrt(x_equatorial**2 +
+                                                               y_equatorial**2))),
+                np.atleast_1d(np.sqrt(x_equatorial**2 + y_equatorial**2 + z_equatorial**2)))
 
     def get_magnitude(self):
         """Get solar system objects magnitude.
@@ -280,13 +386,114 @@ class Ephemeris():
         float
             Solar system object magnitude.
         """
-        solar_system_objects_magnitude = {'sun': -26.83,
-                                          'mercury': 0.23,
-                                          'venus': -4.14,
-                                          'moon': -12.90,
-                                          'mars': 0.71,
-                                          'jupiter': -2.20,
-                                          'saturn': 0.46,
-                                          'uranus': 6.03,
-                                          'Neptune': 7.78}
-        return solar_system_objects_magnitude[self.name.lower()]
+        return SOLAR_SYSTEM_MAGNITUDES[self.name.lower()]
+
+class SolarSystemSnapshot():
+    """SolarSystemSnapshot class computing all solar system objects positions at once
+    (c.f. `Ephemeris`).
+
+    Orbital elements of all objects are propagated and Kepler's equation is solved
+    in one pass, Earth position, ecliptic obliquity and ecliptic to equatorial
+    rotation matrices are computed once per epoch.
+
+    Attributes
+    ----------
+    names : list
+        Objects names, Sun first then objects of the orbital elements file except
+        the Earth-Moon barycenter.
+    n_centuries : numpy.ndarray
+        Numbers of centuries from J2000.
+    ecliptic_obliquity : numpy.ndarray
+        Ecliptic obliquities in radians.
+    rotation_matrix : numpy.ndarray
+        Ecliptic to equatorial rotation matrices of shape (epochs, 3, 3).
+    equatorial_position : numpy.ndarray
+        Geocentric equatorial positions in km of shape (objects, 3, epochs).
+    """
+    def __init__(self, datetime):
+        """Constructor method
+
+        Parameters
+        ----------
+        datetime : tuple | str | AstroTimeArray
+            Date and time as tuple or str (``yyyy-mm-ddThh:mm:ss``), or epochs as
+            AstroTimeArray.
+        """
+        if isinstance(datetime, AstroTimeArray):
+            self.n_centuries = (datetime.get_jd() - 2451545)/36525
+        else:
+            self.n_centuries = np.atleast_1d((AstroDateTime(datetime).get_jd() - 2451545)/36525)
+        self.ecliptic_obliquity = np.radians(ecliptic_obliquity(self.n_centuries))
+        self.rotation_matrix = np.zeros((len(self.n_centuries), 3, 3))
+        self.rotation_matrix[:, 0, 0] = 1
+        self.rotation_matrix[:, 1, 1] = np.cos(self.ecliptic_obliquity)
+        self.rotation_matrix[:, 1, 2] = -np.sin(self.ecliptic_obliquity)
+        self.rotation_matrix[:, 2, 1] = np.sin(self.ecliptic_obliquity)
+        self.rotation_matrix[:, 2, 2] = np.cos(self.ecliptic_obliquity)
+        names, table = load_orbital_elements()
+        keys = list(names)
+        earth = keys.index('em bary')
+        true_longitude, radius, ecliptic_position = compute_ecliptic_positions(
+                                                            table, self.n_centuries)
+        sun_position = np.stack((-radius[earth] * np.cos(true_longitude[earth]),
+                                 -radius[earth] * np.sin(true_longitude[earth]),
+                                 np.zeros(len(self.n_centuries))))
+        geocentric_position = ecliptic_position + sun_position
+        geocentric_position = np.concatenate((sun_position[np.newaxis],
+                                              np.delete(geocentric_position, earth, axis=0)))
+        self.names = ['Sun'] + [name for key, name in names.items() if key != 'em bary']
+        self.equatorial_position = np.einsum('tij,bjt->bit', self.rotation_matrix,
+                                             geocentric_position)
+        self.equatorial_position[self.names.index('Moon')] = _moon_equatorial_position(
+                                                                self.n_centuries)
+
+    def get_equatorial_array(self, name: str = None):
+        """Calculate equatorial coordinates and distances (c.f. `Ephemeris.get_equatorial_array`).
+
+        Parameters
+        ----------
+        name : str, optional
+            Object name, by default None for all objects.
+
+        Returns
+        -------
+        tuple
+            Tuple of arrays containing right-ascensions within [0, 2pi[ and declinations
+            in radians and geocentric distances in km, of shape (epochs) for an object
+            or (objects, epochs).
+
+        Raises
+        ------
+        ValueError
+            Unknown Object.
+        """
+        position = self.equatorial_position
+        if name is not None:
+            lower_names = [item.lower() for item in self.names]
+            if name.lower() not in lower_names:
+                raise ValueError ("Unknown object")
+            position = position[lower_names.index(name.lower())]
+        x_equatorial, y_equatorial, z_equatorial = np.moveaxis(position, -2, 0)
+        return (np.mod(np.arctan2(y_equatorial, x_equatorial), 2*np.pi),
+                np.arctan2(z_equatorial, np.sqrt(x_equatorial**2 + y_equatorial**2)),
+                np.sqrt(x_equatorial**2 + y_equatorial**2 + z_equatorial**2))
+
+    def to_equatorial_array(self, index: int = 0):
+        """Get all objects coordinates at one epoch.
+
+        Parameters
+        ----------
+        index : int, optional
+            Epoch index, by default 0.
+
+        Returns
+        -------
+        EquatorialArray
+            Objects coordinates with names and magnitudes.
+        """
+        right_ascension, declination = self.get_equatorial_array()[:2]
+        return EquatorialArray(np.degrees(right_ascension[:, index]),
+                               np.degrees(declination[:, index]),
+                               name=self.names,
+                               magnitude=[SOLAR_SYSTEM_MAGNITUDES.get(name.lower(), np.nan)
+                                          for name in self.names])
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from pytest import approx
+
+from astro_toolbox.coordinates.chebyshev import ChebyshevEphemeris, write_chebyshev_file
+from astro_toolbox.coordinates.solar_system import SolarSystemSnapshot
+from astro_toolbox.time.arrays import AstroTimeArray
+
+def test_chebyshev_matches_snapshot(tmp_path):
+    path = str(tmp_path / 'ephemeris.bin')
+    write_chebyshev_file(path, 2459960.5, 2460060.5)
+    ephemeris = ChebyshevEphemeris(path)
+    times = AstroTimeArray(np.linspace(2459960.5, 2460060.5, 301))
+    snapshot = SolarSystemSnapshot(times)
+    assert ephemeris.names == snapshot.names
+    assert ephemeris.get_position(times) == approx(snapshot.equatorial_position, abs=1.0)
+    right_ascension, declination, distance = ephemeris.get_equatorial_array(times, 'moon')
+    expected = snapshot.get_equatorial_array('Moon')
+    assert declination == approx(expected[1], abs=1e-9)
+    assert distance == approx(expected[2], rel=1e-9)
+
+def test_chebyshev_errors(tmp_path):
+    path = str(tmp_path / 'ephemeris.bin')
+    ephemeris = write_chebyshev_file(path, 2459960.5, 2459970.5, segment_days=4.0, degree=8)
+    assert ephemeris.stop == 2459972.5
+    with pytest.raises(ValueError):
+        ephemeris.get_position(2459950.5)
+    with pytest.raises(ValueError):
+        ephemeris.get_position(2459965.5, 'Pluto')
+    (tmp_path / 'other.bin').write_bytes(b'not an ephemeris file')
+    with pytest.raises(ValueError):
+        ChebyshevEphemeris(str(tmp_path / 'other.bin'))
+
+def test_chebyshev_names(tmp_path):
+    path = tmp_path / 'ephemeris.bin'
+    def source(names):
+        return lambda julian_days: (names, np.zeros((len(names), 3, len(julian_days))))
+    ephemeris = write_chebyshev_file(str(path), 2459960.5, 2459968.5,
+                                     source=source(['C/2023 A3-Tsuchi']))
+    assert ephemeris.names == ['C/2023 A3-Tsuchi']
+    for name in ('C/2023 A3 (Tsuchinshan-ATLAS)', 'Tsuchinshan–ATLAS'):
+        with pytest.raises(ValueError):
+            write_chebyshev_file(str(tmp_path / 'other.bin'), 2459960.5, 2459968.5,
+                                 source=source([name]))
+    assert not (tmp_path / 'other.bin').exists()
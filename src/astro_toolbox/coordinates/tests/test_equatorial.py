@@ -1,5 +1,7 @@
 """Calculate for 2023-01-15 at 00h00m00s TU @Greenwich
 """
+import math
+import numpy as np
 from pytest import approx
 
 from astro_toolbox.coordinates.equatorial import Equatorial
@@ -7,6 +9,9 @@ from astro_toolbox.coordinates.horizontal import Horizontal
 from astro_toolbox.time.core import AstroDateTime
 from astro_toolbox.angle.hms import AngleHMS
 from astro_toolbox.coordinates.location import Location
+from astro_toolbox.coordinates.arrays import EquatorialArray, HorizontalArray
+from astro_toolbox.coordinates.precession import precession_matrix
+from astro_toolbox.time.arrays import AstroTimeArray
 
 capella = Equatorial(name='Capella',alpha=(5, 16, 43.32), delta=(+45,59,48.3))
 ut_time = AstroDateTime((2023, 1, 15, 0, 0, 0))
@@ -23,6 +28,44 @@ def test_to_horizontal():
     assert capella.to_horizontal(gamma, location) == ((270, 24, approx(19.10, rel=1e-2)),
                                                     (+66, 30, approx(43.48, rel=1e-2)))
 
+def test_scalar_angles_regression():
+    # Values computed before angles were stored in radians with cached trigonometry
+    sirius = Equatorial(name='Sirius', alpha=(6, 45, 8.92), delta=(-16, 42, 58.0))
+    assert capella.calculate_airmass(gamma, location) == approx(1.089931748945515, rel=1e-12)
+    assert sirius.calculate_airmass(gamma, location) == approx(2.7850027069048395, rel=1e-12)
+    assert capella.to_horizontal(gamma, location) == ((270, 24, approx(19.1035857, abs=1e-6)),
+                                                      (66, 30, approx(43.4821434, abs=1e-6)))
+    assert sirius.to_horizontal(gamma, location)[1] == (20, 52, approx(46.6369593, abs=1e-6))
+
+def test_to_horizontal_grid():
+    lst = AngleHMS(gamma).hmstorad()
+    grid = EquatorialArray.from_equatorial([capella]).to_horizontal_grid([lst], location)
+    assert math.degrees(grid['hour_angle'][0][0]) == approx(35.001, rel=1e-3)
+    assert math.degrees(grid['azimuth'][0][0]) == approx(270 + 24/60 + 19.10/3600, rel=1e-6)
+    assert math.degrees(grid['altitude'][0][0]) == approx(66 + 30/60 + 43.48/3600, rel=1e-6)
+    assert grid['airmass'][0][0] == approx(capella.calculate_airmass(gamma, location), rel=1e-9)
+
+def test_to_horizontal_grid_below_horizon():
+    objects = EquatorialArray([0, 90], [-80, 45])
+    grid = objects.to_horizontal_grid([0, 0.5], location, dtype=np.float32,
+                                      quantities=('airmass',))
+    assert grid['airmass'].shape == (2, 2) and grid['airmass'].dtype == np.float32
+    assert list(grid['airmass'][0]) == [40, 40]
+
+def test_precess():
+    capella_2023 = capella.precess(2023)
+    assert (capella_2023.alpha.anglevalue, capella_2023.delta.anglevalue) == ((5, 18, approx(25.34, rel=1e-3)), (+46, 1, approx(13.15, rel=1e-3)))
+    assert capella.alpha.anglevalue == (5, 16, 43.32)
+
+def test_precession_matrix():
+    matrix = precession_matrix(2023.0)
+    assert np.allclose(matrix @ matrix.T, np.eye(3))
+    assert precession_matrix(2023.0) is matrix
+
+def test_array_precess():
+    capella_2023 = EquatorialArray.from_equatorial([capella]).precess(2023)[0]
+    assert capella_2023.alpha.hmstodeg() == approx(capella.precess(2023).alpha.hmstodeg(), rel=1e-12)
+
 def test_compute_on_date_coord():
     capella.compute_on_date_coord(2023)
     assert (capella.alpha.anglevalue, capella.delta.anglevalue) == ((5, 18, approx(25.30, rel=1e-2)), (+46, 1, approx(14.83, rel=1e-2)))
@@ -39,3 +82,36 @@ capella_horiz = Horizontal(name='Capella', azimuth=(270, 24, 27.69), altitude=(+
 
 def test_to_equatorial():
     assert capella_horiz.to_equatorial(gamma, location) == ((5, 16, approx(42.58, rel=1e-2)), (+45, 59, approx(48.3, rel=1e-2)))
+
+def test_rise_set_transit():
+    objects = EquatorialArray.from_equatorial([sirius, Equatorial(alpha=(2, 31, 49.1),
+                                                                  delta=(+89, 15, 51))])
+    times = objects.rise_set_transit(location, [(2023, 1, 15), (2023, 1, 16)])
+    assert times['rise'].shape == (2, 2)
+    assert list(times['circumpolar'][:, 0]) == [False, True]
+    assert np.isnan(times['rise'][1]).all()
+    for event in ('rise', 'set'):
+        lst = AstroTimeArray([2459959.5 + times[event][0][0]/24]).get_lst(location)
+        altitude = objects[0:1].to_horizontal_grid(lst, location)['altitude'][0][0]
+        assert math.degrees(altitude) == approx(0, abs=1e-3)
+    lst = AstroTimeArray([2459959.5 + times['transit'][0][0]/24]).get_lst(location)
+    assert objects[0:1].get_hourangle(lst)[0][0] == approx(0, abs=1e-5)
+
+def test_horizontal_calculate_airmass():
+    assert capella_horiz.calculate_airmass() == approx(1.09, rel=1e-2)
+
+def test_array_to_equatorial():
+    lst = AngleHMS(gamma).hmstorad()
+    capella_eq = HorizontalArray.from_horizontal([capella_horiz]).to_equatorial(lst, location)
+    assert capella_eq.alpha.todeg()[0] == approx((5 + 16/60 + 42.58/3600)*15, rel=1e-6)
+    assert capella_eq.delta.todeg()[0] == approx(45 + 59/60 + 48.3/3600, rel=1e-6)
+
+def test_array_horizontal_round_trip():
+    lst = np.linspace(0, 2*math.pi, 7)
+    objects = EquatorialArray(np.linspace(0, 350, 7), np.linspace(-60, 85, 7))
+    horizontal = objects.to_horizontal(lst, location)
+    assert np.allclose(horizontal.azimuth.todeg(),
+                       np.degrees(np.diag(objects.to_horizontal_grid(lst, location)['azimuth'])))
+    equatorial = horizontal.to_equatorial(lst, location)
+    assert np.allclose(np.mod(equatorial.alpha.todeg() - objects.alpha.todeg() + 180, 360), 180)
+    assert np.allclose(equatorial.delta.todeg(), objects.delta.todeg())
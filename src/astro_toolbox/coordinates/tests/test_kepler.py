@@ -0,0 +1,20 @@
+import numpy as np
+from pytest import approx
+
+from astro_toolbox.coordinates.kepler import solve_kepler
+
+def test_solve_kepler_scalar():
+    eccentric_anomaly, converged = solve_kepler(1.0, 0.5)
+    assert converged
+    assert float(eccentric_anomaly) == approx(1.498701133, abs=1e-9)
+
+def test_solve_kepler_array():
+    mean_anomaly = np.linspace(-10, 10, 201)
+    eccentricity = np.linspace(0, 0.999, 201)
+    eccentric_anomaly, converged = solve_kepler(mean_anomaly, eccentricity)
+    assert converged.all()
+    assert eccentric_anomaly - eccentricity * np.sin(eccentric_anomaly) == approx(mean_anomaly, abs=1e-12)
+
+def test_solve_kepler_max_iterations():
+    converged = solve_kepler([0.1, 2.0], 0.99, max_iterations=1)[1]
+    assert not converged.any()
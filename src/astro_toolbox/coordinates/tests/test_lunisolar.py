@@ -0,0 +1,32 @@
+import numpy as np
+from pytest import approx
+
+from astro_toolbox.coordinates.location import Location
+from astro_toolbox.coordinates.lunisolar import (ASTRONOMICAL_UNIT, get_crossings,
+                                                 moon_position, sun_position,
+                                                 topocentric_position)
+
+def test_sun_position():
+    right_ascension, declination, distance = sun_position(2448908.5)
+    assert np.degrees(right_ascension) == approx(198.38083, abs=1e-4)
+    assert np.degrees(declination) == approx(-7.78507, abs=1e-4)
+    assert distance/ASTRONOMICAL_UNIT == approx(0.99766, abs=1e-5)
+
+def test_moon_position():
+    right_ascension, declination, distance = moon_position([2448724.5, 2448724.5])
+    assert np.degrees(right_ascension) == approx([134.688470] * 2, abs=0.02)
+    assert np.degrees(declination) == approx([13.768368] * 2, abs=0.02)
+    assert distance == approx([368409.7] * 2, abs=100)
+
+def test_topocentric_position():
+    location = Location('Test', (45, 0, 0), (0, 0, 0), 0)
+    declination = topocentric_position(0.0, 0.0, 384400.0, 0.0, location)[1]
+    assert np.degrees(declination) == approx(-0.67, abs=0.01)
+    right_ascension = topocentric_position(1.0, 0.0, 1e12, 0.0, location)[0]
+    assert right_ascension == approx(1.0, abs=1e-6)
+
+def test_get_crossings():
+    hours = np.arange(0, 24, 0.5)
+    rise_times, set_times = get_crossings(hours, np.radians(np.sin(hours*np.pi/12 - 1)))
+    assert rise_times == approx([12/np.pi], abs=0.05)
+    assert set_times == approx([12 + 12/np.pi], abs=0.05)
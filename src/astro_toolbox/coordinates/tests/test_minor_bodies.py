@@ -0,0 +1,59 @@
+import numpy as np
+from pytest import approx
+
+from astro_toolbox.coordinates.minor_bodies import MinorBodies, unpack_epoch
+from astro_toolbox.coordinates.solar_system import SolarSystemSnapshot
+from astro_toolbox.time.arrays import AstroTimeArray
+
+def fixed_width_line(fields, width=202):
+    line = [' '] * width
+    for column, value in fields:
+        line[column - 1:column - 1 + len(value)] = value
+    return ''.join(line)
+
+ceres_line = fixed_width_line([(1, '00001'), (9, ' 3.34'), (15, ' 0.15'), (21, 'K24AH'),
+                               (27, '145.84905'), (38, ' 73.28579'), (49, ' 80.25214'),
+                               (60, ' 10.58789'), (71, '0.0791760'), (81, ' 0.21418533'),
+                               (93, '  2.7666197'), (167, '(1) Ceres')])
+comet_line = fixed_width_line([(5, 'C'), (6, '2023A3 '), (15, '2024'), (20, '09'),
+                               (23, '27.7405'), (31, ' 0.391415'), (42, '1.000101'),
+                               (52, '308.4903'), (62, ' 21.5566'), (72, '139.1118'),
+                               (82, '20241017'), (92, ' 4.8'), (97, ' 3.2'),
+                               (103, 'C/2023 A3 (Tsuchinshan-ATLAS)')], width=168)
+
+def test_unpack_epoch():
+    assert unpack_epoch('K24AH') == (2024, 10, 17)
+    assert unpack_epoch('J9611') == (1996, 1, 1)
+
+def test_from_mpc_files():
+    asteroids = MinorBodies.from_mpcorb(['MPCORB header', '-' * 160, ceres_line])
+    assert asteroids.name == ['(1) Ceres']
+    assert asteroids.perihelion_distance == approx([2.7666197 * (1 - 0.0791760)])
+    assert asteroids.perihelion_time == approx([2460600.5 - 145.84905/0.21418533])
+    comets = MinorBodies.from_comet_elements([comet_line])
+    assert comets.name == ['C/2023 A3 (Tsuchinshan-ATLAS)']
+    assert comets.comet.all() and comets.slope == approx([3.2])
+    assert comets.perihelion_time == approx([2460581.2405], abs=1e-6)
+
+def test_matches_planet_model():
+    semi_major_axis, eccentricity = 1.52371034, 0.09339410
+    mean_anomaly = -4.55343205 + 23.94362959
+    mars = MinorBodies(['Mars'], [semi_major_axis * (1 - eccentricity)], [eccentricity],
+                       [1.84969142], [49.55953891], [-23.94362959 - 49.55953891],
+                       [2451545 - mean_anomaly * semi_major_axis**1.5 / 0.9856076686])
+    times = AstroTimeArray([2451545.0, 2451600.0])
+    right_ascension, declination = mars.get_equatorial_array(times)[:2]
+    expected = SolarSystemSnapshot(times).get_equatorial_array('Mars')
+    assert right_ascension[0] == approx(expected[0], abs=2e-4)
+    assert declination[0] == approx(expected[1], abs=2e-4)
+
+def test_orbit_types_continuity():
+    comets = MinorBodies(['elliptic', 'parabolic', 'hyperbolic'], [0.5] * 3,
+                         [0.999999, 1.0, 1.000001], [30] * 3, [40] * 3, [50] * 3,
+                         [2451545.0] * 3, [5.0] * 3, comet=[True] * 3)
+    right_ascension = comets.get_equatorial_array(np.array([2451530.0, 2451600.0]))[0]
+    assert right_ascension[0] == approx(right_ascension[1], abs=1e-5)
+    assert right_ascension[2] == approx(right_ascension[1], abs=1e-5)
+    coordinates = comets[1:].to_equatorial_array(2451600.0)
+    assert coordinates.name == ['parabolic', 'hyperbolic']
+    assert np.isfinite(coordinates.magnitude).all()
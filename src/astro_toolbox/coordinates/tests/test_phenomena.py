@@ -0,0 +1,34 @@
+import numpy as np
+from pytest import approx
+
+from astro_toolbox.coordinates.phenomena import find_phenomena, phenomena_year, refine_roots
+from astro_toolbox.time.arrays import AstroTimeArray
+
+def event(phenomena, name, kind):
+    return phenomena[(phenomena['name'] == name) & (phenomena['event'] == kind)]
+
+def test_refine_roots():
+    roots = refine_roots(lambda epochs, active: np.cos(epochs) - epochs / 10,
+                         [0.0, 4.0], [2.0, 6.0], [1.0, np.cos(4.0) - 0.4],
+                         [np.cos(2.0) - 0.2, np.cos(6.0) - 0.6], tolerance=1e-12)
+    assert np.cos(roots) - roots / 10 == approx([0.0, 0.0], abs=1e-10)
+
+def test_phenomena_2024():
+    phenomena = phenomena_year(2024)
+    assert phenomena is phenomena_year(2024)
+    assert not phenomena.flags.writeable
+    assert np.all(np.diff(phenomena['jd']) >= 0)
+    saturn = event(phenomena, 'Saturn', 'opposition')
+    assert saturn['jd'] == approx(AstroTimeArray(['2024-09-08T05:00:00']).jd, abs=1.0)
+    jupiter = event(phenomena, 'Jupiter', 'opposition')
+    assert jupiter['jd'] == approx(AstroTimeArray(['2024-12-07T20:00:00']).jd, abs=1.0)
+    mercury = event(phenomena, 'Mercury', 'greatest elongation west')
+    assert mercury['jd'][0] == approx(AstroTimeArray(['2024-01-12T15:00:00']).jd[0], abs=1.0)
+    assert mercury['value'][0] == approx(23.5, abs=0.2)
+    venus = event(phenomena, 'Venus', 'superior conjunction')
+    assert venus['jd'] == approx(AstroTimeArray(['2024-06-04T15:00:00']).jd, abs=1.0)
+
+def test_find_phenomena_years():
+    phenomena = find_phenomena(2024, 2025)
+    assert len(phenomena) == len(phenomena_year(2024)) + len(phenomena_year(2025))
+    assert len(event(phenomena, 'Mars', 'opposition')) == 1
@@ -0,0 +1,102 @@
+"""Site registry tests on a temporary copy of sites.json
+"""
+import json
+import shutil
+import threading
+import concurrent.futures
+
+from pytest import approx
+
+from astro_toolbox.coordinates import sites
+from astro_toolbox.coordinates.sites import SiteRegistry, SqliteSiteRegistry, PATH
+
+def make_registry(tmp_path):
+    shutil.copy(PATH + 'sites.json', tmp_path / 'sites.json')
+    return SiteRegistry(str(tmp_path / 'sites.json'), str(tmp_path / 'last_site.json'))
+
+def test_get_case_insensitive(tmp_path):
+    registry = make_registry(tmp_path)
+    assert list(registry.get('pic du midi')) == ['Pic du Midi']
+    assert 'SILLA' in registry
+
+def test_last_site(tmp_path):
+    registry = make_registry(tmp_path)
+    registry.set_last_site('Silla')
+    assert list(registry.to_dict())[0] == 'Silla'
+    registry.flush()
+    assert json.loads((tmp_path / 'last_site.json').read_text(encoding="utf-8")) == {'name': 'Silla'}
+    assert make_registry(tmp_path).get_last_site() == 'Silla'
+
+def test_flush_merges_concurrent_changes(tmp_path):
+    registry = make_registry(tmp_path)
+    other = SiteRegistry(registry.path, registry.last_site_path)
+    registry.add('Home', {'latitude': "+45°00'00.00\"", 'longitude': "+01°00'00.00\"",
+                          'elevation': 100.0})
+    other.delete('silla')
+    registry.flush()
+    other.flush()
+    dict_sites = json.loads((tmp_path / 'sites.json').read_text(encoding="utf-8"))
+    assert 'Home' in dict_sites and 'Silla' not in dict_sites
+
+def test_sqlite_registry(tmp_path):
+    registry = SqliteSiteRegistry(str(tmp_path / 'sites.db'))
+    assert list(registry.get('GREENWICH')) == ['Greenwich']
+    registry.add('Home', {'latitude': "+43°00'00.00\"", 'longitude': "+00°30'00.00\"",
+                          'elevation': 100.0})
+    registry.flush()
+    registry = SqliteSiteRegistry(str(tmp_path / 'sites.db'))
+    assert registry.get_last_site() == 'Home'
+    assert [name for name, _ in registry.within(43.0, 0.5, 100)] == ['Home', 'Pic du Midi']
+    assert registry.in_latitude_band(-90, 0) == ['Silla']
+    registry.update('home', {'elevation': 200.0})
+    registry.delete('Silla')
+    registry.export_json(str(tmp_path / 'export.json'))
+    dict_sites = json.loads((tmp_path / 'export.json').read_text(encoding="utf-8"))
+    assert list(dict_sites)[0] == 'Home' and dict_sites['Home']['elevation'] == 200.0
+    assert 'Silla' not in dict_sites
+
+def test_within(tmp_path):
+    registry = make_registry(tmp_path)
+    assert registry.within(51.5, 0.0, 10) == [('Greenwich', approx(2.46, abs=0.01))]
+
+def test_sqlite_registry_threads_and_close(tmp_path):
+    registry = SqliteSiteRegistry(str(tmp_path / 'sites.db'))
+    registry.set_last_site('Silla')
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        names = list(executor.map(lambda name: list(registry.get(name))[0],
+                                  ['greenwich', 'silla', 'pic du midi'] * 10))
+    assert names[:3] == ['Greenwich', 'Silla', 'Pic du Midi']
+    registry.close()
+    assert registry._connection is None
+    assert SqliteSiteRegistry(str(tmp_path / 'sites.db')).get_last_site() == 'Silla'
+
+def test_sqlite_registry_items_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(sites, 'ITEMS_BATCH_SIZE', 2)
+    registry = SqliteSiteRegistry(str(tmp_path / 'sites.db'))
+    names = [name for name, _ in registry.items()]
+    for index in range(5):
+        registry.add(f'Site {index}', {'latitude': "+45°00'00.00\"",
+                                       'longitude': "+01°00'00.00\"", 'elevation': 0.0})
+    registry.set_last_site('Silla')
+    items = registry.items()
+    assert next(items)[0] == 'Silla'
+    registry.add('Late', {'latitude': "+45°00'00.00\"", 'longitude': "+01°00'00.00\"",
+                          'elevation': 0.0})
+    expected = [name for name in names if name != 'Silla']
+    expected += [f'Site {index}' for index in range(5)] + ['Late']
+    assert [name for name, _ in items] == expected
+
+def test_get_registry_single_instance(tmp_path, monkeypatch):
+    monkeypatch.setattr(SiteRegistry, '_instance', None)
+    monkeypatch.setenv('ASTRO_TOOLBOX_SITES_DB', str(tmp_path / 'sites.db'))
+    closers = []
+    monkeypatch.setattr(sites.atexit, 'register', closers.append)
+    barrier = threading.Barrier(8)
+    def get_registry():
+        barrier.wait()
+        return SiteRegistry.get_registry()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        registries = list(executor.map(lambda _: get_registry(), range(8)))
+    assert all(registry is registries[0] for registry in registries)
+    assert len(closers) == 1
+    registries[0].close()
@@ -1,8 +1,12 @@
 from pytest import approx
 
-from astro_toolbox.coordinates.solar_system import Ephemeris
+from astro_toolbox.coordinates.solar_system import Ephemeris, SolarSystemSnapshot
 from astro_toolbox.time.core import AstroDateTime
+from astro_toolbox.time.arrays import AstroTimeArray
+from astro_toolbox.angle.hms import AngleHMS
+from astro_toolbox.angle.dms import AngleDMS
 
+saturn_time = AstroDateTime((2023, 1, 15, 0, 0, 0))
 saturn = Ephemeris('Saturn', (2023, 1, 15, 0, 0, 0))
 
 def test_get_equatorial_coord():
@@ -10,3 +14,32 @@ def test_get_equatorial_coord():
 
 def test_get_magnitude():
     assert saturn.get_magnitude() == 0.46
+
+def test_sun_get_equatorial_coord():
+    sun = Ephemeris('Sun', (2023, 1, 15, 0, 0, 0))
+    assert sun.get_equatorial_coord() == ((19, 44, approx(33.51, rel=1e-2)), (-21, 15, approx(49.41, rel=1e-2)))
+
+def test_get_equatorial_array():
+    epochs = AstroTimeArray([saturn_time.get_jd(), saturn_time.get_jd(10)])
+    alpha, delta, distance = Ephemeris('Saturn', epochs).get_equatorial_array()
+    assert alpha[0] == approx(AngleHMS(saturn.get_equatorial_coord()[0]).hmstorad(), rel=1e-9)
+    assert delta[0] == approx(AngleDMS(saturn.get_equatorial_coord()[1]).dmstorad(), rel=1e-9)
+    assert distance[0] == approx(10.66 * 149597870.7, rel=1e-3)
+    assert alpha[1] != alpha[0]
+
+def test_snapshot_matches_ephemeris():
+    snapshot = SolarSystemSnapshot((2023, 1, 15, 0, 0, 0))
+    right_ascension, declination, distance = snapshot.get_equatorial_array('Saturn')
+    expected = saturn.get_equatorial_array()
+    assert right_ascension == approx(expected[0], abs=1e-12)
+    assert declination == approx(expected[1], abs=1e-12)
+    assert distance == approx(expected[2], rel=1e-12)
+
+def test_snapshot_epochs():
+    times = AstroTimeArray([saturn_time.get_jd(), saturn_time.get_jd(1)])
+    snapshot = SolarSystemSnapshot(times)
+    assert snapshot.names[0] == 'Sun' and 'EM Bary' not in snapshot.names
+    assert snapshot.get_equatorial_array()[0].shape == (len(snapshot.names), 2)
+    sun = snapshot.to_equatorial_array(0)[0]
+    assert sun.name == 'Sun'
+    assert sun.alpha.hmstodeg() == approx(AngleHMS((19, 44, 33.51)).hmstodeg(), abs=1e-2)
@@ -2,7 +2,6 @@
 """
 import sys
 import pathlib
-import json
 import datetime
 import pkg_resources
 
@@ -13,6 +12,7 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib import pyplot as plt
 
 from astro_toolbox.coordinates.location import Location
+from astro_toolbox.coordinates.sites import SiteRegistry
 from astro_toolbox.coordinates.equatorial import Equatorial
 from astro_toolbox.angle.degrees import AngleDeg
 from astro_toolbox.angle.hms import AngleHMS
@@ -24,12 +24,11 @@ from astro_toolbox.query.weather import OpenMeteo
 from astro_toolbox.scripts.plots import airmas_map
 from astro_toolbox.scripts.plots import polarstar_plt_northern
 from astro_toolbox.scripts.plots import polarstar_plt_southern
-from astro_toolbox.scripts.planning import get_multiple_informations
+from astro_toolbox.scripts.planning import resolve_objects
 
 from astro_toolbox.query.ephemeris import DICT_OBJECTS
 
 PATH_GUI = pkg_resources.resource_filename('astro_toolbox', 'gui/')
-PATH = pkg_resources.resource_filename('astro_toolbox', 'coordinates/data/')
 PATH_2 = pkg_resources.resource_filename('astro_toolbox', 'query/weather_icons/')
 
 class Application():
@@ -167,17 +166,17 @@ class Application():
                     self.gui.dateTimeEditInfo.dateTime())
         for object_name in objects_list:
             if object_name.lower() in [key.lower() for key in DICT_OBJECTS]:
-                item = Horizons(object_name, time, site)
+                item = Horizons(object_name, time, site).fetch()
                 alpha, delta = item.get_equatorial_coord()
                 obj_name = item.get_name()
                 obj_magnitude = item.get_magnitude()
             else:
-                item = Simbad(object_name)
+                item = Simbad(object_name).fetch()
                 alpha, delta = item.get_equatorial_coord()
                 obj_name = item.get_name()
                 obj_magnitude = item.get_magnitude()
             coord = Equatorial(alpha=alpha, delta=delta, name=obj_name, magnitude=obj_magnitude)
-            coord.compute_on_date_coord(AstroDateTime(time).get_year())
+            coord = coord.precess(AstroDateTime(time).get_epoch())
             gamma = AstroDateTime(time).get_lst(site)
             self.gui.listInfo.addItem(f'{coord}' +
                     f' HA = {AngleHMS(coord.get_hourangle(gamma=gamma))}'
@@ -208,7 +207,7 @@ class Application():
         location = self.gui.comboBoxWeather.currentText()
         days = self.gui.spinBoxWeather_1.value()
         past = self.gui.spinBoxWeather_2.value()
-        weather_forecasts = OpenMeteo(Location(location))
+        weather_forecasts = OpenMeteo(Location(location)).fetch()
         for i, time in enumerate(weather_forecasts.data['hourly']['time']
                                  [72 - 24 * past :72 + 24*days]):
             time += ':00'
@@ -253,8 +252,7 @@ class Application():
     def load_json(self):
         """Json loading method.
         """
-        with open(PATH  + 'sites.json', encoding="utf-8") as json_file:
-            return json.load(json_file)
+        return SiteRegistry.get_registry().to_dict()
     def wmotoimage(self, code):
         """Function to convert WMO code to icon.
 
@@ -337,7 +335,22 @@ class Application():
                   self.gui.spinBoxAirmass_2.value()]
         ut_time = AstroDateTime(date)
         site = Location(location)
-        object_dict = get_multiple_informations(objects_list, site, date, bounds)
+        progress_dialog = QtWidgets.QProgressDialog("Querying information...", None, 0,
+                                                    len(objects_list), self.gui)
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        resolved = []
+        def progress(name, error):
+            resolved.append(name)
+            progress_dialog.setValue(len(resolved))
+            progress_dialog.setLabelText(name)
+            self.app.processEvents()
+        object_dict, failures = resolve_objects(objects_list, site, date, progress=progress)
+        progress_dialog.close()
+        if failures:
+            QtWidgets.QMessageBox.warning(self.gui, 'Airmass',
+                                          '\n'.join(f'{name}: {error}'
+                                                    for name, error in failures.items()))
         temporary_dict = {}
         if self.gui.radioButtonAirmass.isChecked():
             pdf = PdfPages(pathlib.Path(self.gui.lineEditAirmass_browser.text() +
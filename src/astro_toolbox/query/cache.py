@@ -0,0 +1,250 @@
+"""This module contains ResponseCache class.
+"""
+import os
+import time
+import sqlite3
+import threading
+import collections
+
+CACHE_TTLS = {'sesame': None,
+              'horizons': 30 * 86400,
+              'openmeteo': 3 * 3600}
+CACHE_MAX_SIZE = 64 * 1024**2
+_INSTANCE_LOCK = threading.Lock()
+
+def user_cache_path():
+    """Default cache database path in the user cache directory
+    (``%LOCALAPPDATA%`` on Windows, ``$XDG_CACHE_HOME`` or ``~/.cache`` otherwise).
+
+    Returns
+    -------
+    str
+        Database path.
+    """
+    if os.name == 'nt' and os.environ.get('LOCALAPPDATA'):
+        directory = os.environ['LOCALAPPDATA']
+    else:
+        directory = (os.environ.get('XDG_CACHE_HOME') or
+                     os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(directory, 'astro_toolbox', 'responses.sqlite')
+
+class ResponseCache():
+    """Process-wide on-disk cache of web services responses.
+
+    Responses are stored as text in a SQLite database, keyed by service and
+    request (e.g. the request URL). Each service has its own time to live, None
+    for responses which never expire (e.g. Sesame J2000 positions). When the
+    database exceeds its maximum size the least recently used responses are
+    evicted. Hits and misses are counted per service.
+
+    Attributes
+    ----------
+    path : str
+        Database path.
+    max_size : int
+        Maximum responses size in bytes.
+    ttls : dict
+        Time to live in seconds per service (c.f. `CACHE_TTLS`).
+    enabled : bool
+        Responses are read and stored when enabled.
+    refresh : bool
+        Responses are requested again and stored when refresh.
+    hits : collections.Counter
+        Hits per service.
+    misses : collections.Counter
+        Misses per service.
+    """
+    _instance = None
+
+    def __init__(self, path: str = None, max_size: int = CACHE_MAX_SIZE, ttls: dict = None,
+                 enabled: bool = True, refresh: bool = False):
+        """Constructor method
+
+        Parameters
+        ----------
+        path : str, optional
+            Database path, by default None for `user_cache_path`.
+        max_size : int, optional
+            Maximum responses size in bytes, by default 64 MiB.
+        ttls : dict, optional
+            Time to live in seconds per service updating `CACHE_TTLS`, by default None.
+        enabled : bool, optional
+            Read and store responses, by default True.
+        refresh : bool, optional
+            Request responses again, by default False.
+        """
+        self.path = path or user_cache_path()
+        self.max_size = max_size
+        self.ttls = dict(CACHE_TTLS, **(ttls or {}))
+        self.enabled = enabled
+        self.refresh = refresh
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_cache():
+        """Get the process-wide cache, its path is given by the
+        ``ASTRO_TOOLBOX_CACHE`` environment variable when set.
+
+        Returns
+        -------
+        ResponseCache
+            Shared cache.
+        """
+        with _INSTANCE_LOCK:
+            if ResponseCache._instance is None:
+                ResponseCache._instance = ResponseCache(os.environ.get('ASTRO_TOOLBOX_CACHE'))
+            return ResponseCache._instance
+
+    def _load(self):
+        """Open the database on first access.
+        """
+        if self._connection is not None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    service TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL,
+                    PRIMARY KEY (service, key));
+                CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);""")
+
+    def get(self, service: str, key: str):
+        """Get a response if stored and not expired.
+
+        Parameters
+        ----------
+        service : str
+            Service name.
+        key : str
+            Request key.
+
+        Returns
+        -------
+        str | None
+            Response, None on miss.
+        """
+        with self._lock:
+            self._load()
+            row = self._connection.execute(
+                    "SELECT value, created FROM responses WHERE service = ? AND key = ?",
+                    (service, key)).fetchone()
+            now = time.time()
+            ttl = self.ttls.get(service)
+            if row is None or (ttl is not None and now - row[1] > ttl):
+                self.misses[service] += 1
+                return None
+            with self._connection:
+                self._connection.execute(
+                        "UPDATE responses SET accessed = ? WHERE service = ? AND key = ?",
+                        (now, service, key))
+            self.hits[service] += 1
+            return row[0]
+
+    def set(self, service: str, key: str, value: str):
+        """Store a response, least recently used responses are evicted beyond the
+        maximum size.
+
+        Parameters
+        ----------
+        service : str
+            Service name.
+        key : str
+            Request key.
+        value : str
+            Response.
+        """
+        with self._lock:
+            self._load()
+            now = time.time()
+            with self._connection:
+                self._connection.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                        (service, key, value, len(value.encode('utf-8')), now, now))
+                self._connection.execute("""
+                    DELETE FROM responses WHERE rowid IN (
+                        SELECT rowid FROM (
+                            SELECT rowid, SUM(size) OVER (ORDER BY accessed DESC, rowid DESC)
+                                AS total FROM responses)
+                        WHERE total > ?)""", (self.max_size,))
+
+    def fetch(self, service: str, key: str, function):
+        """Get a response from the cache or from function, the new response is stored.
+
+        Parameters
+        ----------
+        service : str
+            Service name.
+        key : str
+            Request key.
+        function : callable
+            Function without arguments returning the response as str, exceptions
+            are raised and nothing is stored.
+
+        Returns
+        -------
+        str
+            Response.
+        """
+        if not self.enabled:
+            return function()
+        value = None if self.refresh else self.get(service, key)
+        if value is None:
+            value = function()
+            self.set(service, key, value)
+        return value
+
+    def clear(self, service: str = None):
+        """Remove stored responses.
+
+        Parameters
+        ----------
+        service : str, optional
+            Service name, by default None for all services.
+        """
+        with self._lock:
+            self._load()
+            with self._connection:
+                if service is None:
+                    self._connection.execute("DELETE FROM responses")
+                else:
+                    self._connection.execute("DELETE FROM responses WHERE service = ?",
+                                             (service,))
+
+    def get_statistics(self):
+        """Get stored responses and counters per service.
+
+        Returns
+        -------
+        dict
+            Dictionary ``{service: {'entries', 'size', 'hits', 'misses'}}``.
+        """
+        with self._lock:
+            self._load()
+            rows = self._connection.execute(
+                    "SELECT service, COUNT(*), SUM(size) FROM responses GROUP BY service"
+                    ).fetchall()
+        statistics = {service: {'entries': 0, 'size': 0, 'hits': 0, 'misses': 0}
+                      for service in set(self.hits) | set(self.misses)}
+        for service, entries, size in rows:
+            statistics[service] = {'entries': entries, 'size': size, 'hits': 0, 'misses': 0}
+        for service, item in statistics.items():
+            item.update({'hits': self.hits[service], 'misses': self.misses[service]})
+        return statistics
+
+    def close(self):
+        """Close the database.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
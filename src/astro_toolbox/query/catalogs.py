@@ -1,50 +1,93 @@
 """This module contains Simbad class.
 """
-import urllib.request as urllib
 import xmltodict
 
+from astro_toolbox.query.transport import fetch_text
+
 class Simbad():
     """This class allows to read astronomical catalogs over internet.
 
     Attributes
     ----------
     object_name : str
-
+        Astronomical object name as requested.
+    result : dict
+        The object dictionary returned from Simbad, None until parsed.
     """
     def __init__(self,object_name: str):
-        """Constructor method.
+        """Constructor method, nothing is requested until `fetch` or
+        `AsyncTransport.fetch` is called.
 
         Parameters
         ----------
         object_name : str
             Astronomical object name.
-        result : dict
-            The object dictionary returned from Simbad.
         """
-        object_name = object_name.replace(' ', '+')
-        self.result = self._get_datas(object_name)
+        self.object_name = object_name.replace(' ', '+')
+        self.result = None
+
+    def get_request(self):
+        """Sesame request, responses are cached by object name c.f. `ResponseCache`.
+
+        Returns
+        -------
+        tuple
+            Tuple containing service name, cache key, request URL and response
+            validation function (c.f. `fetch_text`).
+        """
+        link = 'https://cds.unistra.fr/cgi-bin/nph-sesame/-oIfx?'+self.object_name
+        return 'sesame', self.object_name, link, self._read
 
-    def _get_datas(self, object_name: str):
-        """Seraching datas method
+    @staticmethod
+    def _read(text: str):
+        """Sesame response reading method.
 
         Parameters
         ----------
-        object_name : str
-            Astronomical object name.
+        text : str
+            Sesame XML response.
 
         Returns
         -------
         dict
             The object dictionary returned from Simbad.
+
+        Raises
+        ------
+        ValueError
+            Object doesn't exist.
         """
-        link = 'https://cds.unistra.fr/cgi-bin/nph-sesame/-oIfx?'+object_name
-        request=urllib.Request(link)
-        with urllib.urlopen(request) as response:
-            result = xmltodict.parse(response.read().decode('utf-8'))['Sesame']['Target']
+        result = xmltodict.parse(text)['Sesame']['Target']
         if 'Resolver' not in result:
             raise ValueError("Object doesn't exist")
         return result
 
+    def parse(self, text: str):
+        """Parse Sesame response.
+
+        Parameters
+        ----------
+        text : str
+            Sesame XML response.
+
+        Returns
+        -------
+        Simbad
+            The object itself.
+        """
+        self.result = self._read(text)
+        return self
+
+    def fetch(self):
+        """Request and parse the Sesame response, this call blocks on the network.
+
+        Returns
+        -------
+        Simbad
+            The object itself.
+        """
+        return self.parse(fetch_text(*self.get_request()))
+
     def get_equatorial_coord(self):
         """Get RA/DEC object coordinates.
 
@@ -2,10 +2,14 @@
 """
 import re
 import json
-import urllib.request as urllib
+from urllib.parse import urlencode
+import numpy as np
 
+from astro_toolbox.angle.degrees import AngleDeg
 from astro_toolbox.time.core import AstroDateTime
+from astro_toolbox.time.arrays import AstroTimeArray
 from astro_toolbox.coordinates.location import Location
+from astro_toolbox.query.transport import fetch_text
 
 DICT_OBJECTS = {
                 'Sun': 10,
@@ -19,45 +23,128 @@ DICT_OBJECTS = {
                 'Neptune': 899,
                 'Pluto': 999
                 }
+HORIZONS_COLUMNS = {'Date_________JDUT': 'jd',
+                    'R.A._(ICRF)': 'ra',
+                    'DEC_(ICRF)': 'dec',
+                    'R.A._(FK4/B1950)': 'ra',
+                    'DEC_(FK4/B1950)': 'dec',
+                    'R.A._(a-apparent)': 'ra',
+                    'DEC_(a-apparent)': 'dec',
+                    'APmag': 'magnitude',
+                    'T-mag': 'magnitude'}
+
+def parse_ephemeris(result: str):
+    """Horizons CSV ephemeris parsing function, the ``$$SOE``...``$$EOE`` block is
+    converted into numpy columns named from the header line preceding ``$$SOE``.
+
+    Julian days, right-ascensions, declinations and magnitudes columns are renamed
+    ``'jd'``, ``'ra'``, ``'dec'`` and ``'magnitude'`` (c.f. `HORIZONS_COLUMNS`), blank
+    named columns (solar and lunar presence flags) are skipped. Numeric columns are
+    float arrays with NaN for ``n.a.`` values, others are str arrays.
+
+    Parameters
+    ----------
+    result : str
+        Horizons result text.
+
+    Returns
+    -------
+    dict
+        Dictionary of columns.
+
+    Raises
+    ------
+    ValueError
+        No ephemeris block in result.
+    """
+    lines = result.splitlines()
+    if '$$SOE' not in lines or '$$EOE' not in lines:
+        raise ValueError("No ephemeris in Horizons result: " + result.strip()[:200])
+    start, stop = lines.index('$$SOE'), lines.index('$$EOE')
+    header = [line for line in lines[:start] if line.strip() and not set(line) <= {'*'}][-1]
+    names = [name.strip() for name in header.split(',')]
+    rows = [[value.strip() for value in line.split(',')][:len(names)]
+            for line in lines[start + 1:stop]]
+    columns = {}
+    for index, name in enumerate(names):
+        if not name:
+            continue
+        values = np.array([row[index] for row in rows])
+        try:
+            values = np.array([np.nan if value in ('n.a.', '') else float(value)
+                               for value in values], dtype=np.float64)
+        except ValueError:
+            pass
+        columns[HORIZONS_COLUMNS.get(name, name)] = values
+    return columns
 
 class Horizons():
     """JPL Horizons ephemeris request and parsing.
 
+    Ephemerides are requested as CSV tables of one instant, a list of instants
+    (``TLIST``) or a range (``START_TIME``, ``STOP_TIME`` and ``STEP_SIZE``) in one
+    HTTP call, and parsed into numpy columns.
+
     Attributes
     ----------
     name : str | int
         The object name or integer reference according to JPL Horizons.
-    datetime : AstroDateTime
-        Date and time as AstroDateTime class.
+    datetime : AstroDateTime | AstroTimeArray
+        Date and time as AstroDateTime class or instants as AstroTimeArray.
+    stop : AstroDateTime
+        Range last date and time, None for instants requests.
+    step : str
+        Range step (e.g. ``'10m'``, ``'1h'`` or ``'1d'``), None for instants requests.
+    quantities : str
+        Horizons quantities codes.
     location : Location
         Observer location as Location class.
     object_data : list
         List which contains results from Horizons.
+    data : dict
+        Dictionary of ephemeris columns (c.f. `parse_ephemeris`), None until parsed.
     """
-    def __init__(self, object_name: str | int, datetime: tuple | str, location: Location):
-        """Constructor method
+    def __init__(self, object_name: str | int, datetime: tuple | str, location: Location,
+                 stop: tuple | str = None, step: str = None, quantities: str = '1,9'):
+        """Constructor method, nothing is requested until `fetch` or
+        `AsyncTransport.fetch` is called.
 
         Parameters
         ----------
         object_name : str | int
             The object name or integer reference according to JPL Horizons.
-        datetime : tuple | str
-            Date and time as tuple or str (``dd:dd:dd.dd`` or ``ddhddmdd.dds``).
+        datetime : tuple | str | AstroTimeArray
+            Date and time as tuple or str (``dd:dd:dd.dd`` or ``ddhddmdd.dds``), range
+            first date and time or instants as AstroTimeArray.
         location : Location
             Observer location as Location class.
+        stop : tuple | str, optional
+            Range last date and time, by default None.
+        step : str, optional
+            Range step (e.g. ``'10m'``, ``'1h'`` or ``'1d'``), by default None.
+        quantities : str, optional
+            Horizons quantities codes, by default '1,9' (astrometric coordinates and
+            magnitudes).
         """
         self.name = object_name
-        self.datetime = AstroDateTime(datetime)
+        if isinstance(datetime, AstroTimeArray):
+            self.datetime = datetime
+        else:
+            self.datetime = AstroDateTime(datetime)
+        self.stop = AstroDateTime(stop) if stop is not None else None
+        self.step = step
+        self.quantities = quantities
         self.location = location
-        self.object_data = self._get_data()
+        self.object_data = None
+        self.data = None
 
-    def _get_data(self):
-        """JPL data query method.
+    def _get_parameters(self):
+        """Horizons request parameters.
 
         Returns
         -------
-        list
-            A list containing the request result.
+        dict
+            Dictionary of request parameters.
 
         Raises
         ------
@@ -66,49 +153,129 @@ class Horizons():
         """
         if isinstance(self.name, int):
             object_ref = self.name
-        if self.name.lower() in [key.lower() for key in DICT_OBJECTS]:
+        elif self.name.lower() in [key.lower() for key in DICT_OBJECTS]:
             keys = list(key for key in DICT_OBJECTS)
             idx = list(key.lower() for key in DICT_OBJECTS).index(self.name.lower())
             object_ref = DICT_OBJECTS[keys[idx]]
         else:
             raise ValueError ("Object doesn't exist verify value")
-        dict_parameters = {'COMMAND': object_ref,
-                            'SITE_COORD': 500,
-                            'TLIST': f"{self.datetime.get_jd()}"
-                            }
-        link = ("https://ssd.jpl.nasa.gov/api/horizons.api?" +
-                "format=json&OBJ_DATA=%27NO%27&QUANTITIES=%271,9%27")
-        for key, value in dict_parameters.items():
-            link = link + f"&{key}=%27{value}%27"
-        request=urllib.Request(link)
-        with urllib.urlopen(request) as response:
-            result = json.loads(response.read().decode('utf-8'))['result']
-        return re.split(r"\*+",result)
+        parameters = {'COMMAND': object_ref,
+                      'OBJ_DATA': 'NO',
+                      'SITE_COORD': 500,
+                      'QUANTITIES': self.quantities,
+                      'CSV_FORMAT': 'YES',
+                      'ANG_FORMAT': 'DEG',
+                      'CAL_FORMAT': 'JD'}
+        if self.stop is not None:
+            parameters.update({'START_TIME': f"JD{self.datetime.get_jd()}",
+                               'STOP_TIME': f"JD{self.stop.get_jd()}",
+                               'STEP_SIZE': self.step or '1h'})
+        else:
+            parameters.update({'TLIST_TYPE': 'JD',
+                               'TLIST': ' '.join(f"{jd}" for jd in
+                                                 np.atleast_1d(self.datetime.get_jd()))})
+        return parameters
+
+    def get_request(self):
+        """JPL Horizons request, results are cached by request (object, instants
+        and site) c.f. `ResponseCache`.
+
+        Returns
+        -------
+        tuple
+            Tuple containing service name, cache key, request URL and response
+            validation function (c.f. `fetch_text`).
+
+        Raises
+        ------
+        ValueError
+            Unknown object.
+        """
+        link = ("https://ssd.jpl.nasa.gov/api/horizons.api?format=json&" +
+                urlencode({key: f"'{value}'" for key, value in
+                           self._get_parameters().items()}))
+        return 'horizons', link, link, self._read
+
+    @staticmethod
+    def _read(text: str):
+        """Read and check JPL Horizons json response.
+
+        Parameters
+        ----------
+        text : str
+            Json response.
+
+        Returns
+        -------
+        tuple
+            Tuple containing the result text and its ephemeris columns.
+
+        Raises
+        ------
+        ValueError
+            No ephemeris in result.
+        """
+        result = json.loads(text)['result']
+        return result, parse_ephemeris(result)
+
+    def parse(self, text: str):
+        """Parse JPL Horizons json response.
+
+        Parameters
+        ----------
+        text : str
+            Json response.
+
+        Returns
+        -------
+        Horizons
+            The object itself.
+        """
+        result, self.data = self._read(text)
+        self.object_data = re.split(r"\*+", result)
+        return self
+
+    def fetch(self):
+        """Request and parse the ephemeris, this call blocks on the network.
+
+        Returns
+        -------
+        Horizons
+            The object itself.
+        """
+        return self.parse(fetch_text(*self.get_request()))
+
+    def get_equatorial_array(self):
+        """Get equatorial coordinates of all instants.
+
+        Returns
+        -------
+        tuple
+            Tuple of arrays containing Julian days, right-ascensions and declinations
+            in radians.
+        """
+        return self.data['jd'], np.radians(self.data['ra']), np.radians(self.data['dec'])
 
     def get_equatorial_coord(self):
-        """Get equatorial coordinates from JPL Horizons.
+        """Get equatorial coordinates from JPL Horizons of the first instant.
 
         Returns
         -------
         tuple
             Equatorial coordinates right_ascension as HMS tuple and declination as DMS tuple.
         """
-        result = self.object_data[6]
-        result = re.split(r"\s",re.split(r"\s{2,}",result)[2])
-        return ((int(result[0]), int(result[1]), float(result[2])),
-                (int(result[3]), int(result[4]), float(result[5])))
+        return (AngleDeg(float(self.data['ra'][0])).degtohms(),
+                AngleDeg(float(self.data['dec'][0])).degtodms())
 
     def get_magnitude(self):
-        """Get magnitude from JPL Horizons.
+        """Get magnitude from JPL Horizons of the first instant.
 
         Returns
         -------
         float
             Magnitude.
         """
-        result = self.object_data[6]
-        result = re.split(r"\s",re.split(r"\s{2,}",result)[3])[0]
-        return float(result)
+        return float(self.data['magnitude'][0])
 
     def get_name(self):
         """Get object name from JPL Horizons.
@@ -0,0 +1,61 @@
+import time
+import threading
+import concurrent.futures
+import pytest
+
+from astro_toolbox.query.cache import ResponseCache
+
+def test_cache_hits_and_ttls(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path / 'cache' / 'responses.sqlite'),
+                          ttls={'openmeteo': 3600})
+    calls = []
+    def request():
+        calls.append(1)
+        return 'response'
+    assert cache.fetch('sesame', 'M31', request) == 'response'
+    assert cache.fetch('sesame', 'M31', request) == 'response'
+    assert cache.fetch('openmeteo', 'url', request) == 'response'
+    assert len(calls) == 2
+    assert (cache.hits['sesame'], cache.misses['sesame']) == (1, 1)
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 7200)
+    assert cache.get('openmeteo', 'url') is None
+    assert cache.get('sesame', 'M31') == 'response'
+    cache.refresh = True
+    cache.fetch('sesame', 'M31', request)
+    cache.enabled = False
+    cache.fetch('sesame', 'M31', request)
+    assert len(calls) == 4
+    statistics = cache.get_statistics()
+    assert statistics['sesame']['entries'] == 1 and statistics['openmeteo']['misses'] == 2
+    cache.clear('sesame')
+    assert cache.get_statistics()['sesame']['entries'] == 0
+
+def test_cache_eviction(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'responses.sqlite'), max_size=250)
+    for index in range(2):
+        cache.set('horizons', f'{index}', 'x' * 100)
+    cache.get('horizons', '0')
+    cache.set('horizons', '2', 'x' * 100)
+    assert cache.get('horizons', '1') is None
+    assert cache.get('horizons', '0') is not None and cache.get('horizons', '2') is not None
+    assert cache.get_statistics()['horizons']['size'] <= 250
+
+def test_cache_failures_not_stored(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'responses.sqlite'))
+    def request():
+        raise ValueError("Object doesn't exist")
+    with pytest.raises(ValueError):
+        cache.fetch('sesame', 'unknown', request)
+    assert cache.get_statistics()['sesame']['entries'] == 0
+
+def test_get_cache_single_instance(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResponseCache, '_instance', None)
+    monkeypatch.setenv('ASTRO_TOOLBOX_CACHE', str(tmp_path / 'responses.sqlite'))
+    barrier = threading.Barrier(8)
+    def get_cache():
+        barrier.wait()
+        return ResponseCache.get_cache()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        caches = list(executor.map(lambda _: get_cache(), range(8)))
+    assert all(cache is caches[0] for cache in caches)
@@ -0,0 +1,51 @@
+import json
+import numpy as np
+from pytest import approx
+
+from astro_toolbox.coordinates.location import Location
+from astro_toolbox.query.ephemeris import Horizons, parse_ephemeris
+from astro_toolbox.time.arrays import AstroTimeArray
+
+RESULT = """*******************************************************************************
+Ephemeris / API_USER Fri Oct 17 02:00:00 2026 Pasadena, USA      / Horizons
+*******************************************************************************
+Target body name: Saturn (699)                    {source: SAT441}
+Center body name: Earth (399)                     {source: DE441}
+*******************************************************************************
+ Date_________JDUT, , , R.A._(ICRF), DEC_(ICRF), APmag, S-brt,
+*******************************************************************************
+$$SOE
+ 2459959.500000000, , , 326.39625, -14.81069, 0.7, 6.35,
+ 2459959.541666667,*, , 326.40071, -14.80915, n.a., 6.35,
+$$EOE
+*******************************************************************************
+"""
+
+site = Location('Test', (45, 0, 0), (0, 0, 0), 0)
+
+def test_parse_ephemeris():
+    columns = parse_ephemeris(RESULT)
+    assert list(columns) == ['jd', 'ra', 'dec', 'magnitude', 'S-brt']
+    assert columns['jd'] == approx([2459959.5, 2459959.541666667])
+    assert columns['dec'] == approx([-14.81069, -14.80915])
+    assert np.isnan(columns['magnitude'][1])
+
+def test_horizons_requests():
+    saturn = Horizons('saturn', (2023, 1, 15, 0, 0, 0), site)
+    assert saturn.data is None
+    service, key, link, _ = saturn.get_request()
+    assert service == 'horizons' and key == link and 'COMMAND=%27699%27' in link
+    saturn.parse(json.dumps({'result': RESULT}))
+    assert saturn.get_name() == 'Saturn'
+    assert saturn.get_magnitude() == 0.7
+    (hours, minutes, seconds), (degrees, arcminutes, _) = saturn.get_equatorial_coord()
+    assert (hours, minutes, seconds) == (21, 45, approx(35.1, abs=0.1))
+    assert (degrees, arcminutes) == (-14, 48)
+    assert saturn.get_equatorial_array()[1] == approx(np.radians([326.39625, 326.40071]))
+    parameters = saturn._get_parameters()
+    assert parameters['COMMAND'] == 699 and 'TLIST' in parameters
+    instants = Horizons(699, AstroTimeArray([2459959.5, 2459959.6]), site)._get_parameters()
+    assert instants['TLIST'] == '2459959.5 2459959.6'
+    night = Horizons('Moon', '2023-01-15T18:00:00', site, stop='2023-01-16T06:00:00',
+                     step='10m')._get_parameters()
+    assert night['START_TIME'] == 'JD2459960.25' and night['STEP_SIZE'] == '10m'
@@ -0,0 +1,149 @@
+import time
+import asyncio
+import threading
+import concurrent.futures
+import http.server
+import urllib.error
+import pytest
+from pytest import approx
+
+from astro_toolbox.query import transport
+from astro_toolbox.query.cache import ResponseCache
+from astro_toolbox.query.catalogs import Simbad
+from astro_toolbox.query.transport import AsyncTransport, HttpTransport, TokenBucket
+from astro_toolbox.query.transport import get_proxy
+
+SESAME = """<?xml version="1.0" encoding="UTF-8"?>
+<Sesame><Target option="IfxS"><name>{name}</name>
+<Resolver name="S=Simbad"><jpos>05:16:41.35 +45:59:52.7</jpos>
+<mag band="V"><v>0.08</v></mag></Resolver></Target></Sesame>"""
+UNKNOWN = """<?xml version="1.0" encoding="UTF-8"?>
+<Sesame><Target option="IfxS"><name>Unknown</name></Target></Sesame>"""
+
+def test_async_transport(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResponseCache, '_instance',
+                        ResponseCache(str(tmp_path / 'responses.sqlite')))
+    lock, running, concurrency = threading.Lock(), [0], []
+    def request_text(link, timeout):
+        with lock:
+            running[0] += 1
+            concurrency.append(running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        name = link.split('?')[-1]
+        return UNKNOWN if name == 'Unknown' else SESAME.format(name=name)
+    monkeypatch.setattr(transport, 'request_text', request_text)
+    names = ['Capella', 'Unknown', 'Sirius', 'Vega', 'Deneb']
+    queries = [Simbad(name) for name in names]
+    async_transport = AsyncTransport(max_per_host=2)
+    results = asyncio.run(async_transport.fetch_all(queries))
+    async_transport.close()
+    assert isinstance(results[1], ValueError)
+    assert [result.get_name() for index, result in enumerate(results)
+            if index != 1] == ['Capella', 'Sirius', 'Vega', 'Deneb']
+    assert results[0].get_magnitude() == 0.08
+    assert max(concurrency) == 2
+    assert ResponseCache.get_cache().get_statistics()['sesame']['entries'] == 4
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    failures = 2
+    ports = set()
+
+    def do_GET(self):
+        Handler.ports.add(self.client_address[1])
+        if self.path.startswith('/flaky') and Handler.failures > 0:
+            Handler.failures -= 1
+            status, body = 503, b'busy'
+        elif self.path.startswith('/moved'):
+            self.send_response(302)
+            self.send_header('Location', '/flaky?moved')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        elif self.path.startswith('/missing'):
+            status, body = 404, b'missing'
+        else:
+            status, body = 200, self.path.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def clear_proxies(monkeypatch):
+    for name in ('http_proxy', 'https_proxy', 'all_proxy', 'no_proxy'):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+def test_http_transport(monkeypatch):
+    clear_proxies(monkeypatch)
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f'127.0.0.1:{server.server_address[1]}'
+    http_transport = HttpTransport(backoff=0.01, rates={'127.0.0.1': (1000.0, 10)})
+    try:
+        assert http_transport.request(f'http://{host}/moved') == '/flaky?moved'
+        for index in range(3):
+            assert http_transport.request(f'http://{host}/ok?{index}') == f'/ok?{index}'
+        with pytest.raises(urllib.error.HTTPError):
+            http_transport.request(f'http://{host}/missing')
+    finally:
+        http_transport.close()
+        server.shutdown()
+        server.server_close()
+    metrics = http_transport.get_metrics()[host]
+    assert metrics['retries'] == 2 and metrics['requests'] == 8
+    assert metrics['connections'] == 1 and len(Handler.ports) == 1
+
+def test_token_bucket(monkeypatch):
+    clock, sleeps = [100.0], []
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+    monkeypatch.setattr(transport.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(transport.time, 'sleep', sleep)
+    bucket = TokenBucket(50.0, 2)
+    waits = [bucket.acquire() for _ in range(4)]
+    assert waits == [0.0, 0.0, approx(0.02), approx(0.02)]
+    clock[0] += 1.0
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, approx(0.02)]
+    assert sleeps == [approx(0.02)] * 3
+
+def test_http_transport_proxy(monkeypatch):
+    clear_proxies(monkeypatch)
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    proxy = f'127.0.0.1:{server.server_address[1]}'
+    http_transport = HttpTransport(backoff=0.01, max_retries=0)
+    try:
+        monkeypatch.setenv('http_proxy', f'http://user:secret@{proxy}')
+        monkeypatch.setenv('no_proxy', 'localhost')
+        assert (http_transport.request('http://example.invalid/ok?proxy') ==
+                'http://example.invalid/ok?proxy')
+        assert http_transport.request(f'http://localhost:{server.server_address[1]}/ok') == '/ok'
+    finally:
+        http_transport.close()
+        server.shutdown()
+        server.server_close()
+    host, port, headers = get_proxy('http', 'example.invalid')
+    assert (host, port) == ('127.0.0.1', server.server_address[1])
+    assert headers['Proxy-Authorization'] == 'Basic dXNlcjpzZWNyZXQ='
+    assert get_proxy('http', 'localhost') is None and get_proxy('https', 'example.invalid') is None
+    monkeypatch.setenv('https_proxy', f'http://{proxy}')
+    connection = http_transport._get_connection('https', 'ssd.jpl.nasa.gov', 1.0,
+                                                get_proxy('https', 'ssd.jpl.nasa.gov'))
+    assert (connection.host, connection._tunnel_host) == ('127.0.0.1', 'ssd.jpl.nasa.gov')
+
+def test_get_transport_single_instance(monkeypatch):
+    monkeypatch.setattr(HttpTransport, '_instance', None)
+    barrier = threading.Barrier(8)
+    def get_transport(_):
+        barrier.wait()
+        return HttpTransport.get_transport()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        transports = list(executor.map(get_transport, range(8)))
+    assert all(item is transports[0] for item in transports)
@@ -0,0 +1,572 @@
+"""This module contains web services transports, HttpTransport the shared
+blocking transport, `fetch_text` and AsyncTransport for event-loop applications.
+
+Query classes build their request and parse its response text without doing
+the I/O themselves, so that a transport can be chosen by the caller.
+"""
+import time
+import base64
+import random
+import asyncio
+import threading
+import collections
+import http.client
+import urllib.error
+import urllib.request
+import concurrent.futures
+from urllib.parse import urlsplit, urljoin, unquote
+
+from astro_toolbox.query.cache import ResponseCache
+
+REQUEST_TIMEOUT = 30.0
+HOST_RATES = {'ssd.jpl.nasa.gov': (2.0, 4),
+              'cds.unistra.fr': (5.0, 10),
+              'api.open-meteo.com': (5.0, 10)}
+DEFAULT_RATE = (5.0, 10)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+USER_AGENT = 'astro-toolbox'
+_INSTANCE_LOCK = threading.Lock()
+
+def get_proxy(scheme: str, host: str):
+    """Get the proxy of a request from the environment (``HTTP_PROXY``,
+    ``HTTPS_PROXY`` and ``NO_PROXY``) as urllib does.
+
+    Parameters
+    ----------
+    scheme : str
+        ``'http'`` or ``'https'``.
+    host : str
+        Requested host name.
+
+    Returns
+    -------
+    tuple | None
+        Tuple containing proxy host, port and headers (``Proxy-Authorization`` when
+        the proxy URL has credentials), None for a direct connection.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    parts = urlsplit(proxy if '://' in proxy else 'http://' + proxy)
+    headers = {}
+    if parts.username is not None:
+        credentials = f'{unquote(parts.username)}:{unquote(parts.password or "")}'
+        headers['Proxy-Authorization'] = ('Basic ' +
+                                          base64.b64encode(credentials.encode()).decode())
+    return parts.hostname, parts.port or 80, headers
+
+class TokenBucket():
+    """Thread-safe token bucket rate limiter.
+
+    Tokens are added at a constant rate up to the bucket capacity, each request
+    takes one token and waits for it when the bucket is empty, so that bursts of
+    capacity requests are allowed and the mean rate is bounded.
+
+    Attributes
+    ----------
+    rate : float
+        Tokens per second.
+    capacity : float
+        Maximum number of tokens.
+    """
+    def __init__(self, rate: float, capacity: float):
+        """Constructor method
+
+        Parameters
+        ----------
+        rate : float
+            Tokens per second.
+        capacity : float
+            Maximum number of tokens.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, waiting for it if needed.
+
+        Returns
+        -------
+        float
+            Waiting time in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+class HttpTransport():
+    """Shared HTTP transport with keep-alive connections pools, per host rate
+    limiting, retries and requests metrics.
+
+    Idle connections are kept per host and reused by the next requests, proxies
+    are taken from the environment as urllib does (c.f. `get_proxy`). Each host
+    has its own `TokenBucket` (c.f. `HOST_RATES`). Connection errors and
+    ``429``/``5xx`` responses are retried with exponential backoff and full
+    jitter, ``Retry-After`` headers being honored.
+
+    .. math:: d_n = U(0, min(d_{max}, d_0 2^n))
+
+    Attributes
+    ----------
+    timeout : float
+        Default requests timeout in seconds.
+    max_retries : int
+        Maximum number of retries.
+    backoff : float
+        Backoff base delay in seconds.
+    max_backoff : float
+        Maximum backoff delay in seconds.
+    max_connections : int
+        Maximum number of idle connections kept per host.
+    rates : dict
+        Rate (requests per second) and burst per host updating `HOST_RATES`.
+    metrics : dict
+        Requests metrics per host (c.f. `get_metrics`).
+    """
+    _instance = None
+
+    def __init__(self, timeout: float = REQUEST_TIMEOUT, max_retries: int = 3,
+                 backoff: float = 0.5, max_backoff: float = 30.0, max_connections: int = 4,
+                 rates: dict = None):
+        """Constructor method
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Default requests timeout in seconds, by default 30.0.
+        max_retries : int, optional
+            Maximum number of retries, by default 3.
+        backoff : float, optional
+            Backoff base delay in seconds, by default 0.5.
+        max_backoff : float, optional
+            Maximum backoff delay in seconds, by default 30.0.
+        max_connections : int, optional
+            Maximum number of idle connections kept per host, by default 4.
+        rates : dict, optional
+            Rate and burst per host updating `HOST_RATES`, by default None.
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_connections = max_connections
+        self.rates = dict(HOST_RATES, **(rates or {}))
+        self.metrics = collections.defaultdict(lambda: {'requests': 0, 'errors': 0,
+                                                        'retries': 0, 'connections': 0,
+                                                        'bytes': 0, 'time': 0.0,
+                                                        'max_time': 0.0, 'wait': 0.0})
+        self._pools = collections.defaultdict(list)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_transport():
+        """Get the process-wide transport used by query classes.
+
+        Returns
+        -------
+        HttpTransport
+            Shared transport.
+        """
+        with _INSTANCE_LOCK:
+            if HttpTransport._instance is None:
+                HttpTransport._instance = HttpTransport()
+            return HttpTransport._instance
+
+    @staticmethod
+    def set_transport(transport):
+        """Set the process-wide transport, e.g. with other limits.
+
+        Parameters
+        ----------
+        transport : HttpTransport
+            Object with a ``request(link, timeout)`` method returning response text.
+        """
+        with _INSTANCE_LOCK:
+            HttpTransport._instance = transport
+
+    def _get_bucket(self, host: str):
+        """Get a host token bucket.
+
+        Parameters
+        ----------
+        host : str
+            Host name.
+
+        Returns
+        -------
+        TokenBucket
+            Host token bucket.
+        """
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(*self.rates.get(host, DEFAULT_RATE))
+            return self._buckets[host]
+
+    def _get_connection(self, scheme: str, netloc: str, timeout: float, proxy: tuple = None):
+        """Get an idle connection or open a new one, https requests through a
+        proxy are tunneled with ``CONNECT``.
+
+        Parameters
+        ----------
+        scheme : str
+            ``'http'`` or ``'https'``.
+        netloc : str
+            Host and port.
+        timeout : float
+            Timeout in seconds.
+        proxy : tuple, optional
+            Proxy host, port and headers (c.f. `get_proxy`), by default None.
+
+        Returns
+        -------
+        http.client.HTTPConnection
+            Connection.
+        """
+        with self._lock:
+            pool = self._pools[(scheme, netloc)]
+            if pool:
+                connection = pool.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection
+            self.metrics[netloc]['connections'] += 1
+        if proxy is None:
+            if scheme == 'https':
+                return http.client.HTTPSConnection(netloc, timeout=timeout)
+            return http.client.HTTPConnection(netloc, timeout=timeout)
+        proxy_host, proxy_port, headers = proxy
+        if scheme == 'https':
+            connection = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout)
+            connection.set_tunnel(netloc, headers=headers)
+            return connection
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+
+    def _release(self, scheme: str, netloc: str, connection):
+        """Keep an idle connection or close it.
+
+        Parameters
+        ----------
+        scheme : str
+            ``'http'`` or ``'https'``.
+        netloc : str
+            Host and port.
+        connection : http.client.HTTPConnection
+            Connection.
+        """
+        with self._lock:
+            pool = self._pools[(scheme, netloc)]
+            if len(pool) < self.max_connections:
+                pool.append(connection)
+                return
+        connection.close()
+
+    def _delay(self, attempt: int, retry_after: str = None):
+        """Backoff delay with full jitter.
+
+        Parameters
+        ----------
+        attempt : int
+            Attempt number from 0.
+        retry_after : str, optional
+            ``Retry-After`` header in seconds, by default None.
+
+        Returns
+        -------
+        float
+            Delay in seconds.
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        try:
+            return max(delay, min(self.max_backoff, float(retry_after)))
+        except (TypeError, ValueError):
+            return delay
+
+    def _record(self, netloc: str, **values):
+        """Add values to host metrics.
+
+        Parameters
+        ----------
+        netloc : str
+            Host and port.
+        """
+        with self._lock:
+            metrics = self.metrics[netloc]
+            for key, value in values.items():
+                metrics[key] += value
+            metrics['max_time'] = max(metrics['max_time'], values.get('time', 0.0))
+
+    def request(self, link: str, timeout: float = None, max_redirects: int = 5):
+        """Blocking HTTP GET request, redirections are followed.
+
+        Parameters
+        ----------
+        link : str
+            Request URL.
+        timeout : float, optional
+            Timeout in seconds, by default None for the transport timeout.
+        max_redirects : int, optional
+            Maximum number of redirections, by default 5.
+
+        Returns
+        -------
+        str
+            Response text.
+
+        Raises
+        ------
+        urllib.error.HTTPError
+            Error response after retries.
+        OSError
+            Connection error after retries.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        attempt = 0
+        while True:
+            parts = urlsplit(link)
+            path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+            headers = {'User-Agent': USER_AGENT, 'Connection': 'keep-alive'}
+            proxy = get_proxy(parts.scheme, parts.hostname)
+            if proxy is not None and parts.scheme == 'http':
+                path = f'http://{parts.netloc}{path}'
+                headers.update(proxy[2])
+            wait = self._get_bucket(parts.hostname).acquire()
+            connection = self._get_connection(parts.scheme, parts.netloc, timeout, proxy)
+            start = time.perf_counter()
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as error:
+                connection.close()
+                self._record(parts.netloc, requests=1, errors=1, wait=wait,
+                             time=time.perf_counter() - start)
+                if attempt >= self.max_retries:
+                    if isinstance(error, OSError):
+                        raise
+                    raise OSError(f"{parts.netloc}: {error!r}") from error
+                self._record(parts.netloc, retries=1)
+                time.sleep(self._delay(attempt))
+                attempt += 1
+                continue
+            self._record(parts.netloc, requests=1, bytes=len(body), wait=wait,
+                         time=time.perf_counter() - start)
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(parts.scheme, parts.netloc, connection)
+            if response.status in REDIRECT_STATUSES and response.getheader('Location'):
+                if max_redirects <= 0:
+                    raise urllib.error.HTTPError(link, response.status, 'Too many redirections',
+                                                 response.headers, None)
+                link = urljoin(link, response.getheader('Location'))
+                max_redirects -= 1
+                continue
+            if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                self._record(parts.netloc, retries=1)
+                time.sleep(self._delay(attempt, response.getheader('Retry-After')))
+                attempt += 1
+                continue
+            if response.status >= 400:
+                self._record(parts.netloc, errors=1)
+                raise urllib.error.HTTPError(link, response.status, response.reason,
+                                             response.headers, None)
+            return body.decode('utf-8')
+
+    def get_metrics(self):
+        """Get requests metrics per host.
+
+        Returns
+        -------
+        dict
+            Dictionary ``{host: {'requests', 'errors', 'retries', 'connections', 'bytes',
+            'time', 'max_time', 'mean_time', 'wait'}}``, times (request and rate limiter
+            waiting) in seconds.
+        """
+        with self._lock:
+            return {host: dict(metrics, mean_time=metrics['time'] / max(1, metrics['requests']))
+                    for host, metrics in self.metrics.items()}
+
+    def close(self):
+        """Close idle connections.
+        """
+        with self._lock:
+            pools, self._pools = self._pools, collections.defaultdict(list)
+        for pool in pools.values():
+            for connection in pool:
+                connection.close()
+
+def request_text(link: str, timeout: float = REQUEST_TIMEOUT):
+    """Blocking HTTP GET request with the shared transport
+    (c.f. `HttpTransport.get_transport`).
+
+    Parameters
+    ----------
+    link : str
+        Request URL.
+    timeout : float, optional
+        Timeout in seconds, by default 30.0.
+
+    Returns
+    -------
+    str
+        Response text.
+    """
+    return HttpTransport.get_transport().request(link, timeout)
+
+def fetch_text(service: str, key: str, link: str, validate=None,
+               timeout: float = REQUEST_TIMEOUT):
+    """Blocking cached request (c.f. `ResponseCache`).
+
+    Parameters
+    ----------
+    service : str
+        Service name.
+    key : str
+        Cache key.
+    link : str
+        Request URL.
+    validate : callable, optional
+        Function raising an exception on invalid response text, which is then
+        not stored, by default None.
+    timeout : float, optional
+        Timeout in seconds, by default 30.0.
+
+    Returns
+    -------
+    str
+        Response text.
+    """
+    def request():
+        text = request_text(link, timeout)
+        if validate is not None:
+            validate(text)
+        return text
+    return ResponseCache.get_cache().fetch(service, key, request)
+
+class AsyncTransport():
+    """Asyncio transport running cached requests in a shared threads pool.
+
+    Requests to a host are limited by a per-host semaphore and bounded by a
+    timeout, so that many coroutines can await queries without blocking the
+    event loop.
+
+    Attributes
+    ----------
+    max_per_host : int
+        Maximum number of concurrent requests per host.
+    timeout : float
+        Requests timeout in seconds.
+    """
+    def __init__(self, max_per_host: int = 4, timeout: float = REQUEST_TIMEOUT,
+                 max_workers: int = 16):
+        """Constructor method
+
+        Parameters
+        ----------
+        max_per_host : int, optional
+            Maximum number of concurrent requests per host, by default 4.
+        timeout : float, optional
+            Requests timeout in seconds, by default 30.0.
+        max_workers : int, optional
+            Threads pool size, by default 16.
+        """
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._semaphores = {}
+
+    def _get_semaphore(self, link: str):
+        """Get the host semaphore of the running event loop.
+
+        Parameters
+        ----------
+        link : str
+            Request URL.
+
+        Returns
+        -------
+        asyncio.Semaphore
+            Host semaphore.
+        """
+        key = (asyncio.get_running_loop(), urlsplit(link).netloc)
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(self.max_per_host)
+        return self._semaphores[key]
+
+    async def fetch_text(self, service: str, key: str, link: str, validate=None):
+        """Cached request (c.f. `fetch_text`).
+
+        Parameters
+        ----------
+        service : str
+            Service name.
+        key : str
+            Cache key.
+        link : str
+            Request URL.
+        validate : callable, optional
+            Function raising an exception on invalid response text, by default None.
+
+        Returns
+        -------
+        str
+            Response text.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            No response within timeout.
+        """
+        async with self._get_semaphore(link):
+            future = asyncio.get_running_loop().run_in_executor(
+                    self._executor, fetch_text, service, key, link, validate, self.timeout)
+            return await asyncio.wait_for(future, self.timeout)
+
+    async def fetch(self, query):
+        """Request and parse a query object.
+
+        Parameters
+        ----------
+        query : Horizons | Simbad | OpenMeteo
+            Query object.
+
+        Returns
+        -------
+        Horizons | Simbad | OpenMeteo
+            The parsed query object.
+        """
+        query.parse(await self.fetch_text(*query.get_request()))
+        return query
+
+    async def fetch_all(self, queries):
+        """Request and parse query objects concurrently.
+
+        Parameters
+        ----------
+        queries : list
+            Query objects.
+
+        Returns
+        -------
+        list
+            Parsed query objects or exceptions, in queries order.
+        """
+        return await asyncio.gather(*(self.fetch(query) for query in queries),
+                                    return_exceptions=True)
+
+    def close(self):
+        """Shutdown the threads pool.
+        """
+        self._executor.shutdown(wait=False)
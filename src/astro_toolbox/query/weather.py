@@ -1,11 +1,11 @@
 """This module contains Open_Meteo class.
 """
 import json
-import urllib.request as urllib
 import math
 
 from astro_toolbox.time.core import AstroDateTime
 from astro_toolbox.coordinates.location import Location
+from astro_toolbox.query.transport import fetch_text
 
 OPENMETEO_LEVELS = [1000,
                     975,
@@ -36,9 +36,12 @@ class OpenMeteo():
             Observer location as Location class.
     model : str, optional
         Weather model (https://open-meteo.com/en/docs), by default 'best_match'
+    data : dict
+        Dict containing all the datas requested, None until parsed.
     """
     def __init__(self, location : Location, model : str = 'best_match'):
-        """Constructor method
+        """Constructor method, nothing is requested until `fetch` or
+        `AsyncTransport.fetch` is called.
 
         Parameters
         ----------
@@ -55,7 +58,7 @@ class OpenMeteo():
                                 for openmeteo_pressure_level in OPENMETEO_LEVELS)))
         self.pressure_level = OPENMETEO_LEVELS[index_pressure_level]
         self.model = model
-        self.data = self._get_data()
+        self.data = None
 
     def __repr__(self):
         """Representative method.
@@ -72,13 +75,14 @@ class OpenMeteo():
                 f'Wind Direction: {self.get_wind_direction()} °' +
                 f'Cloud Coverage: {self.get_cloud_cover()} %')
 
-    def _get_data(self):
-        """Open Meteo query method.
+    def get_request(self):
+        """Open Meteo request, forecasts are cached for a few hours c.f. `ResponseCache`.
 
         Returns
         -------
-        dict
-            Dict containing all the datas requested.
+        tuple
+            Tuple containing service name, cache key, request URL and response
+            validation function (c.f. `fetch_text`).
         """
         link = 'https://api.open-meteo.com/v1/forecast?'
         link += (f'latitude={str(self.location.latitude.dmstodeg())}&' +
@@ -98,11 +102,35 @@ class OpenMeteo():
                 f'winddirection_{self.pressure_level}hPa')
 
         link += f'&models={self.model}&current_weather=false&past_days=3&forecast_days=16'
-        request=urllib.Request(link)
-        with urllib.urlopen(request) as response:
-            result = json.loads(response.read().decode('utf-8'))
-        result.pop('generationtime_ms')
-        return result
+        return 'openmeteo', link, link, json.loads
+
+    def parse(self, text: str):
+        """Parse Open Meteo json response.
+
+        Parameters
+        ----------
+        text : str
+            Json response.
+
+        Returns
+        -------
+        OpenMeteo
+            The object itself.
+        """
+        result = json.loads(text)
+        result.pop('generationtime_ms', None)
+        self.data = result
+        return self
+
+    def fetch(self):
+        """Request and parse the forecasts, this call blocks on the network.
+
+        Returns
+        -------
+        OpenMeteo
+            The object itself.
+        """
+        return self.parse(fetch_text(*self.get_request()))
 
     def _get_index(self, datetime: str | tuple):
         """Time searching method.
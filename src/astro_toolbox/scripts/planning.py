@@ -1,10 +1,15 @@
 """This module contains scripts functions.
 """
+import logging
 import pathlib
+import concurrent.futures
+import numpy as np
 import pkg_resources
-from rich.progress import track
+from rich.progress import Progress
 
+from astro_toolbox.time.core import AstroDateTime
 from astro_toolbox.coordinates.equatorial import Equatorial
+from astro_toolbox.coordinates.arrays import EquatorialArray
 from astro_toolbox.query.ephemeris import Horizons
 from astro_toolbox.query.catalogs import Simbad
 
@@ -33,22 +38,162 @@ def read_observatory_program(input_file: pathlib.Path):
     object_list.sort(key=str.casefold)
     return object_list
 
-def get_multiple_informations(object_list, site, datetime, bounds):
-    """Getting multiple objects equatorial information.
+def resolve_object(name: str, site, datetime):
+    """Resolve an object equatorial information from JPL Horizons (solar system
+    objects) or Simbad.
+
+    Parameters
+    ----------
+    name : str
+        Object name.
+    site : Location
+        Observer location.
+    datetime : tuple | str
+        Date and time for solar system objects.
+
+    Returns
+    -------
+    Equatorial
+        Object coordinates, name and magnitude.
+    """
+    if name.lower() in list(key.lower() for key in DICT_OBJECTS):
+        obj = Horizons(name, datetime, site).fetch()
+    else:
+        obj = Simbad(name).fetch()
+    alpha, delta = obj.get_equatorial_coord()
+    return Equatorial(alpha=alpha, delta=delta, name=name, magnitude=obj.get_magnitude())
+
+def resolve_objects(object_list, site, datetime, max_workers: int = 8,
+                    progress=None, resolver=resolve_object):
+    """Resolve objects concurrently in a threads pool.
+
+    Requests are sent at most max_workers at once, results keep the objects list
+    order whatever their completion order.
+
+    Parameters
+    ----------
+    object_list : list
+        Objects names.
+    site : Location
+        Observer location.
+    datetime : tuple | str
+        Date and time for solar system objects.
+    max_workers : int, optional
+        Maximum number of concurrent requests, by default 8.
+    progress : callable, optional
+        Function called in the calling thread as results arrive with the object
+        name and the exception (None on success), by default None.
+    resolver : callable, optional
+        Function resolving a name, site and datetime, by default `resolve_object`.
+
+    Returns
+    -------
+    tuple
+        Tuple containing the objects dictionary ``{name: Equatorial}`` and the
+        failures dictionary ``{name: exception}``, both in objects list order.
+    """
+    results, failures = {}, {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(resolver, name, site, datetime): name
+                   for name in object_list}
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+                error = None
+            except Exception as exception:
+                failures[name] = error = exception
+            if progress is not None:
+                progress(name, error)
+    return ({name: results[name] for name in object_list if name in results},
+            {name: failures[name] for name in object_list if name in failures})
+
+def get_multiple_informations(object_list, site, datetime, bounds, max_workers: int = 8):
+    """Getting multiple objects equatorial information (c.f. `resolve_objects`),
+    failures are logged as warnings.
+
+    Parameters
+    ----------
+    object_list : list
+        Objects names.
+    site : Location
+        Observer location.
+    datetime : tuple | str
+        Date and time for solar system objects.
+    bounds : tuple
+        UT hours bounds.
+    max_workers : int, optional
+        Maximum number of concurrent requests, by default 8.
+
+    Returns
+    -------
+    dict
+        Objects dictionary ``{name: Equatorial}`` in objects list order.
     """
     bounds = list(bounds)
     if bounds[1] <= bounds[0]:
         bounds[1] = bounds[1] + 24
-    object_dict = {}
-    for name in track(object_list, description="Querying information..."):
-        try:
-            if name.lower() in list(key.lower() for key in DICT_OBJECTS):
-                obj = Horizons(name, datetime, site)
-            else:
-                obj = Simbad(name)
-            object_dict[name] = Equatorial(alpha=obj.get_equatorial_coord()[0],
-                                        delta=obj.get_equatorial_coord()[1], name=name,
-                                        magnitude=obj.get_magnitude())
-        except ValueError:
-            pass
+    with Progress() as progress_bar:
+        task = progress_bar.add_task("Querying information...", total=len(object_list))
+        object_dict, failures = resolve_objects(
+                object_list, site, datetime, max_workers=max_workers,
+                progress=lambda name, error: progress_bar.advance(task))
+    for name, error in failures.items():
+        logging.warning(f'{name}: {error}')
     return object_dict
+
+def get_multi_site_airmasses(objects, sites: list, date: tuple | str,
+                             bounds: tuple = (18, 31), step: float = 0.1,
+                             max_airmass: float = 2.0, dtype=np.float32):
+    """Objects × sites × times airmasses and per site best windows.
+
+    Objects coordinates are precessed once, each site only adds its (cached)
+    sidereal time grid and one `EquatorialArray.to_horizontal_grid` pass.
+
+    Parameters
+    ----------
+    objects : dict | EquatorialArray
+        Objects as returned by `get_multiple_informations` or EquatorialArray (J2000).
+    sites : list
+        Location objects.
+    date : tuple | str
+        Night date.
+    bounds : tuple, optional
+        UT hours bounds, by default (18, 31).
+    step : float, optional
+        Time step in hours, by default 0.1.
+    max_airmass : float, optional
+        Airmass limit of observing windows, by default 2.0.
+    dtype : numpy.dtype, optional
+        Airmasses dtype, by default numpy.float32.
+
+    Returns
+    -------
+    dict
+        Dictionary containing ``'hours'`` (T) UT hours, ``'names'`` objects names,
+        ``'sites'`` sites names, ``'airmass'`` (S, N, T) airmasses and per site and
+        object ``'best_hour'``, ``'best_airmass'`` and ``'window'`` (hours below
+        max_airmass) arrays of shape (S, N).
+    """
+    bounds = list(bounds)
+    if bounds[1] <= bounds[0]:
+        bounds[1] = bounds[1] + 24
+    ut_time = AstroDateTime(date)
+    if isinstance(objects, dict):
+        objects = EquatorialArray.from_equatorial(objects.values())
+    objects = objects.precess(ut_time.get_epoch())
+    hours = np.arange(bounds[0], bounds[1], step)
+    airmasses = np.empty((len(sites), len(objects), len(hours)), dtype=dtype)
+    for i, site in enumerate(sites):
+        airmasses[i] = objects.to_horizontal_grid(ut_time.get_lst_grid(site, bounds[0],
+                                                                       bounds[1], step),
+                                                  site, dtype=dtype,
+                                                  quantities=('airmass',))['airmass']
+    best = np.argmin(airmasses, axis=2)
+    return {'hours': hours,
+            'names': objects.name,
+            'sites': [site.name for site in sites],
+            'airmass': airmasses,
+            'best_hour': np.mod(hours[best], 24),
+            'best_airmass': np.take_along_axis(airmasses, best[..., None], axis=2)[..., 0],
+            'window': np.count_nonzero(airmasses <= max_airmass, axis=2) * step}
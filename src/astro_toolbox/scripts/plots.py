@@ -9,11 +9,14 @@ from matplotlib import rcParams
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox, TextArea
 
 from astro_toolbox.angle.hms import AngleHMS
-from astro_toolbox.angle.dms import AngleDMS
 from astro_toolbox.time.core import AstroDateTime
+from astro_toolbox.time.arrays import AstroTimeArray
 from astro_toolbox.coordinates.location import Location
 from astro_toolbox.coordinates.equatorial import Equatorial
-from astro_toolbox.query.ephemeris import Horizons
+from astro_toolbox.coordinates.arrays import EquatorialArray
+from astro_toolbox.coordinates.lunisolar import RISE_SET_ALTITUDE
+from astro_toolbox.coordinates.lunisolar import get_altitudes
+from astro_toolbox.coordinates.lunisolar import get_crossings
 from astro_toolbox.query.weather import OpenMeteo
 
 rcParams['toolbar'] = 'None'
@@ -132,7 +135,7 @@ def plot_weather(date, location, bounds, axis):
         Pyplot axis object.
     """
     hours = list(np.mod(np.arange(bounds[0],bounds[1]), 24))
-    weather_forecast = OpenMeteo(location=location)
+    weather_forecast = OpenMeteo(location=location).fetch()
     annotation_box = AnnotationBbox(TextArea('Weather\nforecasts',
                                             textprops={'rotation': 90, 'ha': 'center'}),
                                             (0, 0),
@@ -189,6 +192,25 @@ def plot_weather(date, location, bounds, axis):
                                             pad=0)
             axis.add_artist(annotation_box)
 
+def _night_times(date, bounds):
+    """Plots sampling instants, every 0.1 hour from 0h UT of date within bounds
+    (c.f. `AstroDateTime.get_lst_grid`).
+
+    Parameters
+    ----------
+    date : tuple | str
+        Date.
+    bounds : list
+        List of length 2 containing lower and upper time bounds.
+
+    Returns
+    -------
+    AstroTimeArray
+        Sampling instants.
+    """
+    julian_day = AstroDateTime(AstroDateTime(date).date + (0, 0, 0)).get_jd()
+    return AstroTimeArray(julian_day + np.arange(bounds[0], bounds[1], 0.1)/24)
+
 def sun_impact(lines, site, date, bounds):
     """Function which plots sun impact.
 
@@ -208,17 +230,9 @@ def sun_impact(lines, site, date, bounds):
     list
         List of matplotlib.pyplot Rectangles objects.
     """
-    ut_time = AstroDateTime(date)
-    sun = Horizons('Sun', date, site)
-    sun = Equatorial(name='Sun',
-                    alpha=sun.get_equatorial_coord()[0],
-                    delta=sun.get_equatorial_coord()[1],
-                    magnitude=sun.get_magnitude)
+    sun_altitudes = get_altitudes(_night_times(date, bounds), site)[0]
     sun_rectangles_list = []
-    for i, time in enumerate(np.arange(bounds[0],bounds[1],0.1)):
-        time = (int(time),(time-int(time))*60,0)
-        ut_time = AstroDateTime(ut_time.date+time)
-        altitude = (AngleDMS(sun.to_horizontal(ut_time.get_lst(site), site)[1]).dmstodeg())
+    for i, altitude in enumerate(np.degrees(sun_altitudes)):
         if altitude <= 0:
             opacity = 1 + altitude/18
             if altitude < -18:
@@ -243,33 +257,16 @@ def moon_times(lines, site, date, bounds):
     bounds : list
         List of length 2 containing lower and upper time bounds.
     """
-    moon = Horizons('Moon', date, site)
-    moon = Equatorial(name='Moon',
-                    alpha=moon.get_equatorial_coord()[0],
-                    delta=moon.get_equatorial_coord()[1],
-                    magnitude=0)
-    rise_time = moon.calculate_rise_time(site,
-                                        date,
-                                        altitude_0=0)
-    set_time = moon.calculate_set_time(site,
-                                    date,
-                                    altitude_0=0)
-    rise_time = rise_time[0] + rise_time[1]/60 + rise_time[2]/3600
-    set_time = set_time[0] + set_time[1]/60 + set_time[2]/3600
-    lower_bound = [0] * (int((bounds[1] - bounds[0])/24)+2)
-    upper_bound = [0] * (int((bounds[1] - bounds[0])/24)+2)
-    for i in range(0,int((bounds[1] - bounds[0])/24)+2):
-        lower_bound[i] += 24 * i
-        upper_bound[i] += 24 + 24 * i
-    lower_bound[0] = bounds[0]
-    upper_bound[-1] = bounds[1]
-    for lower, upper in zip(lower_bound, upper_bound):
-        if lower < set_time + 24 * int(lower/24) < upper:
-            plt.plot([(set_time + 24 * int(lower/24)-bounds[0])*10]*2,
-                    [0, lines], '--', color='grey', linewidth=2, label='Moonset')
-        if lower < rise_time + 24 * int(lower/24) < upper:
-            plt.plot([(rise_time + 24 * int(lower/24)-bounds[0])*10]*2,
-                    [0, lines], ':', color='grey', linewidth=2, label='Moonrise')
+    hours = np.arange(bounds[0], bounds[1], 0.1)
+    rise_times, set_times = get_crossings(hours,
+                                          get_altitudes(_night_times(date, bounds), site)[1],
+                                          altitude_0=RISE_SET_ALTITUDE)
+    for set_time in set_times:
+        plt.plot([(set_time - bounds[0])*10]*2,
+                [0, lines], '--', color='grey', linewidth=2, label='Moonset')
+    for rise_time in rise_times:
+        plt.plot([(rise_time - bounds[0])*10]*2,
+                [0, lines], ':', color='grey', linewidth=2, label='Moonrise')
     handles, labels = plt.gca().get_legend_handles_labels()
     by_label = dict(zip(labels, handles))
     plt.legend(by_label.values(),
@@ -300,18 +297,10 @@ def airmas_map(object_dict,
     bounds = list(bounds)
     if bounds[1] <= bounds[0]:
         bounds[1] = bounds[1] + 24
-    airmasses = np.empty((len(object_dict), np.shape(np.arange(bounds[0],bounds[1],0.1))[0]))
-    alpha_visible = np.ones((np.shape(airmasses)[0], np.shape(airmasses)[1]))
-    for j, key in enumerate(object_dict):
-        object_dict[key].compute_on_date_coord(year = ut_time.get_year()+
-                                                (ut_time.get_month()-1.0)/12)
-        for i, time in enumerate(np.arange(bounds[0],bounds[1],0.1)):
-            time = (int(time),(time-int(time))*60,0)
-            ut_time = AstroDateTime(ut_time.date+time)
-            airmasses[j][i] = object_dict[key].calculate_airmass(
-                                ut_time.get_lst(site), site)
-            if airmasses[j][i] >= 40:
-                alpha_visible[len(object_dict)-j-1][i] = 0
+    lst_grid = ut_time.get_lst_grid(site, bounds[0], bounds[1], 0.1)
+    objects = EquatorialArray.from_equatorial(object_dict.values()).precess(ut_time.get_epoch())
+    airmasses = objects.to_horizontal_grid(lst_grid, site, quantities=('airmass',))['airmass']
+    alpha_visible = np.where(airmasses[::-1] >= 40, 0.0, 1.0)
     fig, axis = plt.subplots(figsize=(8.27, 11.69), num='Airmass', dpi=72)
     moon_times(len(object_dict), site, date, bounds)
     mesh = axis.pcolormesh(airmasses[::-1],
@@ -389,8 +378,7 @@ def polarstar_plt_northern(location: Location, datetime: tuple | str=None):
                     alpha=(2, 32, 08.50),
                     delta=(+89, 16, 11.6),
                     magnitude=1.95)
-    polar_star.compute_on_date_coord(year = ut_time.get_year()+
-                                        (ut_time.get_month()-1.0)/12)
+    polar_star = polar_star.precess(ut_time.get_epoch())
     polar_star_hour_angle = AngleHMS(polar_star.get_hourangle(
                                     ut_time.get_lst(location)))
     polar_star_distance = (90 - polar_star.delta.dmstodeg())*60
@@ -445,9 +433,9 @@ def polarstar_plt_southern(location: Location, datetime: tuple=None):
                 alpha=(18, 54, 16.53),
                 delta=(-87, 36, 19.0),
                 magnitude=5.25)], [], []]
+    octans_constellation[0] = [star.precess(ut_time.get_epoch())
+                               for star in octans_constellation[0]]
     for star in octans_constellation[0]:
-        star.compute_on_date_coord(year = ut_time.get_year()+
-                                    (ut_time.get_month()-1.0)/12)
         octans_constellation[1].append((star.delta.dmstodeg() + 90)*60)
     for star in octans_constellation[0]:
         octans_constellation[2].append(
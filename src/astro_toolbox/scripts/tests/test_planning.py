@@ -0,0 +1,42 @@
+"""Calculate for the night of 2023-01-15
+"""
+import threading
+
+from pytest import approx
+
+from astro_toolbox.coordinates.equatorial import Equatorial
+from astro_toolbox.coordinates.location import Location
+from astro_toolbox.scripts.planning import get_multi_site_airmasses
+from astro_toolbox.scripts.planning import resolve_objects
+
+objects = {'Capella': Equatorial(name='Capella', alpha=(5, 16, 43.32), delta=(+45, 59, 48.3)),
+           'Sirius': Equatorial(name='Sirius', alpha=(6, 46, 10.54), delta=(-16, 44, 55.8))}
+sites = [Location(name='Greenwich'), Location(name='Silla')]
+
+def test_get_multi_site_airmasses():
+    summary = get_multi_site_airmasses(objects, sites, (2023, 1, 15), bounds=(18, 7))
+    assert summary['airmass'].shape == (2, 2, 130)
+    assert summary['sites'] == ['Greenwich', 'Silla']
+    assert summary['best_airmass'][0][0] == approx(1.0, abs=0.05)
+    assert summary['best_airmass'][1][1] < summary['best_airmass'][0][1]
+    assert summary['window'][1][0] == 0
+
+def test_resolve_objects():
+    others_completed = threading.Event()
+    def resolver(name, site, datetime):
+        if name == 'Capella':
+            assert others_completed.wait(timeout=10)
+        if name == 'Unknown':
+            raise ValueError("Object doesn't exist")
+        return objects[name]
+    completed = []
+    def progress(name, error):
+        completed.append(name)
+        if len(completed) == 2:
+            others_completed.set()
+    object_dict, failures = resolve_objects(['Capella', 'Unknown', 'Sirius'], sites[0],
+                                            (2023, 1, 15), max_workers=3,
+                                            progress=progress, resolver=resolver)
+    assert list(object_dict) == ['Capella', 'Sirius']
+    assert list(failures) == ['Unknown'] and isinstance(failures['Unknown'], ValueError)
+    assert completed[-1] == 'Capella' and len(completed) == 3
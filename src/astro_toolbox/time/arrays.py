@@ -0,0 +1,252 @@
+"""This module contains AstroTimeArray class.
+"""
+import numpy as np
+
+from astro_toolbox.coordinates.location import Location
+from astro_toolbox.time.core import AstroDateTime
+from astro_toolbox.utils.strparser import batch_datetime_parser
+
+J2000_DATETIME64 = np.datetime64('2000-01-01T12:00:00', 'us')
+
+class AstroTimeArray():
+    """AstroTimeArray define an array of UT instants with vectorized calendar conversions.
+
+    Instants are stored as float64 Julian days, which keeps a precision
+    better than a millisecond for current dates.
+
+    Attributes
+    ----------
+    jd : numpy.ndarray
+        Julian days.
+    """
+    def __init__(self, ut_time):
+        """Constructor method
+
+        Parameters
+        ----------
+        ut_time : array_like | AstroTimeArray
+            Julian days as 1-D float array, calendar rows (year,month,day[,hour,minute,second])
+            as 2-D array, numpy datetime64 array or sequence of str
+            (``yyyy-mm-ddThh:mm:ss.ss`` or ``yyyy-mm-dd``).
+
+        Raises
+        ------
+        ValueError
+            Unparsable str values or unknown array shape.
+        """
+        if isinstance(ut_time, AstroTimeArray):
+            self.jd = ut_time.jd.copy()
+            return
+        ut_time = np.asarray(ut_time)
+        if ut_time.dtype.kind == 'M':
+            self.jd = ((ut_time - J2000_DATETIME64) / np.timedelta64(1, 'us') /
+                       86400e6 + 2451545.0)
+        elif ut_time.dtype.kind in 'USO':
+            ut_time, errors = batch_datetime_parser(ut_time.ravel())
+            if errors:
+                raise ValueError("Unparsable datetimes at rows " +
+                                 ', '.join(f'{row} ({message})'
+                                           for row, message in list(errors.items())[:10]))
+            self.jd = self.calendar_to_jd(ut_time)
+        elif ut_time.ndim == 2:
+            self.jd = self.calendar_to_jd(ut_time)
+        elif ut_time.ndim <= 1:
+            self.jd = np.atleast_1d(ut_time).astype(np.float64)
+        else:
+            raise ValueError(f"Unknown time array shape {ut_time.shape}")
+
+    def __repr__(self):
+        """Representative method.
+
+        Returns
+        -------
+        str
+            Return a class representative string.
+        """
+        return f'AstroTimeArray({np.datetime_as_string(self.get_datetime64())})'
+
+    def __len__(self):
+        """Length method.
+
+        Returns
+        -------
+        int
+            Number of instants.
+        """
+        return len(self.jd)
+
+    def __getitem__(self, index):
+        """Indexing method.
+
+        Parameters
+        ----------
+        index : int | slice | array_like
+            Index, slice or mask.
+
+        Returns
+        -------
+        AstroDateTime | AstroTimeArray
+            AstroDateTime (seconds truncated) for an integer index, AstroTimeArray otherwise.
+        """
+        jd = self.jd[index]
+        if np.ndim(jd) == 0:
+            instant = AstroTimeArray(np.atleast_1d(jd))
+            year, month, day = instant.get_gregorian()
+            hour, minute, second = instant.get_time()
+            return AstroDateTime((int(year[0]), int(month[0]), int(day[0]),
+                                  int(hour[0]), int(minute[0]), int(second[0])))
+        return AstroTimeArray(jd)
+
+    @staticmethod
+    def calendar_to_jd(calendar):
+        """Calendar rows to Julian days converting method with the USNO formula
+        of `AstroDateTime.get_jd`, keeping fractional seconds.
+
+        Parameters
+        ----------
+        calendar : array_like
+            Array of shape (N, 3) or (N, 6) with (year, month, day[, hour, minute, second]),
+            dates without time are taken at 12:00:00 as in AstroDateTime.
+
+        Returns
+        -------
+        numpy.ndarray
+            Julian days.
+        """
+        calendar = np.asarray(calendar, dtype=np.float64)
+        if calendar.shape[1] == 3:
+            calendar = np.concatenate((calendar, np.tile([12.0, 0.0, 0.0],
+                                                         (len(calendar), 1))), axis=1)
+        year, month, day, hour, minute, second = calendar.T
+        return (367 * year -
+                np.trunc((7 * (year + np.trunc((month + 9) / 12.0))) / 4.0) +
+                np.trunc((275 * month) / 9.0) +
+                day + 1721013.5 +
+                (hour + minute / 60.0 + second / 3600) / 24.0 -
+                0.5 * np.copysign(1, 100 * year + month - 190002.5) + 0.5)
+
+    def get_jd(self, delta: float = 0):
+        """Get julian days with possibility of delta days.
+
+        Parameters
+        ----------
+        delta : float, optional
+            Delta in days, by default 0.
+
+        Returns
+        -------
+        numpy.ndarray
+            Julian days.
+        """
+        return self.jd + delta
+
+    def _split_jd(self, delta: float = 0):
+        """Julian days splitting into civil day number and seconds of day.
+        Seconds are rounded to 0.1 ms (float64 Julian day resolution) and
+        carried to the next day.
+
+        Parameters
+        ----------
+        delta : float, optional
+            Delta in days, by default 0.
+
+        Returns
+        -------
+        tuple
+            Tuple containing civil day numbers (int64) and seconds of day.
+        """
+        shifted_jd = self.jd + delta + 0.5
+        day_number = np.floor(shifted_jd)
+        seconds = np.round((shifted_jd - day_number) * 86400, 4)
+        carry = seconds >= 86400
+        return (day_number.astype(np.int64) + carry,
+                np.where(carry, seconds - 86400, seconds))
+
+    def get_gregorian(self, delta: float = 0):
+        """Get gregorian dates with possibility of delta days from USNO formulas
+        (c.f. `AstroDateTime.get_gregorian`).
+
+        Parameters
+        ----------
+        delta : float, optional
+            Delta days, by default 0.
+
+        Returns
+        -------
+        tuple
+            Tuple of int arrays containing years, months and month days.
+        """
+        g_1 = self._split_jd(delta)[0] + 68569
+        g_2 = 4 * g_1 // 146097
+        g_1 = g_1 - (146097 * g_2 + 3) // 4
+        g_3 = 4000 * (g_1 + 1) // 1461001
+        g_1 = g_1 - 1461 * g_3 // 4 + 31
+        g_4 = 80 * g_1 // 2447
+        day = g_1 - 2447 * g_4 // 80
+        g_1 = g_4 // 11
+        month = g_4 + 2 - 12 * g_1
+        year = 100 * (g_2 - 49) + g_3 + g_1
+        return year, month, day
+
+    def get_time(self):
+        """Get time of day.
+
+        Returns
+        -------
+        tuple
+            Tuple of arrays containing hours (int), minutes (int) and seconds (float).
+        """
+        seconds = self._split_jd()[1]
+        hour, seconds = np.divmod(seconds, 3600)
+        minute, seconds = np.divmod(seconds, 60)
+        return hour.astype(np.int64), minute.astype(np.int64), seconds
+
+    def get_year_day(self):
+        """Get days of year (c.f. `AstroDateTime.get_year_day`).
+
+        Returns
+        -------
+        numpy.ndarray
+            Days of year.
+        """
+        year, month, day = self.get_gregorian()
+        n_1 = 275 * month // 9
+        n_2 = (month + 9) // 12
+        n_3 = 1 + (year - 4 * (year // 4) + 2) // 3
+        return n_1 - (n_2 * n_3) + day - 30
+
+    def get_gmst(self):
+        """Get Greenwich mean sidereal times with USNO formula (c.f. `AstroDateTime.get_gmst`).
+
+        Returns
+        -------
+        numpy.ndarray
+            Greenwich mean sidereal times in radians.
+        """
+        return ((18.697375 + 24.065709824279 * (self.jd - 2451545)) % 24)*np.pi/12
+
+    def get_lst(self, location: Location):
+        """Get local mean sidereal times with USNO formula (c.f. `AstroDateTime.get_lst`).
+
+        Parameters
+        ----------
+        location : Location
+            Observer location.
+
+        Returns
+        -------
+        numpy.ndarray
+            Local mean sidereal times in radians within [0, 2pi[.
+        """
+        return np.mod(self.get_gmst() + location.longitude.dmstorad(), 2*np.pi)
+
+    def get_datetime64(self):
+        """Get instants as numpy datetime64.
+
+        Returns
+        -------
+        numpy.ndarray
+            Instants as datetime64 with microsecond resolution.
+        """
+        return J2000_DATETIME64 + np.round((self.jd - 2451545.0) * 86400e6).astype(
+                                            'timedelta64[us]')
@@ -2,8 +2,35 @@
 """
 import math
 import datetime
+import functools
+import numpy as np
 from astro_toolbox.coordinates.location import Location
 from astro_toolbox.utils.strparser import angle_parser
+
+@functools.lru_cache(maxsize=128)
+def _lst_grid(julian_day: float, longitude: float, start: float, stop: float, step: float):
+    """Cached local mean sidereal time grid computation.
+
+    Parameters
+    ----------
+    julian_day : float
+        Julian day of the grid origin (0h UT).
+    longitude : float
+        Observer longitude in degrees.
+    start, stop, step : float
+        Grid bounds and step in hours from the origin (``numpy.arange`` convention).
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only local mean sidereal times in radians within [0, 2pi[.
+    """
+    hours = np.arange(start, stop, step)
+    gmst = (18.697375 + 24.065709824279 * (julian_day + hours/24 - 2451545)) % 24
+    lst = np.mod(gmst + longitude/15, 24)*math.pi/12
+    lst.flags.writeable = False
+    return lst
+
 class AstroDateTime():
     """This module contains AngleRad class
 
@@ -165,6 +192,18 @@ class AstroDateTime():
         n_3 = 1 + math.floor((self.get_year() - 4 * math.floor(self.get_year() / 4) + 2) / 3)
         return n_1 - (n_2 * n_3) + self.get_day() - 30
 
+    def get_epoch(self):
+        """Get Julian epoch.
+
+        .. math:: epoch=2000+\\frac{JD-2451545}{365.25}
+
+        Returns
+        -------
+        float
+            Julian epoch in years.
+        """
+        return 2000.0 + (self.get_jd() - 2451545.0)/365.25
+
     def get_gmst(self):
         """Get Greenwich mean sidereal time with USNO formula.
 
@@ -208,3 +247,34 @@ class AstroDateTime():
         lst_hh = int(lst)
         lst_mm = int(lst_mm)
         return (lst_hh,lst_mm,lst_ss)
+
+    def get_lst_grid(self, location: Location, start: float = 0.0,
+                     stop: float = 24.0, step: float = 0.1):
+        """Get local mean sidereal times over a time grid of the current date.
+
+        The grid is ``numpy.arange(start, stop, step)`` hours from 0h UT of the
+        date (hours beyond 24 belong to the next days). Grids are cached by
+        site longitude, date and bounds so that repeated calls for the same night
+        share the same read-only array.
+
+        .. math:: lst=mod(gmst+\\frac{\\lambda}{15}, 24)\\frac{\\pi}{12}
+
+        Parameters
+        ----------
+        location : Location
+            Observer location.
+        start : float, optional
+            First hour of the grid, by default 0.0.
+        stop : float, optional
+            Upper hour bound of the grid (excluded), by default 24.0.
+        step : float, optional
+            Grid step in hours, by default 0.1.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only local mean sidereal times in radians.
+        """
+        julian_day = AstroDateTime(self.date + (0, 0, 0)).get_jd()
+        return _lst_grid(julian_day, location.longitude.dmstodeg(),
+                         float(start), float(stop), float(step))
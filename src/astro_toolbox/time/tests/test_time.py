@@ -1,12 +1,16 @@
 """All calculations are performed for 2023-01-15 @ Greenwich
 """
+import math
 from pytest import approx
 
 from astro_toolbox.time.core import  AstroDateTime
 from astro_toolbox.coordinates.location import Location
+from astro_toolbox.time.arrays import AstroTimeArray
 
 location = Location(name='Greenwich')
 ut_time = AstroDateTime((2023, 1, 15, 0, 0, 0))
+ut_times = AstroTimeArray(['2023-01-15T00:00:00', '2023-01-15T23:59:59.5',
+                           '2024-12-31T06:00:10.25'])
 
 def test_get_jd():
     assert  ut_time.get_jd() == 2459959.500000
@@ -22,4 +26,35 @@ def test_get_lst():
     assert ut_time.get_lst(location) == (7, 36, approx(45.32, rel=1e-2))
 
 def test_get_year_day():
-    assert ut_time.get_year_day() == 15
\ No newline at end of file
+    assert ut_time.get_year_day() == 15
+
+def test_array_get_jd():
+    assert ut_times.get_jd()[0] == ut_time.get_jd()
+
+def test_array_get_gregorian():
+    years, months, days = ut_times.get_gregorian(1)
+    assert (list(years), list(months), list(days)) == ([2023, 2023, 2025], [1, 1, 1], [16, 16, 1])
+
+def test_array_get_time():
+    hours, minutes, seconds = ut_times.get_time()
+    assert (list(hours), list(minutes)) == ([0, 23, 6], [0, 59, 0])
+    assert list(seconds) == [0, approx(59.5, abs=1e-3), approx(10.25, abs=1e-3)]
+
+def test_array_get_year_day():
+    assert list(ut_times.get_year_day()) == [15, 15, 366]
+
+def test_array_negative_year():
+    negative_times = AstroTimeArray(['-0500-03-01T00:00:00', '2023-01-15T00:00:00'])
+    assert list(negative_times.jd) == [AstroDateTime((-500, 3, 1, 0, 0, 0)).get_jd(),
+                                       ut_time.get_jd()]
+    assert AstroTimeArray(['-0500-03-01']).jd[0] == AstroDateTime((-500, 3, 1)).get_jd()
+
+def test_get_lst_grid():
+    lst_grid = ut_time.get_lst_grid(location, 0, 24, 0.5)
+    assert len(lst_grid) == 48
+    assert lst_grid[0]*12/math.pi == approx(7 + 36/60 + 45.32/3600, rel=1e-6)
+    assert ut_time.get_lst_grid(location, 0, 24, 0.5) is lst_grid
+    assert not lst_grid.flags.writeable
+
+def test_array_get_lst():
+    assert ut_times.get_lst(location)[0]*12/math.pi == approx(7 + 36/60 + 45.32/3600, rel=1e-6)
@@ -0,0 +1,265 @@
+"""This module contains functions to format angles as str.
+"""
+import numpy as np
+
+from astro_toolbox.angle.arrays import AngleArray
+
+ZERO_PADDED = np.array([f'{value:02d}' for value in range(1000)])
+
+def _sexagesimal_fields(values, precision: int, modulo: float = None):
+    """Rounded sexagesimal fields computation.
+
+    Values are rounded once as an integer number of ``10**-precision`` seconds,
+    so that carries propagate to minutes and degrees or hours (59.999s is
+    formatted as the next minute).
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values in degrees or hours.
+    precision : int
+        Number of seconds decimals.
+    modulo : float, optional
+        Modulo applied to rounded values (24 for hours), by default None.
+
+    Returns
+    -------
+    tuple
+        Tuple of arrays (negative, first field, minutes, seconds, seconds decimals).
+    """
+    scale = 10**precision
+    negative = np.signbit(values)
+    total = np.rint(np.abs(np.nan_to_num(values)) * 3600 * scale).astype(np.int64)
+    if modulo is not None:
+        total = total % int(modulo * 3600 * scale)
+    first, total = np.divmod(total, 3600 * scale)
+    minutes, total = np.divmod(total, 60 * scale)
+    seconds, decimals = np.divmod(total, scale)
+    return negative, first, minutes, seconds, decimals
+
+def _join_fields(first, minutes, seconds, decimals, precision: int,
+                separators: tuple, width: int = 2):
+    """Sexagesimal str building from integer fields.
+
+    Parameters
+    ----------
+    first, minutes, seconds, decimals : numpy.ndarray
+        Integer fields.
+    precision : int
+        Number of seconds decimals.
+    separators : tuple
+        Separators placed after each field.
+    width : int, optional
+        First field width, by default 2.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of str.
+    """
+    text = np.char.add(_zero_padded(first, width), separators[0])
+    text = np.char.add(text, ZERO_PADDED[minutes])
+    text = np.char.add(text, separators[1])
+    text = np.char.add(text, ZERO_PADDED[seconds])
+    if precision > 0:
+        text = np.char.add(text, '.')
+        text = np.char.add(text, _zero_padded(decimals, precision))
+    return np.char.add(text, separators[2])
+
+def _zero_padded(values, width: int):
+    """Zero padded str of integers.
+
+    Two digits values are taken from a lookup table, others are converted.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Integer values.
+    width : int
+        Minimum width.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of str.
+    """
+    if width == 2 and (not values.size or values.max() < len(ZERO_PADDED)):
+        return ZERO_PADDED[values]
+    return np.char.zfill(values.astype(str), width)
+
+def _as_degrees(angles):
+    """Angles to degrees array.
+
+    Parameters
+    ----------
+    angles : AngleArray | array_like
+        Angles as AngleArray or values in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        Angles in degrees.
+    """
+    if isinstance(angles, AngleArray):
+        return angles.todeg()
+    return np.asarray(angles, dtype=np.float64)
+
+def _fill(text, nan_mask, out):
+    """Result filling method.
+
+    Parameters
+    ----------
+    text : numpy.ndarray
+        Formatted values.
+    nan_mask : numpy.ndarray
+        Mask of NaN input values.
+    out : numpy.ndarray | None
+        Preallocated str buffer.
+
+    Returns
+    -------
+    numpy.ndarray
+        Formatted values (out if given).
+
+    Raises
+    ------
+    ValueError
+        Buffer too short or too narrow for the formatted values.
+    """
+    if nan_mask.any():
+        text = text.astype(f'<U{max(text.dtype.itemsize // 4, 3)}')
+        text[nan_mask] = 'nan'
+    if out is None:
+        return text
+    if len(out) < len(text):
+        raise ValueError(f"Buffer of length {len(out)} too short for {len(text)} values")
+    if out.dtype.kind == 'U' and text.size and out.dtype.itemsize < text.dtype.itemsize:
+        width = int(np.char.str_len(text).max())
+        if out.dtype.itemsize // 4 < width:
+            raise ValueError(f"Buffer of dtype {out.dtype} too narrow for {width} characters")
+    out[:len(text)] = text
+    return out
+
+def dms_formatter(angles, precision: int = 2, out=None,
+                  separators: tuple = ('°', "'", '"')):
+    """Bulk DMS formatter.
+
+    The default output is the `AngleDMS` representation (``+45°59'48.30"``).
+
+    Parameters
+    ----------
+    angles : AngleArray | array_like
+        Angles as AngleArray or values in degrees.
+    precision : int, optional
+        Number of seconds decimals, by default 2.
+    out : numpy.ndarray, optional
+        Preallocated str array filled in place, by default None.
+    separators : tuple, optional
+        Separators after degrees, minutes and seconds, by default ('°', "'", '"').
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of DMS str.
+
+    Raises
+    ------
+    ValueError
+        out too short or too narrow.
+    """
+    degrees = _as_degrees(angles)
+    negative, first, minutes, seconds, decimals = _sexagesimal_fields(degrees, precision)
+    text = _join_fields(first, minutes, seconds, decimals, precision, separators)
+    text = np.char.add(np.where(negative, '-', '+'), text)
+    return _fill(text, np.isnan(degrees), out)
+
+def hms_formatter(angles, precision: int = 2, out=None,
+                  separators: tuple = ('h', 'm', 's')):
+    """Bulk HMS formatter.
+
+    The default output is the `AngleHMS` representation (``05h16m43.32s``),
+    hours are wrapped in [0, 24[ after rounding.
+
+    Parameters
+    ----------
+    angles : AngleArray | array_like
+        Angles as AngleArray or values in degrees.
+    precision : int, optional
+        Number of seconds decimals, by default 2.
+    out : numpy.ndarray, optional
+        Preallocated str array filled in place, by default None.
+    separators : tuple, optional
+        Separators after hours, minutes and seconds, by default ('h', 'm', 's').
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of HMS str.
+
+    Raises
+    ------
+    ValueError
+        out too short or too narrow.
+    """
+    degrees = _as_degrees(angles)
+    hours = np.mod(degrees/15, 24)
+    _, first, minutes, seconds, decimals = _sexagesimal_fields(hours, precision, modulo=24)
+    text = _join_fields(first, minutes, seconds, decimals, precision, separators)
+    return _fill(text, np.isnan(degrees), out)
+
+def write_sexagesimal_table(output, columns, formats, precision: int = 2,
+                            delimiter: str = '\t', chunk_size: int = 65536):
+    """Stream a table of angles to a file.
+
+    Rows are formatted and written by chunks so that large tables never
+    exist as str objects all at once.
+
+    Parameters
+    ----------
+    output : str | pathlib.Path | file object
+        Output path or opened text file.
+    columns : list
+        Columns as AngleArray or array_like (degrees for angles).
+    formats : list
+        Column formats in ``'hms'``, ``'dms'`` or ``'str'``.
+    precision : int, optional
+        Number of seconds decimals, by default 2.
+    delimiter : str, optional
+        Columns delimiter, by default '\\t'.
+    chunk_size : int, optional
+        Number of rows formatted at once, by default 65536.
+
+    Raises
+    ------
+    ValueError
+        No columns, not one format per column, unknown format or columns of
+        different lengths.
+    """
+    if not columns or len(formats) != len(columns):
+        raise ValueError(f"{len(formats)} formats given for {len(columns)} columns, "
+                         "one format per column expected")
+    columns = [column if isinstance(column, AngleArray) else np.asarray(column)
+               for column in columns]
+    n_rows = {len(column) for column in columns}
+    if len(n_rows) > 1:
+        raise ValueError("Columns must have the same length")
+    n_rows = n_rows.pop() if n_rows else 0
+    formatters = {'hms': hms_formatter, 'dms': dms_formatter}
+    for column_format in formats:
+        if column_format not in ('hms', 'dms', 'str'):
+            raise ValueError(f"Unknown format {column_format}")
+    file = open(output, 'w', encoding="utf-8") if not hasattr(output, 'write') else output
+    try:
+        for start in range(0, n_rows, chunk_size):
+            rows = None
+            for column, column_format in zip(columns, formats):
+                chunk = column[start:start + chunk_size]
+                if column_format == 'str':
+                    text = np.asarray(chunk).astype(str)
+                else:
+                    text = formatters[column_format](chunk, precision=precision)
+                rows = text if rows is None else np.char.add(np.char.add(rows, delimiter), text)
+            file.write('\n'.join(rows.tolist()) + '\n')
+    finally:
+        if file is not output:
+            file.close()
@@ -1,6 +1,13 @@
 """This module contains functionS to parse str.
 """
 import re
+import itertools
+import numpy as np
+
+ANGLE_SEPARATORS = str.maketrans({separator: ' ' for separator in ":°'\"hms"})
+DATETIME_SEPARATORS = str.maketrans({separator: ' ' for separator in ":/T"})
+DATE_SEPARATOR = re.compile(r"(?<=\d)-(?=\d)")
+
 def angle_parser(str_angle):
     """string angle parser.
 
@@ -21,3 +28,127 @@ def angle_parser(str_angle):
     if len(angle) == 3:
         angle[-1] = float(angle_list[-1])
     return tuple(angle)
+
+def read_column(input_file, column: int = 0, delimiter: str = None, skip_header: int = 0):
+    """Read one column of a text file.
+
+    Parameters
+    ----------
+    input_file : str | pathlib.Path
+        Input file path.
+    column : int, optional
+        Column index, by default 0.
+    delimiter : str, optional
+        Columns delimiter, by default None (any whitespace).
+    skip_header : int, optional
+        Number of header lines to skip, by default 0.
+
+    Returns
+    -------
+    list
+        Column values as str (empty str when the column is missing).
+    """
+    with open(input_file, 'r', encoding="utf-8") as file:
+        lines = file.read().splitlines()[skip_header:]
+    column_values = []
+    for line in lines:
+        fields = line.split(delimiter)
+        column_values.append(fields[column].strip() if len(fields) > column else '')
+    return column_values
+
+def _batch_parser(str_values, separators: dict, allowed_fields: tuple, pattern=None):
+    """Bulk sexagesimal parser shared by angles and datetimes.
+
+    The number of fields is checked once from the first non-empty row, then
+    every row is tokenized in a single pass and converted in one numpy call.
+    Rows which don't match are reported and filled with NaN.
+
+    Parameters
+    ----------
+    str_values : iterable
+        Strings to parse, one value per string.
+    separators : dict
+        Translation table mapping separators to spaces.
+    allowed_fields : tuple
+        Allowed numbers of fields.
+    pattern : re.Pattern, optional
+        Extra separators replaced by spaces before translation, by default None.
+
+    Returns
+    -------
+    tuple
+        Tuple containing float64 array of shape (rows, fields) and errors
+        dictionary (row index: message).
+    """
+    rows = list(map(str.strip, map(str, str_values)))
+    if not rows:
+        return np.empty((0, allowed_fields[0])), {}
+    text = '\n'.join(rows)
+    if pattern is not None:
+        text = pattern.sub(' ', text)
+    text = text.translate(separators)
+    if '  ' in text or '\t' in text:
+        text = re.sub(r"[ \t]{2,}|\t", " ", text)
+    lines = list(map(str.strip, text.split('\n')))
+    lengths = (np.fromiter(map(str.count, lines, itertools.repeat(' ')),
+                           dtype=np.int64, count=len(lines)) +
+               np.fromiter(map(bool, lines), dtype=np.int64, count=len(lines)))
+    first_row = int(np.argmax(lengths > 0))
+    n_fields = int(lengths[first_row]) if lengths[first_row] else allowed_fields[0]
+    if n_fields not in allowed_fields:
+        raise ValueError(f"Unknown format, {n_fields} fields found in {rows[first_row]!r}")
+    values = np.full((len(lines), n_fields), np.nan)
+    valid = lengths == n_fields
+    errors = {int(idx): f"{lengths[idx]} fields found, {n_fields} expected"
+              for idx in np.flatnonzero(~valid)}
+    try:
+        values[valid] = np.array(' '.join(itertools.compress(lines, valid)).split(),
+                                 dtype=np.float64).reshape(-1, n_fields)
+    except ValueError:
+        for idx in np.flatnonzero(valid):
+            try:
+                values[idx] = np.array(lines[idx].split(), dtype=np.float64)
+            except ValueError:
+                errors[int(idx)] = f"non numeric value in {rows[idx]!r}"
+    return values, dict(sorted(errors.items()))
+
+def batch_angle_parser(str_angles):
+    """Bulk string angle parser.
+
+    Parameters
+    ----------
+    str_angles : iterable
+        Angles as str in format (`dd:dd:dd.dd` `dd°dd'dd.dd"` `ddhddmdd.dds` or `dd.dd`),
+        all rows must share the same format.
+
+    Returns
+    -------
+    tuple
+        Tuple containing float64 array of shape (rows, 3) for sexagesimal values
+        or (rows, 1) for decimal values and errors dictionary (row index: message).
+        Sign is carried by the first field (``-00`` is parsed as ``-0.0``).
+    """
+    return _batch_parser(str_angles, ANGLE_SEPARATORS, (3, 1))
+
+def batch_datetime_parser(str_datetimes):
+    """Bulk string datetime parser.
+
+    Parameters
+    ----------
+    str_datetimes : iterable
+        Dates and times as str in format (``yyyy-mm-ddThh:mm:ss.ss`` or ``yyyy-mm-dd``),
+        all rows must share the same format.
+
+    Returns
+    -------
+    tuple
+        Tuple containing float64 array of shape (rows, 6) with
+        (year, month, day, hour, minute, second) and errors dictionary
+        (row index: message). Dates without time are set at 12:00:00 as in AstroDateTime.
+        ``-`` only separates digits so negative years keep their sign (``-0500-03-01``).
+    """
+    values, errors = _batch_parser(str_datetimes, DATETIME_SEPARATORS, (6, 3), DATE_SEPARATOR)
+    if values.shape[1] == 3:
+        values = np.concatenate((values, np.tile([12.0, 0.0, 0.0], (len(values), 1))), axis=1)
+        values[list(errors)] = np.nan
+    return values, errors
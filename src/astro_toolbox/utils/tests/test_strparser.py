@@ -0,0 +1,47 @@
+import math
+import numpy as np
+
+from astro_toolbox.utils.strparser import read_column
+from astro_toolbox.utils.strparser import batch_angle_parser, batch_datetime_parser
+from astro_toolbox.time.arrays import AstroTimeArray
+
+def test_batch_parser_empty():
+    values, errors = batch_angle_parser([])
+    assert values.shape == (0, 3) and errors == {}
+    values, errors = batch_datetime_parser([])
+    assert values.shape == (0, 6) and errors == {}
+    assert len(AstroTimeArray(np.array([], dtype=str)).jd) == 0
+
+def test_batch_angle_parser():
+    values, errors = batch_angle_parser(['12:30:00', '13h30m15.5s', "-00°30'00\""])
+    assert values.tolist() == [[12, 30, 0], [13, 30, 15.5], [0, 30, 0]]
+    assert math.copysign(1, values[2, 0]) == -1
+    assert errors == {}
+    values, errors = batch_angle_parser(['45.5', '-12.25'])
+    assert values.tolist() == [[45.5], [-12.25]] and errors == {}
+
+def test_batch_angle_parser_errors():
+    values, errors = batch_angle_parser(['12:30:00', '12h30m', 'ab:00:00', '01:02:03'])
+    assert errors == {1: '2 fields found, 3 expected', 2: "non numeric value in 'ab:00:00'"}
+    assert np.isnan(values[[1, 2]]).all()
+    assert values[[0, 3]].tolist() == [[12, 30, 0], [1, 2, 3]]
+
+def test_batch_datetime_parser():
+    values, errors = batch_datetime_parser(['2023-01-15T23:59:59.5', '2023/01/16 06:00:10.25',
+                                            '-0500-03-01T00:00:00'])
+    assert values.tolist() == [[2023, 1, 15, 23, 59, 59.5], [2023, 1, 16, 6, 0, 10.25],
+                               [-500, 3, 1, 0, 0, 0]]
+    assert errors == {}
+    values, errors = batch_datetime_parser(['2023-01-15', '2023-01', '-0500-03-01'])
+    assert errors == {1: '2 fields found, 3 expected'}
+    assert values[[0, 2]].tolist() == [[2023, 1, 15, 12, 0, 0], [-500, 3, 1, 12, 0, 0]]
+    assert np.isnan(values[1]).all()
+
+def test_read_column(tmp_path):
+    path = tmp_path / 'program.txt'
+    path.write_text('name;ra;dec\nCapella;05:16:41.36;+45:59:52.8\nVega;18:36:56.34\n',
+                    encoding='utf-8')
+    assert read_column(path, 1, ';', skip_header=1) == ['05:16:41.36', '18:36:56.34']
+    assert read_column(path, 2, ';', skip_header=1) == ['+45:59:52.8', '']
+    values, errors = batch_angle_parser(read_column(path, 1, ';', skip_header=1))
+    assert values.tolist() == [[5, 16, 41.36], [18, 36, 56.34]] and errors == {}